@@ -0,0 +1,115 @@
+"""Benchmark sync vs async publish requests served from one asyncio process.
+
+Each request looks up a project, an asset and its task, then creates the next
+publish of the task, like the publish service does. Requests are served
+concurrently from one event loop:
+
+- `sync`: handlers call `Db` directly, blocking the event loop.
+- `sync-threads`: handlers run `Db` calls with `asyncio.to_thread`.
+- `async`: handlers await `tk_db.aio.db.AsyncDb` calls.
+
+Reports requests per second and the worst event loop lag measured by a ticker
+coroutine while requests are served.
+
+    PYTHONPATH=. python scripts/bench_async_publish.py [--requests 2000] [--concurrency 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from tk_db.aio.db import AsyncDb
+from tk_db.db import Db
+
+
+ASSETS = 50
+
+
+def setup(url):
+    db = Db(url)
+    project = db.create_project("BENCH", "Benchmark")
+    project.metadata = {"env": {"TK_PROJECT_PATH": "/bench/BENCH"}}
+    asset_type = db.get_or_create_asset_type("chr", "character")
+    db.get_or_create_task_type("modeling", "modeling")
+    db.get_or_create_publish_type("geo", "geo", ".abc")
+    for index in range(ASSETS):
+        asset = project.get_or_create_asset(f"hero_{index:02d}", asset_type)
+        asset.get_or_create_task(code="modeling")
+
+
+def sync_request(db, index):
+    project = db.project("BENCH")
+    asset = project.asset(db.asset_type("chr"), f"hero_{index % ASSETS:02d}")
+    task = asset.task(code="modeling")
+    return task.create_next_publish("mainGeo", db.publish_type("geo"), "work")
+
+
+async def async_request(db, index):
+    project = await db.project("BENCH")
+    asset = await project.asset(
+        await db.asset_type("chr"), f"hero_{index % ASSETS:02d}"
+    )
+    task = await asset.task(code="modeling")
+    return await task.create_next_publish(
+        "mainGeo", await db.publish_type("geo"), "work"
+    )
+
+
+async def ticker(lags, stop):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append(time.perf_counter() - start - 0.001)
+
+
+async def serve(mode, url, requests, concurrency):
+    db = AsyncDb(url) if mode == "async" else Db(url)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def handle(index):
+        async with semaphore:
+            if mode == "async":
+                await async_request(db, index)
+            elif mode == "sync-threads":
+                await asyncio.to_thread(sync_request, db, index)
+            else:
+                sync_request(db, index)
+
+    lags = []
+    stop = asyncio.Event()
+    ticker_task = asyncio.create_task(ticker(lags, stop))
+    await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(handle(index) for index in range(requests)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await ticker_task
+    if mode == "async":
+        await db.engine.dispose()
+
+    print(
+        f"{mode:<14} {requests / elapsed:10.1f} requests/s "
+        f"{max(lags, default=0) * 1000:10.1f} ms max loop lag"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    args = parser.parse_args()
+
+    for mode in ("sync", "sync-threads", "async"):
+        url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+        setup(url)
+        asyncio.run(serve(mode, url, args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Benchmark concurrent publishes of the same publish series.
+
+Several processes publish the same task code/type/release at the same time,
+either with `DbTask.create_next_publish` counter allocation or with the former
+client side `max(version) + 1` allocation retried until it succeeds. Reports
+publishes per second and insert conflict rate, then checks every version was
+allocated once.
+
+    PYTHONPATH=. python scripts/bench_concurrent_publish.py [--workers 8] [--publishes 100]
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+
+from sqlalchemy import event
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+
+from tk_db.db import Db
+from tk_db.models import Publish
+
+
+def make_db(db_path):
+    return Db(f"sqlite:///{db_path}")
+
+
+def setup(db_path, task_code):
+    db = make_db(db_path)
+    try:
+        project = db.project("BENCH")
+    except Exception:  # noqa: BLE001
+        project = db.create_project("BENCH", "Benchmark")
+        project.metadata = {"env": {"TK_PROJECT_PATH": "/bench/BENCH"}}
+        db.get_or_create_asset_type("chr", "character")
+        db.get_or_create_publish_type("geo", "geo", ".abc")
+        project.get_or_create_asset("hero_main", db.asset_type("chr"))
+    db.get_or_create_task_type(task_code, task_code)
+    asset = project.asset(db.asset_type("chr"), "hero_main")
+    asset.get_or_create_task(code=task_code)
+
+
+def naive_publish(db, task, publish_type):
+    path_resolver = task.asset.project.path_resolver()
+    while True:
+        version = task.last_version("mainGeo", publish_type, "work") + 1
+        path = path_resolver.publish_path(
+            task.asset.asset_type.code,
+            task.asset.code,
+            task.name,
+            "mainGeo",
+            publish_type.file_type,
+            publish_type.extension,
+            "work",
+            version,
+        )
+        try:
+            with db.Session() as session:
+                session.add(
+                    Publish(
+                        code="mainGeo",
+                        path=path,
+                        version=version,
+                        release="work",
+                        size=0,
+                        active=False,
+                        publish_type_id=publish_type.id,
+                        task_id=task.id,
+                    )
+                )
+                session.commit()
+        except IntegrityError:
+            continue
+        return
+
+
+def worker(db_path, mode, task_code, publish_count, barrier):
+    db = make_db(db_path)
+    inserts = []
+
+    def on_execute(_conn, _cursor, statement, *_args):
+        if statement.startswith("INSERT INTO publish "):
+            inserts.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", on_execute)
+
+    project = db.project("BENCH")
+    asset = project.asset(db.asset_type("chr"), "hero_main")
+    task = asset.task(code=task_code)
+    publish_type = db.publish_type("geo")
+
+    barrier.wait()
+    for _ in range(publish_count):
+        if mode == "counter":
+            task.create_next_publish("mainGeo", publish_type, "work", retries=100)
+        else:
+            naive_publish(db, task, publish_type)
+
+    # Every insert attempt beyond one per publish is a conflict.
+    return len(inserts) - publish_count
+
+
+def run(db_path, mode, workers, publish_count):
+    task_code = f"task{mode}"
+    setup(db_path, task_code)
+    barrier = multiprocessing.Manager().Barrier(workers)
+
+    start = time.perf_counter()
+    with multiprocessing.Pool(workers) as pool:
+        conflicts = sum(
+            pool.starmap(
+                worker,
+                [(db_path, mode, task_code, publish_count, barrier)] * workers,
+            )
+        )
+    elapsed = time.perf_counter() - start
+
+    db = make_db(db_path)
+    task = db.project("BENCH").asset(db.asset_type("chr"), "hero_main").task(
+        code=task_code
+    )
+    with db.Session() as session:
+        versions = session.scalars(
+            select(Publish.version).where(Publish.task_id == task.id)
+        ).all()
+
+    total = workers * publish_count
+    assert sorted(versions) == list(range(1, total + 1)), "Versions are not contiguous."
+    print(
+        f"{mode:<8} {total / elapsed:10.1f} publishes/s "
+        f"{conflicts / (total + conflicts):8.1%} conflict rate "
+        f"({conflicts} conflicts for {total} publishes)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--publishes", type=int, default=100)
+    args = parser.parse_args()
+
+    db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    for mode in ("naive", "counter"):
+        run(db_path, mode, args.workers, args.publishes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""Benchmark asset, task and publish lookups on a 1M publishes database.
+
+Lookups are timed with the composite indexes of `tk_db.models`, then again
+after dropping them to show the table scan cost.
+
+    PYTHONPATH=. python scripts/bench_lookups.py [--publishes 1000000] [--lookups 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from sqlalchemy import insert
+
+from tk_db.db import Db
+from tk_db.models import Asset
+from tk_db.models import Publish
+from tk_db.models import Task
+
+
+ASSETS = 100
+TASK_TYPES = 10
+PUBLISH_CODES = 10
+RELEASES = ("release", "work")
+
+
+def populate(db: Db, publish_count: int):
+    project = db.create_project("BENCH", "Benchmark")
+    project.metadata = {"env": {"TK_PROJECT_PATH": "/bench/BENCH"}}
+    asset_type = db.get_or_create_asset_type("chr", "character")
+    task_types = [
+        db.get_or_create_task_type(f"task{chr(97 + i)}", f"task{chr(97 + i)}")
+        for i in range(TASK_TYPES)
+    ]
+    publish_type = db.get_or_create_publish_type("geo", "geo", ".abc")
+
+    with db.engine.begin() as connection:
+        connection.execute(
+            insert(Asset),
+            [
+                {
+                    "code": f"hero_{i:03d}",
+                    "asset_type_id": asset_type.id,
+                    "project_id": project.id,
+                    "active": True,
+                }
+                for i in range(ASSETS)
+            ],
+        )
+        asset_ids = [row.id for row in connection.execute(Asset.__table__.select())]
+        connection.execute(
+            insert(Task),
+            [
+                {"asset_id": asset_id, "task_type_id": task_type.id, "active": True}
+                for asset_id in asset_ids
+                for task_type in task_types
+            ],
+        )
+        task_ids = [row.id for row in connection.execute(Task.__table__.select())]
+
+        per_series = publish_count // (len(task_ids) * PUBLISH_CODES * len(RELEASES))
+        rows = []
+        for task_id in task_ids:
+            for code_index in range(PUBLISH_CODES):
+                for release in RELEASES:
+                    for version in range(1, per_series + 1):
+                        rows.append(
+                            {
+                                "code": f"code{code_index}",
+                                "path": f"/{task_id}/{code_index}/{release}/{version}",
+                                "version": version,
+                                "release": release,
+                                "size": 0,
+                                "active": True,
+                                "publish_type_id": publish_type.id,
+                                "task_id": task_id,
+                            }
+                        )
+            if len(rows) > 100_000:
+                connection.execute(insert(Publish), rows)
+                rows = []
+        if rows:
+            connection.execute(insert(Publish), rows)
+
+    return project, asset_type, task_types, publish_type, per_series
+
+
+def bench(label, func, lookups):
+    start = time.perf_counter()
+    for _ in range(lookups):
+        func()
+    elapsed = (time.perf_counter() - start) / lookups
+    print(f"{label:<24} {elapsed * 1000:10.3f} ms/lookup")
+
+
+def run(db, project, asset_type, task_types, publish_type, per_series, lookups):
+    assets = project.assets()
+    tasks = [task for asset in assets[:10] for task in asset.tasks()]
+
+    bench(
+        "DbProject.asset()",
+        lambda: project.asset(asset_type, random.choice(assets).code),
+        lookups,
+    )
+    bench(
+        "DbAsset.task()",
+        lambda: random.choice(assets).task(random.choice(task_types)),
+        lookups,
+    )
+    bench(
+        "DbTask.publish()",
+        lambda: random.choice(tasks).publish(
+            f"code{random.randrange(PUBLISH_CODES)}",
+            publish_type,
+            random.choice(RELEASES),
+            random.randint(1, per_series),
+        ),
+        lookups,
+    )
+    bench(
+        "DbTask.last_version()",
+        lambda: random.choice(tasks).last_version(
+            f"code{random.randrange(PUBLISH_CODES)}",
+            publish_type,
+            random.choice(RELEASES),
+        ),
+        lookups,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--publishes", type=int, default=1_000_000)
+    parser.add_argument("--lookups", type=int, default=200)
+    args = parser.parse_args()
+
+    db = Db(f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}")
+    start = time.perf_counter()
+    data = populate(db, args.publishes)
+    print(f"Populated {args.publishes} publishes in {time.perf_counter() - start:.1f}s")
+
+    print("With composite indexes:")
+    run(db, *data, args.lookups)
+
+    with db.engine.begin() as connection:
+        for index_name in (
+            "ux_asset_project_type_code",
+            "ux_task_asset_type",
+            "ux_publish_task_code_type_release_version",
+        ):
+            connection.exec_driver_sql(f"DROP INDEX {index_name}")
+
+    print("Without composite indexes:")
+    run(db, *data, max(args.lookups // 20, 5))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Benchmark memory held by loaded publish lists.
+
+Fills a temporary SQLite database with one task holding many publishes, then
+loads them with `DbTask.publishes` and `DbProject.latest_publishes` and
+reports bytes per publish still allocated while the list is held, measured
+with `tracemalloc`. Streaming with `DbTask.iter_publishes` and
+`DbProject.iter_publishes` reports peak memory while iterating instead.
+
+    PYTHONPATH=. python scripts/bench_publish_memory.py [--publishes 1000000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+
+from sqlalchemy import insert
+
+from tk_db.db import Db
+from tk_db.models import Publish
+
+
+BATCH_SIZE = 50_000
+
+
+def setup(url, count):
+    db = Db(url)
+    project = db.create_project("BENCH", "Benchmark")
+    project.metadata = {"env": {"TK_PROJECT_PATH": "/bench/BENCH"}}
+    asset_type = db.get_or_create_asset_type("chr", "character")
+    task_type = db.get_or_create_task_type("modeling", "modeling")
+    publish_type = db.get_or_create_publish_type("geo", "geo", ".abc")
+    asset = project.get_or_create_asset("hero", asset_type)
+    task = asset.get_or_create_task(task_type)
+
+    with db.session() as session:
+        for start in range(0, count, BATCH_SIZE):
+            session.execute(
+                insert(Publish),
+                [
+                    {
+                        "code": f"publish{index}",
+                        "path": f"/bench/BENCH/publish{index}.abc",
+                        "version": 1,
+                        "release": "work",
+                        "size": 1024.0,
+                        "active": True,
+                        "publish_type_id": publish_type.id,
+                        "task_id": task.id,
+                    }
+                    for index in range(start, min(start + BATCH_SIZE, count))
+                ],
+            )
+
+    return project, task
+
+
+def measure(name, load):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    publishes = load()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(
+        f"{name:<26} {len(publishes):>9} publishes {elapsed:8.2f} s "
+        f"{size / len(publishes):10.1f} bytes/publish"
+    )
+
+
+def measure_stream(name, iterate):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = sum(1 for _publish in iterate())
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(
+        f"{name:<26} {count:>9} publishes {elapsed:8.2f} s "
+        f"{peak / 1024**2:10.1f} MiB peak"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--publishes", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+    project, task = setup(url, args.publishes)
+
+    measure("DbTask.publishes", task.publishes)
+    measure("DbProject.latest_publishes", project.latest_publishes)
+    measure_stream("DbTask.iter_publishes", task.iter_publishes)
+    measure_stream("DbProject.iter_publishes", project.iter_publishes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark publish path generation.
+
+Compares `PathResolver.publish_paths` precompiled templates with the former
+per publish `os.path.join` implementation of `DbTask._publish_path`.
+
+    PYTHONPATH=. python scripts/bench_publish_paths.py [--paths 1000000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+from tk_db.pathresolver import PathResolver
+from tk_db.pathresolver import PublishPathFields
+
+
+ROOT_PATH = "/projects/BENCH"
+
+
+def join_publish_path(
+    root_path, asset_type, asset, task, code, file_type, extension, release, version
+):
+    publish_name = (
+        f"{asset_type}_{asset}_{code}_{file_type}_{release[0]}{version:03d}{extension}"
+    )
+    if release == "release":
+        return os.path.join(
+            root_path,
+            "assets",
+            asset_type,
+            asset,
+            task,
+            code,
+            release,
+            f"{release[0]}{version:03d}",
+            publish_name,
+        )
+    return os.path.join(
+        root_path, "assets", asset_type, asset, task, code, release, publish_name
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--paths", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    fields = [
+        PublishPathFields(
+            "chr",
+            f"hero_{index % 1000:03d}",
+            "modeling",
+            f"geo{index % 7}",
+            "geo",
+            ".abc",
+            "release" if index % 2 else "work",
+            index % 500 + 1,
+        )
+        for index in range(args.paths)
+    ]
+
+    start = time.perf_counter()
+    joined = [join_publish_path(ROOT_PATH, *publish_fields) for publish_fields in fields]
+    join_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    resolver = PathResolver(ROOT_PATH)
+    resolved = resolver.publish_paths(fields)
+    resolver_elapsed = time.perf_counter() - start
+
+    assert joined == resolved, "Resolver paths differ from os.path.join paths."
+    print(f"os.path.join  {join_elapsed:6.2f}s  {args.paths / join_elapsed:12,.0f} paths/s")
+    print(
+        f"PathResolver  {resolver_elapsed:6.2f}s  "
+        f"{args.paths / resolver_elapsed:12,.0f} paths/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
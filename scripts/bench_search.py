@@ -0,0 +1,94 @@
+"""Benchmark `Db.search` on a large database.
+
+Fills a temporary SQLite database with assets and publishes of generated
+codes, search indexes being maintained by triggers while inserting, then
+reports the median time of `Db.search` for texts of growing selectivity.
+
+    PYTHONPATH=. python scripts/bench_search.py [--publishes 1000000] [--runs 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import insert
+
+from tk_db.db import Db
+from tk_db.models import Publish
+
+
+BATCH_SIZE = 50_000
+ASSETS = 1000
+WORDS = ("main", "geo", "rig", "anim", "cache", "shader", "look", "body", "hair")
+TEXTS = ("ma", "geo", "hair", "mainGeo", "hero_0042", "shaderHair12", "missing")
+
+
+def setup(url, count):
+    db = Db(url)
+    project = db.create_project("BENCH", "Benchmark")
+    project.metadata = {"env": {"TK_PROJECT_PATH": "/bench/BENCH"}}
+    asset_type = db.get_or_create_asset_type("chr", "character")
+    task_type = db.get_or_create_task_type("modeling", "modeling")
+    publish_type = db.get_or_create_publish_type("geo", "geo", ".abc")
+    tasks = [
+        project.get_or_create_asset(f"hero_{index:04d}", asset_type).get_or_create_task(
+            task_type
+        )
+        for index in range(ASSETS)
+    ]
+
+    generator = random.Random(0)
+    with db.session() as session:
+        for start in range(0, count, BATCH_SIZE):
+            session.execute(
+                insert(Publish),
+                [
+                    {
+                        "code": f"{generator.choice(WORDS)}"
+                        f"{generator.choice(WORDS).title()}{index % 100}",
+                        "path": f"/bench/BENCH/publish{index}.abc",
+                        "version": index + 1,
+                        "release": "work",
+                        "size": 1024.0,
+                        "active": True,
+                        "publish_type_id": publish_type.id,
+                        "task_id": tasks[index % ASSETS].id,
+                    }
+                    for index in range(start, min(start + BATCH_SIZE, count))
+                ],
+            )
+
+    return db
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--publishes", type=int, default=1_000_000)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+    start = time.perf_counter()
+    db = setup(url, args.publishes)
+    print(f"setup {time.perf_counter() - start:.1f} s")
+
+    for text in TEXTS:
+        timings = []
+        for _run in range(args.runs):
+            start = time.perf_counter()
+            results = db.search(text)
+            timings.append(time.perf_counter() - start)
+        best = results[0].code if results else "-"
+        print(
+            f"{text!r:<16} {statistics.median(timings) * 1000:8.2f} ms "
+            f"{len(results):4} results, best {best!r}"
+        )
+
+
+if __name__ == "__main__":
+    main()
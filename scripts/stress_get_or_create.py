@@ -0,0 +1,106 @@
+"""Stress get-or-create upserts from several processes on one database file.
+
+Every worker creates the same assets and tasks at the same time. Each asset
+must be created by exactly one worker, others get `DbAssetAlreadyExistError`,
+and no other error may be raised.
+
+    PYTHONPATH=. python scripts/stress_get_or_create.py [--workers 8] [--assets 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import multiprocessing
+import os
+import tempfile
+import time
+
+from sqlalchemy import func
+from sqlalchemy import select
+
+from tk_db.db import Db
+from tk_db.errors import DbAssetAlreadyExistError
+from tk_db.models import Asset
+from tk_db.models import Task
+
+
+TASK_TYPES = ("modeling", "rigging", "surfacing")
+
+
+def make_db(db_path):
+    return Db(f"sqlite:///{db_path}")
+
+
+def worker(db_path, asset_count, barrier):
+    db = make_db(db_path)
+    project = db.project("STRESS")
+    asset_type = db.asset_type("chr")
+    task_types = [db.task_type(code) for code in TASK_TYPES]
+    counts = collections.Counter()
+
+    barrier.wait()
+    for index in range(asset_count):
+        code = f"hero_{index:04d}"
+        try:
+            asset = project.get_or_create_asset(code, asset_type)
+            counts["created"] += 1
+        except DbAssetAlreadyExistError:
+            asset = project.asset(asset_type, code)
+            counts["exists"] += 1
+        except Exception as error:  # noqa: BLE001
+            counts[f"error: {type(error).__name__}"] += 1
+            continue
+
+        for task_type in task_types:
+            try:
+                asset.get_or_create_task(task_type)
+                counts["tasks"] += 1
+            except Exception as error:  # noqa: BLE001
+                counts[f"task error: {type(error).__name__}"] += 1
+
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--assets", type=int, default=200)
+    args = parser.parse_args()
+
+    db_path = os.path.join(tempfile.mkdtemp(), "stress.db")
+    db = make_db(db_path)
+    db.create_project("STRESS", "Stress")
+    db.get_or_create_asset_type("chr", "character")
+    for code in TASK_TYPES:
+        db.get_or_create_task_type(code, code)
+
+    manager = multiprocessing.Manager()
+    barrier = manager.Barrier(args.workers)
+    start = time.perf_counter()
+    with multiprocessing.Pool(args.workers) as pool:
+        results = pool.starmap(
+            worker, [(db_path, args.assets, barrier)] * args.workers
+        )
+    elapsed = time.perf_counter() - start
+
+    total = sum(results, collections.Counter())
+    with db.Session() as session:
+        asset_rows = session.scalar(select(func.count()).select_from(Asset))
+        task_rows = session.scalar(select(func.count()).select_from(Task))
+
+    print(f"{args.workers} workers x {args.assets} assets in {elapsed:.2f}s")
+    for key, value in sorted(total.items()):
+        print(f"  {key:<24} {value}")
+    print(f"  asset rows               {asset_rows}")
+    print(f"  task rows                {task_rows}")
+
+    assert total["created"] == args.assets, "Asset created more than once."
+    assert asset_rows == args.assets, "Duplicated asset rows."
+    assert task_rows == args.assets * len(TASK_TYPES), "Duplicated task rows."
+    assert not [key for key in total if "error" in key], "Unexpected errors."
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Shared fixtures, each test gets its own SQLite database file."""
+
+import os
+import sqlite3
+import time
+
+import pytest
+
+from tk_db.db import Db
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Qt application of UI tests, rendered offscreen."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from Qt import QtWidgets
+
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def wait_until(qapp, predicate, timeout=5.0):
+    """Process Qt events until predicate is true, fail after timeout seconds."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "Timed out waiting for Qt events."
+        qapp.processEvents()
+        time.sleep(0.001)
+
+
+@pytest.fixture
+def db(tmp_path):
+    return Db(f"sqlite:///{tmp_path / 'tk_db.db'}")
+
+
+@pytest.fixture
+def root_path(tmp_path):
+    return str(tmp_path / "PRJ")
+
+
+@pytest.fixture
+def project(db, root_path):
+    project = db.create_project("PRJ", "Project")
+    project.metadata = {"env": {"TK_PROJECT_PATH": root_path}}
+    return project
+
+
+@pytest.fixture
+def asset_type(db):
+    return db.get_or_create_asset_type("chr", "character")
+
+
+@pytest.fixture
+def task_type(db):
+    # Name differs from code, publish directories use the name.
+    return db.get_or_create_task_type("mod", "Modeling")
+
+
+@pytest.fixture
+def publish_type(db):
+    return db.get_or_create_publish_type("geo", "geo", ".abc")
+
+
+@pytest.fixture
+def asset(project, asset_type):
+    return project.get_or_create_asset("hero_main", asset_type)
+
+
+@pytest.fixture
+def task(asset, task_type):
+    return asset.get_or_create_task(task_type)
+
+
+# Schema and rows as written by the first tk_db release: no composite index,
+# metadata stored as a python dict repr, publish directories named after task
+# type names.
+LEGACY_SCHEMA = """
+CREATE TABLE project (
+    id INTEGER PRIMARY KEY, code VARCHAR NOT NULL UNIQUE, name VARCHAR NOT NULL,
+    metadata_ VARCHAR, active BOOLEAN
+);
+CREATE TABLE asset_type (
+    id INTEGER PRIMARY KEY, code VARCHAR NOT NULL UNIQUE,
+    name VARCHAR NOT NULL UNIQUE, active BOOLEAN
+);
+CREATE TABLE asset (
+    id INTEGER PRIMARY KEY, code VARCHAR NOT NULL, active BOOLEAN,
+    asset_type_id INTEGER REFERENCES asset_type (id),
+    project_id INTEGER REFERENCES project (id)
+);
+CREATE TABLE task_type (
+    id INTEGER PRIMARY KEY, code VARCHAR NOT NULL UNIQUE,
+    name VARCHAR NOT NULL UNIQUE, active BOOLEAN
+);
+CREATE TABLE task (
+    id INTEGER PRIMARY KEY, asset_id INTEGER REFERENCES asset (id),
+    task_type_id INTEGER REFERENCES task_type (id), active BOOLEAN
+);
+CREATE TABLE publish_type (
+    id INTEGER PRIMARY KEY, code VARCHAR NOT NULL UNIQUE, file_type VARCHAR NOT NULL,
+    extension VARCHAR NOT NULL, active BOOLEAN
+);
+CREATE TABLE publish (
+    id INTEGER PRIMARY KEY, code VARCHAR NOT NULL, path VARCHAR NOT NULL UNIQUE,
+    version INTEGER NOT NULL, release VARCHAR NOT NULL, size INTEGER, active BOOLEAN,
+    publish_type_id INTEGER REFERENCES publish_type (id),
+    task_id INTEGER REFERENCES task (id)
+);
+"""
+
+
+def legacy_publish_path(root_path, version):
+    """Return path of a legacy `mainGeo` release publish of `hero_main` modeling."""
+    return os.path.join(
+        root_path,
+        "assets",
+        "chr",
+        "hero_main",
+        "Modeling",
+        "mainGeo",
+        "release",
+        f"r{version:03d}",
+        f"chr_hero_main_mainGeo_geo_r{version:03d}.abc",
+    )
+
+
+@pytest.fixture
+def legacy_url(tmp_path, root_path):
+    """Url of a legacy database with three publishes, files written on disk."""
+    path = tmp_path / "legacy.db"
+    metadata = repr({"env": {"TK_PROJECT_PATH": root_path}})
+    connection = sqlite3.connect(path)
+    with connection:
+        connection.executescript(LEGACY_SCHEMA)
+        connection.execute(
+            "INSERT INTO project VALUES (1, 'PRJ', 'Project', ?, 1)", (metadata,)
+        )
+        connection.execute("INSERT INTO asset_type VALUES (1, 'chr', 'character', 1)")
+        connection.execute("INSERT INTO task_type VALUES (1, 'mod', 'Modeling', 1)")
+        connection.execute("INSERT INTO publish_type VALUES (1, 'geo', 'geo', '.abc', 1)")
+        connection.execute("INSERT INTO asset VALUES (1, 'hero_main', 1, 1, 1)")
+        connection.execute("INSERT INTO task VALUES (1, 1, 1, 1)")
+        for version in (1, 2, 3):
+            publish_path = legacy_publish_path(root_path, version)
+            os.makedirs(os.path.dirname(publish_path))
+            with open(publish_path, "wb") as publish_file:
+                publish_file.write(b"\0" * 10 * version)
+            connection.execute(
+                "INSERT INTO publish VALUES (?, 'mainGeo', ?, ?, 'release', ?, 1, 1, 1)",
+                (version, publish_path, version, 10 * version),
+            )
+    connection.close()
+    return f"sqlite:///{path}"
@@ -0,0 +1,177 @@
+"""Async entity API tests, coroutines are run with `asyncio.run`."""
+
+import asyncio
+
+import pytest
+
+from tk_db.aio.db import AsyncDb
+from tk_db.errors import DbProjectAlreadyExistsError
+from tk_db.querycount import assert_max_queries
+
+
+@pytest.fixture
+def async_db(tmp_path):
+    return AsyncDb(f"sqlite:///{tmp_path / 'tk_db.db'}")
+
+
+def test_create_project(async_db, db):
+    async def run():
+        project = await async_db.create_project("PRJ", "Project")
+        assert project.metadata == {}
+        await project.metadata_update({"fps": 25})
+        with pytest.raises(DbProjectAlreadyExistsError) as error:
+            await async_db.create_project("PRJ", "Other")
+        return project, str(error.value)
+
+    project, message = asyncio.run(run())
+
+    assert project.metadata == {"fps": 25}
+    assert message == "Project 'PRJ' - 'Other' already exist."
+    with pytest.raises(DbProjectAlreadyExistsError) as error:
+        db.create_project("PRJ", "Other")
+    assert str(error.value) == message
+
+
+def test_concurrent_publishes(async_db, root_path):
+    async def run():
+        project = await async_db.create_project("PRJ", "Project")
+        await project.set_metadata({"env": {"TK_PROJECT_PATH": root_path}})
+        asset_type = await async_db.get_or_create_asset_type("chr", "character")
+        task_type = await async_db.get_or_create_task_type("mod", "Modeling")
+        publish_type = await async_db.get_or_create_publish_type("geo", "geo", ".abc")
+        asset = await project.get_or_create_asset("hero_main", asset_type)
+        task = await asset.get_or_create_task(task_type)
+
+        publishes = await asyncio.gather(
+            *(task.create_next_publish("mainGeo", publish_type, "work") for _ in range(10))
+        )
+        return publishes, await task.last_version("mainGeo", publish_type, "work")
+
+    publishes, last_version = asyncio.run(run())
+
+    assert sorted(publish.version for publish in publishes) == list(range(1, 11))
+    assert last_version == 10
+    assert "Modeling" in publishes[0].path
+
+
+@pytest.fixture
+def hierarchy(async_db, root_path):
+    """Create a project with one publish per task, return its coroutine."""
+
+    async def create():
+        project = await async_db.create_project("PRJ", "Project")
+        await project.set_metadata({"env": {"TK_PROJECT_PATH": root_path}})
+        asset_type = await async_db.get_or_create_asset_type("chr", "character")
+        publish_type = await async_db.get_or_create_publish_type("geo", "geo", ".abc")
+        task_types = [
+            await async_db.get_or_create_task_type("mod", "Modeling"),
+            await async_db.get_or_create_task_type("rig", "Rigging"),
+        ]
+        for asset_code in ("hero_main", "hero_side"):
+            asset = await project.get_or_create_asset(asset_code, asset_type)
+            for task_type in task_types:
+                task = await asset.get_or_create_task(task_type)
+                await task.create_next_publish("mainGeo", publish_type, "release")
+        return project
+
+    return create
+
+
+def test_hierarchy_reads(hierarchy):
+    async def run():
+        project = await hierarchy()
+        assets = await project.assets()
+        tasks = await assets[0].tasks()
+        publishes = await tasks[0].publishes()
+        tree = await project.tree()
+        return assets, tasks, publishes, tree
+
+    assets, tasks, publishes, tree = asyncio.run(run())
+
+    assert [asset.code for asset in assets] == ["hero_main", "hero_side"]
+    assert assets[0].asset_type.code == "chr"
+    assert [task.code for task in tasks] == ["mod", "rig"]
+    assert [(p.code, p.version_name) for p in publishes] == [("mainGeo", "r001")]
+    assert {
+        asset.code: {task.code: len(publishes) for task, publishes in tasks.items()}
+        for asset, tasks in tree.items()
+    } == {"hero_main": {"mod": 1, "rig": 1}, "hero_side": {"mod": 1, "rig": 1}}
+
+
+def test_refresh_reads_changes_of_others(async_db, db):
+    async def run():
+        project = await async_db.create_project("PRJ", "Project")
+        db.project("PRJ").name = "Changed"
+        name = project.name
+        await project.refresh()
+        return name, project.name
+
+    assert asyncio.run(run()) == ("Project", "Changed")
+
+
+def test_transaction_commits_once(async_db):
+    async def run():
+        async with async_db.transaction():
+            project = await async_db.create_project("PRJ", "Project")
+            asset_type = await async_db.get_or_create_asset_type("chr", "character")
+            await project.get_or_create_asset("hero_main", asset_type)
+        return [asset.code for asset in await (await async_db.project("PRJ")).assets()]
+
+    assert asyncio.run(run()) == ["hero_main"]
+
+
+def test_rollback_restores_written_entities(async_db):
+    async def run():
+        project = await async_db.create_project("PRJ", "Project")
+        with pytest.raises(RuntimeError):
+            async with async_db.transaction():
+                await project.set_name("Renamed")
+                await project.metadata_update({"fps": 25})
+                assert project.name == "Renamed"
+                raise RuntimeError
+        return project, (await async_db.project("PRJ")).name
+
+    project, name = asyncio.run(run())
+
+    assert (project.name, name) == ("Project", "Project")
+    assert "fps" not in project.metadata
+
+
+def test_transaction_bound_to_asyncio_task(async_db):
+    async def in_transaction(started, release):
+        async with async_db.transaction() as session:
+            started.set()
+            await release.wait()
+            return session, async_db.in_transaction()
+
+    async def run():
+        started, release = asyncio.Event(), asyncio.Event()
+        transaction = asyncio.create_task(in_transaction(started, release))
+        await started.wait()
+        # Transaction of the other task is not joined by this one.
+        outside = async_db.in_transaction()
+        other = asyncio.create_task(in_transaction(asyncio.Event(), release))
+        release.set()
+        return outside, await transaction, await other
+
+    outside, (session, inside), (other_session, other_inside) = asyncio.run(run())
+
+    assert not outside
+    assert inside and other_inside
+    assert session is not other_session
+
+
+def test_type_cache(async_db):
+    async def run():
+        asset_type = await async_db.get_or_create_asset_type("chr", "character")
+        await async_db.asset_type("chr")
+        with assert_max_queries(async_db, 0):
+            cached = await async_db.asset_type("chr")
+            by_id = await async_db.asset_type_from_id(asset_type.id)
+        await async_db.get_or_create_asset_type("prp", "prop")
+        return cached, by_id, await async_db.asset_type("prp")
+
+    cached, by_id, prop = asyncio.run(run())
+
+    assert cached is by_id
+    assert prop.name == "prop"
@@ -0,0 +1,100 @@
+"""Entity change log tests."""
+
+import pytest
+
+from sqlalchemy import delete
+
+from tk_db.changes import Change
+from tk_db.errors import DbChangesPrunedError
+from tk_db.models import Publish
+from tk_db.scanner import PublishScanner
+from tk_dbui.watcher import load_changes
+
+
+def _ops(changes):
+    return [(change.table, change.op) for change in changes]
+
+
+def test_changes_since_records_writes(db, project, asset_type):
+    revision = db.revision()
+
+    asset = project.get_or_create_asset("hero_main", asset_type)
+    asset.set_active(False)
+    project.name = "Renamed"
+
+    changes = db.changes_since(revision)
+    assert _ops(changes) == [("asset", "insert"), ("asset", "update"), ("project", "update")]
+    assert changes[0] == Change(revision + 1, "asset", asset.id, "insert")
+    assert db.changes_since(changes[-1].revision) == []
+    assert db.changes_since(revision, limit=1) == changes[:1]
+
+
+def test_publish_delete_recorded(db, task, publish_type):
+    publish = task.create_next_publish("mainGeo", publish_type, "work")
+    revision = db.revision()
+    with db.session() as session:
+        session.execute(delete(Publish))
+        session.commit()
+
+    assert db.changes_since(revision) == [Change(revision + 1, "publish", publish.id, "delete")]
+
+
+def test_rolled_back_writes_not_recorded(db, project, asset_type):
+    revision = db.revision()
+
+    with pytest.raises(RuntimeError), db.transaction():
+        project.get_or_create_asset("hero_main", asset_type)
+        raise RuntimeError
+
+    assert db.changes_since(revision) == []
+    assert db.revision() == revision
+
+
+def test_unchanged_upserts_not_recorded(
+    legacy_url, db, project, asset_type, task_type, publish_type
+):
+    PublishScanner(project).run()
+    asset = project.assets()[0]
+    revision = db.revision()
+
+    asset.get_or_create_task(task_type)
+    report = PublishScanner(project).run()
+
+    assert report.inserted == 0
+    assert db.changes_since(revision) == []
+    assert [result.code for result in db.search("ero_ma", kinds=["asset"])] == ["hero_main"]
+
+
+def test_pruned_changes(db, project, asset_type):
+    revision = db.revision()
+    project.get_or_create_asset("hero_main", asset_type)
+    project.get_or_create_asset("hero_side", asset_type)
+    last = db.revision()
+
+    db.prune_changes(last - 1)
+
+    with pytest.raises(DbChangesPrunedError):
+        db.changes_since(revision)
+    assert len(db.changes_since(last - 1)) == 1
+    db.prune_changes(last + 10)
+    assert db.revision() == last
+    assert db.changes_since(last) == []
+
+
+def test_load_changes_merges_entity_changes(db, project, asset_type, task_type):
+    revision = db.revision()
+    asset_type.set_active(False)
+    asset_type.set_active(True)
+    other = db.get_or_create_task_type("rig", "Rigging")
+    project.name = "Renamed"
+
+    batch = load_changes(db, revision, limit=100)
+
+    assert batch.complete
+    assert batch.revision == db.revision()
+    assert [entity.id for entity in batch.entities["asset_type"]] == [asset_type.id]
+    assert [entity.code for entity in batch.entities["task_type"]] == ["rig"]
+    assert batch.entities["project"][0].name == "Renamed"
+    assert "asset" not in batch.entities
+    assert other.id not in batch.removed_ids["task_type"]
+    assert not load_changes(db, revision, limit=2).complete
@@ -0,0 +1,39 @@
+"""Loaded row entity column tests."""
+
+import pytest
+
+from sqlalchemy import update
+
+from tk_db.models import Project
+from tk_db.querycount import assert_max_queries
+
+
+def test_columns_served_from_loaded_row(db, project):
+    with assert_max_queries(db, 0):
+        assert (project.code, project.name, project.is_active()) == ("PRJ", "Project", True)
+
+
+def test_refresh_reads_changes_of_others(db, project):
+    with db.session() as session:
+        session.execute(update(Project).values(name="Changed"))
+        session.commit()
+
+    assert project.name == "Project"
+    project.refresh()
+    assert project.name == "Changed"
+
+
+def test_committed_values_after_rollback(db, task, publish_type):
+    publish = task.create_next_publish("mainGeo", publish_type, "release")
+    # List results wrap read-only snapshots instead of model instances.
+    listed = task.publishes()[0]
+
+    with pytest.raises(RuntimeError), db.transaction():
+        publish.set_active(True)
+        listed.set_active(True)
+        raise RuntimeError
+
+    assert not publish.is_active
+    assert not listed.is_active
+    listed.refresh()
+    assert not listed.is_active
@@ -0,0 +1,81 @@
+"""Project hierarchy loading tests."""
+
+import pytest
+
+from tk_db.dbtask import PublishSpec
+from tk_db.errors import DbQueryCountError
+from tk_db.querycount import assert_max_queries
+
+
+@pytest.fixture
+def hierarchy(db, project, asset_type, publish_type):
+    """Five assets of two tasks of three publishes each."""
+    task_types = [
+        db.get_or_create_task_type("mod", "Modeling"),
+        db.get_or_create_task_type("rig", "Rigging"),
+    ]
+    for index in range(5):
+        asset = project.get_or_create_asset(f"hero_{index:02d}", asset_type)
+        for task_type in task_types:
+            task = asset.get_or_create_task(task_type)
+            for _ in range(3):
+                task.create_next_publish("mainGeo", publish_type, "release")
+    return project
+
+
+def test_assets_single_query(db, hierarchy):
+    with assert_max_queries(db, 1):
+        assets = hierarchy.assets()
+        asset_types = {asset.asset_type.code for asset in assets}
+
+    assert len(assets) == 5
+    assert asset_types == {"chr"}
+
+
+def test_tasks_single_query(db, hierarchy):
+    asset = hierarchy.assets()[0]
+    with assert_max_queries(db, 1):
+        tasks = asset.tasks()
+        codes = sorted(task.code for task in tasks)
+
+    assert codes == ["mod", "rig"]
+
+
+def test_tree_constant_queries(db, hierarchy):
+    with assert_max_queries(db, 3):
+        tree = hierarchy.tree()
+
+    assert len(tree) == 5
+    assert all(len(tasks) == 2 for tasks in tree.values())
+    assert sum(len(p) for tasks in tree.values() for p in tasks.values()) == 30
+
+
+def test_assert_max_queries_raises(db, hierarchy):
+    assets = hierarchy.assets()
+    with pytest.raises(DbQueryCountError), assert_max_queries(db, 1):
+        for asset in assets:
+            asset.tasks()
+
+
+def test_latest_publishes(db, project, task, publish_type):
+    specs = [
+        PublishSpec(code, publish_type, release, active=True)
+        for code in ("mainGeo", "proxyGeo")
+        for release in ("release", "work")
+        for _ in range(3)
+    ]
+    publishes = task.create_publishes_bulk(specs)
+    publishes[2].set_active(False)  # Last mainGeo release.
+    project.latest_publishes()  # Warm type cache.
+
+    with assert_max_queries(db, 1):
+        latest = project.latest_publishes()
+    versions = {(p.code, p.release): p.version for p in latest}
+
+    assert versions == {
+        ("mainGeo", "release"): 2,
+        ("mainGeo", "work"): 3,
+        ("proxyGeo", "release"): 3,
+        ("proxyGeo", "work"): 3,
+    }
+    assert {p.release for p in project.latest_publishes("work")} == {"work"}
@@ -0,0 +1,41 @@
+"""Publish creation and lookup tests."""
+
+from tk_db.dbtask import PublishSpec
+from tk_db.querycount import assert_max_queries
+
+
+def test_create_publishes_bulk(db, task, publish_type):
+    specs = [
+        PublishSpec(code, publish_type, "release", size=index)
+        for index, code in enumerate(["mainGeo", "proxyGeo"] * 50)
+    ]
+
+    with assert_max_queries(db, 4):
+        publishes = task.create_publishes_bulk(specs)
+
+    assert [publish.size for publish in publishes] == list(range(100))
+    versions = [p.version for p in publishes if p.code == "mainGeo"]
+    assert versions == list(range(1, 51))
+    assert task.last_version("proxyGeo", publish_type, "release") == 50
+
+
+def test_create_publishes_bulk_continues_series(task, publish_type):
+    task.create_next_publish("mainGeo", publish_type, "work")
+    publishes = task.create_publishes_bulk(
+        [PublishSpec("mainGeo", publish_type, "work")] * 2
+    )
+
+    assert [publish.version for publish in publishes] == [2, 3]
+    assert task.create_publishes_bulk([]) == []
+
+
+def test_last_active_publish(db, task, publish_type):
+    publishes = task.create_publishes_bulk(
+        [PublishSpec("mainGeo", publish_type, "release", active=True)] * 3
+    )
+    publishes[2].set_active(False)
+
+    with assert_max_queries(db, 1):
+        publish = task.last_active_publish("mainGeo", publish_type, "release")
+
+    assert publish.version == 2
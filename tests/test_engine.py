@@ -0,0 +1,22 @@
+"""Engine configuration tests."""
+
+from sqlalchemy import text
+
+from tk_db.db import Db
+
+
+def test_engine_shared_per_url(tmp_path):
+    url = f"sqlite:///{tmp_path / 'tk_db.db'}"
+
+    assert Db(url).engine is Db(url).engine
+    assert Db(url).engine is not Db(f"sqlite:///{tmp_path / 'other.db'}").engine
+
+
+def test_sqlite_pragmas(tmp_path):
+    db = Db(f"sqlite:///{tmp_path / 'tk_db.db'}", sqlite_pragmas={"cache_size": -4096})
+
+    with db.engine.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert connection.execute(text("PRAGMA synchronous")).scalar() == 1
+        assert connection.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+        assert connection.execute(text("PRAGMA cache_size")).scalar() == -4096
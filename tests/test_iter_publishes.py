@@ -0,0 +1,47 @@
+"""Publish streaming tests."""
+
+from tk_db.dbtask import PublishSpec
+from tk_db.querycount import assert_max_queries
+
+
+def test_task_iter_publishes_filters(db, task, publish_type):
+    task.create_publishes_bulk(
+        [PublishSpec("mainGeo", publish_type, "work")] * 5
+        + [PublishSpec("proxyGeo", publish_type, "release")] * 2
+    )
+
+    with assert_max_queries(db, 1):
+        versions = [publish.version for publish in task.iter_publishes(code="mainGeo", batch_size=2)]
+
+    assert versions == [1, 2, 3, 4, 5]
+    assert [p.code for p in task.iter_publishes(release="release")] == ["proxyGeo"] * 2
+
+
+def test_project_iter_publishes_across_tasks(db, project, asset_type, task_type, publish_type):
+    tasks = [
+        project.get_or_create_asset(f"hero_{index}", asset_type).get_or_create_task(task_type)
+        for index in range(3)
+    ]
+    for task in tasks:
+        task.create_publishes_bulk(
+            [PublishSpec("mainGeo", publish_type, "release", active=True)] * 2
+        )
+    tasks[0].publishes()[0].set_active(False)
+    list(project.iter_publishes())  # Warm type cache.
+
+    with assert_max_queries(db, 1):
+        publishes = list(project.iter_publishes(active=True, batch_size=2))
+
+    assert len(publishes) == 5
+    assert {publish.task.asset.code for publish in publishes} == {"hero_0", "hero_1", "hero_2"}
+    assert publishes[-1].task is publishes[-2].task
+
+
+def test_stream_closed_early(db, task, publish_type):
+    task.create_publishes_bulk([PublishSpec("mainGeo", publish_type, "work")] * 5)
+
+    stream = task.iter_publishes(batch_size=2)
+    assert next(stream).version == 1
+    stream.close()
+
+    assert task.create_next_publish("mainGeo", publish_type, "work").version == 6
@@ -0,0 +1,58 @@
+"""Background entity loader tests."""
+
+import threading
+
+from tk_dbui.loader import EntityLoader
+
+from conftest import wait_until
+
+
+def test_result_delivered_in_gui_thread(qapp):
+    loader = EntityLoader()
+    results = []
+
+    def callback(fetch_thread):
+        results.append((fetch_thread, threading.get_ident()))
+
+    loader.load("key", threading.get_ident, callback)
+    wait_until(qapp, lambda: results)
+
+    (fetch_thread, callback_thread), = results
+    assert fetch_thread != threading.get_ident()
+    assert callback_thread == threading.get_ident()
+    assert not loader.is_loading("key")
+
+
+def test_request_superseded_by_same_key(qapp):
+    loader = EntityLoader(max_threads=1)
+    started = threading.Event()
+    release = threading.Event()
+    results = []
+
+    def slow_fetch():
+        started.set()
+        release.wait(5)
+        return "first"
+
+    loader.load("key", slow_fetch, results.append)
+    started.wait(5)
+    loader.load("key", lambda: "second", results.append)
+    loader.load("other", lambda: "other", results.append)
+    release.set()
+    wait_until(qapp, lambda: not loader.is_loading("key") and not loader.is_loading("other"))
+    loader.wait()
+    qapp.processEvents()
+
+    assert sorted(results) == ["other", "second"]
+
+
+def test_failure_reported_by_key(qapp):
+    loader = EntityLoader()
+    failures = []
+    loader.LoadFailed.connect(lambda key, error: failures.append((key, error)))
+
+    loader.load("key", lambda: 1 / 0, lambda result: None)
+    wait_until(qapp, lambda: failures)
+
+    assert failures[0][0] == "key"
+    assert "ZeroDivisionError" in failures[0][1]
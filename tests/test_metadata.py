@@ -0,0 +1,38 @@
+"""Project JSON metadata tests."""
+
+import pytest
+
+from sqlalchemy import null
+from sqlalchemy import update
+
+from tk_db.db import Db
+from tk_db.models import Project
+
+
+def test_metadata_update_keeps_other_keys(db, project, root_path):
+    project.metadata_update({"fps": 25})
+    project.metadata_update({"fps": 24, "resolution": [1920, 1080]})
+
+    expected = {"env": {"TK_PROJECT_PATH": root_path}, "fps": 24, "resolution": [1920, 1080]}
+    assert project.metadata == expected
+    assert db.project("PRJ").metadata == expected
+
+
+@pytest.mark.parametrize("value", [null(), None], ids=["sql_null", "json_null"])
+def test_metadata_update_of_null_metadata(db, project, value):
+    with db.session() as session:
+        session.execute(update(Project).values(metadata_=value))
+        session.commit()
+
+    project.metadata_update({"fps": 25})
+
+    assert project.metadata == {"fps": 25}
+    assert db.project("PRJ").metadata == {"fps": 25}
+
+
+def test_legacy_repr_metadata_migrated(legacy_url, root_path):
+    project = Db(legacy_url).project("PRJ")
+
+    assert project.metadata == {"env": {"TK_PROJECT_PATH": root_path}}
+    project.metadata_update({"fps": 25})
+    assert project.metadata["fps"] == 25
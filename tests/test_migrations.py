@@ -0,0 +1,50 @@
+"""Schema migration tests."""
+
+import sqlite3
+
+import pytest
+
+from sqlalchemy import create_engine
+
+from tk_db.db import Db
+from tk_db.errors import DbMigrationError
+from tk_db.migrations import migrate
+from tk_db.migrations import schema_version
+from tk_db.models import SCHEMA_VERSION
+
+
+def _index_names(url):
+    connection = sqlite3.connect(url.removeprefix("sqlite:///"))
+    rows = connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+    names = {name for (name,) in rows}
+    connection.close()
+    return names
+
+
+def test_legacy_database_migrated(legacy_url):
+    db = Db(legacy_url)
+
+    assert schema_version(db.engine) == SCHEMA_VERSION
+    assert {
+        "ux_asset_project_type_code",
+        "ux_task_asset_type",
+        "ux_publish_task_code_type_release_version",
+    } <= _index_names(legacy_url)
+
+
+def test_migrate_is_idempotent(legacy_url):
+    engine = create_engine(legacy_url)
+    migrate(engine)
+    migrate(engine)
+
+    assert schema_version(engine) == SCHEMA_VERSION
+
+
+def test_duplicated_rows_abort_migration(legacy_url):
+    connection = sqlite3.connect(legacy_url.removeprefix("sqlite:///"))
+    with connection:
+        connection.execute("INSERT INTO asset VALUES (2, 'hero_main', 1, 1, 1)")
+    connection.close()
+
+    with pytest.raises(DbMigrationError, match="ux_asset_project_type_code"):
+        migrate(create_engine(legacy_url))
@@ -0,0 +1,78 @@
+"""UI entity model tests."""
+
+import pytest
+
+from Qt import QtCore as qtc
+
+from tk_db.dbtask import PublishSpec
+from tk_db.models import AssetType
+from tk_db.models import Publish
+from tk_dbui.loader import EntityLoader
+from tk_dbui.models import EntityListModel
+from tk_dbui.models import EntityTableModel
+from tk_dbui.models import PagedEntityTableModel
+
+from conftest import wait_until
+
+
+ROOT = qtc.QModelIndex()
+
+
+@pytest.fixture
+def publishes(task, publish_type):
+    return task.create_publishes_bulk([PublishSpec("mainGeo", publish_type, "work")] * 25)
+
+
+def _fetch_all(qapp, model):
+    while model.canFetchMore(ROOT):
+        rows = model.rowCount()
+        model.fetchMore(ROOT)
+        wait_until(qapp, lambda: model.rowCount() > rows or not model.canFetchMore(ROOT))
+
+
+@pytest.mark.parametrize("threaded", [False, True], ids=["gui_thread", "loader"])
+def test_paged_model_fetches_pages(qapp, db, project, publishes, threaded):
+    loader = EntityLoader() if threaded else None
+    model = PagedEntityTableModel(Publish, page_size=10, loader=loader)
+    model.set_fetch_page(project.publishes_page)
+
+    assert model.rowCount() == 0
+    assert model.canFetchMore(ROOT)
+    model.fetchMore(ROOT)
+    wait_until(qapp, lambda: model.rowCount() == 10)
+    _fetch_all(qapp, model)
+
+    assert model.rowCount() == 25
+    assert [model.index(row, 0).data() for row in range(25)] == [p.id for p in publishes]
+
+
+def test_paged_model_fetches_inserts_after_last_page(qapp, project, task, publishes):
+    model = PagedEntityTableModel(Publish, page_size=10)
+    model.set_fetch_page(project.publishes_page)
+    _fetch_all(qapp, model)
+
+    new = task.create_publishes_bulk([PublishSpec("mainGeo", publishes[0].publish_type, "work")])
+    model.apply_changes(new, [publishes[0].id])
+
+    assert model.rowCount() == 25
+    assert model.entity_row(new[0].id) == 24
+    assert model.entity_row(publishes[0].id) is None
+
+
+@pytest.mark.parametrize("model_type", [EntityTableModel, EntityListModel])
+def test_model_indexes_by_code_and_id(qapp, db, model_type):
+    types = [db.get_or_create_asset_type(code, code) for code in ("chr", "prp", "set")]
+    model = model_type(AssetType)
+    model.set_entities(list(types))
+
+    assert model.get_entity("prp").id == types[1].id
+    assert model.remove_entity(types[0].id)
+    assert not model.remove_entity(types[0].id)
+    assert model.get_entity("chr") is None
+    assert model.entity_row(types[2].id) == 1
+
+    types[2].set_active(False)
+    model.apply_changes([types[2], types[0]], [])
+    assert model.entity_row(types[0].id) == 2
+    assert model.get_entity("chr").id == types[0].id
+    assert model.rowCount() == 3
@@ -0,0 +1,44 @@
+"""Publish path parsing and resolution tests."""
+
+from tk_db.db import Db
+from tk_db.pathparser import PublishPathInfo
+from tk_db.pathparser import parse_publish_path
+
+from conftest import legacy_publish_path
+
+
+def test_parse_release_path(root_path):
+    info = parse_publish_path(legacy_publish_path(root_path, 12))
+
+    assert info == PublishPathInfo(
+        "PRJ", "chr", "hero_main", "Modeling", "mainGeo", "release", 12, "geo", ".abc"
+    )
+
+
+def test_parse_rejects_mismatched_version(root_path):
+    path = legacy_publish_path(root_path, 1)
+
+    assert parse_publish_path(path.replace("_r001.abc", "_r002.abc")) is None
+    assert parse_publish_path(path.replace("release", "work")) is None
+    assert parse_publish_path(path.replace("hero_main", "hero_side", 1)) is None
+
+
+def test_publishes_from_legacy_paths(legacy_url, root_path):
+    db = Db(legacy_url)
+    paths = [legacy_publish_path(root_path, version) for version in (1, 2, 3, 4)]
+
+    publishes = db.publishes_from_paths([*paths, "/not/a/publish.abc"])
+
+    assert {path: publish.version for path, publish in publishes.items()} == {
+        paths[0]: 1,
+        paths[1]: 2,
+        paths[2]: 3,
+    }
+
+
+def test_publishes_from_created_paths(db, task, publish_type):
+    created = task.create_next_publish("mainGeo", publish_type, "work")
+
+    publishes = db.publishes_from_paths([created.path])
+
+    assert publishes[created.path].id == created.id
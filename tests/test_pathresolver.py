@@ -0,0 +1,72 @@
+"""Publish path resolver tests."""
+
+import os
+
+import pytest
+
+from tk_db.db import Db
+from tk_db.pathresolver import PathResolver
+from tk_db.pathresolver import PublishPathFields
+
+from conftest import legacy_publish_path
+
+
+FIELDS = PublishPathFields(
+    "chr", "hero_main", "Modeling", "mainGeo", "geo", ".abc", "release", 3
+)
+
+
+def test_release_and_work_paths(root_path):
+    resolver = PathResolver(root_path)
+
+    assert resolver.publish_path(*FIELDS) == legacy_publish_path(root_path, 3)
+    assert resolver.publish_path(*FIELDS._replace(release="work")) == os.path.join(
+        root_path,
+        "assets",
+        "chr",
+        "hero_main",
+        "Modeling",
+        "mainGeo",
+        "work",
+        "chr_hero_main_mainGeo_geo_w003.abc",
+    )
+    assert resolver.publish_paths([FIELDS]) == [resolver.publish_path(*FIELDS)]
+
+
+@pytest.mark.parametrize("root_path", ["/", "/projects/PRJ/", "/projects/{PRJ}"])
+def test_root_path_joined(root_path):
+    resolver = PathResolver(root_path)
+
+    expected = os.path.join(
+        root_path,
+        "assets",
+        "chr",
+        "hero_main",
+        "Modeling",
+        "mainGeo",
+        "release",
+        "r003",
+        "chr_hero_main_mainGeo_geo_r003.abc",
+    )
+    assert resolver.publish_path(*FIELDS) == expected
+
+
+def test_missing_root_path():
+    with pytest.raises(ValueError, match="Missing project root path"):
+        PathResolver.from_metadata({})
+
+
+def test_publish_created_in_task_name_directory(task, publish_type, root_path):
+    publish = task.create_next_publish("mainGeo", publish_type, "release")
+
+    assert publish.path == legacy_publish_path(root_path, 1)
+
+
+def test_legacy_series_continued_in_place(legacy_url, root_path):
+    db = Db(legacy_url)
+    task = db.project("PRJ").assets()[0].tasks()[0]
+
+    publish = task.create_next_publish("mainGeo", db.publish_type("geo"), "release")
+
+    assert publish.version == 4
+    assert publish.path == legacy_publish_path(root_path, 4)
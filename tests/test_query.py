@@ -0,0 +1,76 @@
+"""Publish query builder tests."""
+
+import pytest
+
+from tk_db.dbtask import PublishSpec
+from tk_db.query import like_pattern
+from tk_db.querycount import assert_max_queries
+
+
+@pytest.fixture
+def publishes(db, project, asset_type, task_type, publish_type, task):
+    rig_type = db.get_or_create_task_type("rig", "Rigging")
+    side = project.get_or_create_asset("hero_side", asset_type)
+    prop = project.get_or_create_asset("cup_100", db.get_or_create_asset_type("prp", "prop"))
+    specs = [
+        PublishSpec("mainGeo", publish_type, "release", active=True),
+        PublishSpec("mainGeo", publish_type, "release", active=True),
+        PublishSpec("mainGeo", publish_type, "work"),
+    ]
+    for asset_task in (task, side.get_or_create_task(rig_type), prop.get_or_create_task(task_type)):
+        asset_task.create_publishes_bulk(specs)
+
+
+def _keys(query):
+    # Results come in no particular order.
+    return sorted((p.task.asset.code, p.task.code, p.release, p.version) for p in query)
+
+
+def test_filters_combined(db, publishes):
+    query = db.publish_query().project("PRJ").asset_type("chr").release("release")
+
+    assert query.count() == 4
+    assert _keys(query.task_type("rig")) == [
+        ("hero_side", "rig", "release", 1),
+        ("hero_side", "rig", "release", 2),
+    ]
+    assert _keys(query.asset("hero_*").version(2, None).active()) == [
+        ("hero_main", "mod", "release", 2),
+        ("hero_side", "rig", "release", 2),
+    ]
+    assert query.active(False).count() == 0
+    assert db.publish_query().code("main*").publish_type("geo").count() == 9
+
+
+def test_filters_do_not_mutate(db, publishes):
+    query = db.publish_query().asset("cup_100")
+    work = query.release("work")
+
+    assert query.count() == 3
+    assert work.count() == 1
+    assert query.asset("hero_main").count() == 0
+
+
+def test_code_filters_ignore_case(db, publishes):
+    assert db.publish_query().asset("HERO_MAIN").count() == 3
+    assert db.publish_query().asset("Hero_*").count() == 6
+    assert db.publish_query().project("prj").code("MAINGEO").count() == 9
+
+
+def test_single_query(db, publishes):
+    query = db.publish_query().asset("hero_main", "cup_100").release("work")
+    query.all()  # Warm type cache.
+
+    with assert_max_queries(db, 1):
+        keys = _keys(query.all())
+    with assert_max_queries(db, 1):
+        first = query.first()
+
+    assert keys == [("cup_100", "mod", "work", 1), ("hero_main", "mod", "work", 1)]
+    assert first.task.asset.code == "hero_main"
+    assert db.publish_query().asset("nope").first() is None
+
+
+def test_like_pattern_escapes_wildcards():
+    assert like_pattern("hero_*") == "hero\\_%"
+    assert like_pattern("100%?") == "100\\%_"
@@ -0,0 +1,26 @@
+"""Publish reconciliation tests."""
+
+import os
+
+from tk_db.db import Db
+from tk_db.reconcile import PublishReconciler
+from tk_db.reconcile import ReconcileReport
+
+from conftest import legacy_publish_path
+
+
+def test_reconcile_sizes_and_active_states(legacy_url, root_path):
+    db = Db(legacy_url)
+    project = db.project("PRJ")
+    task = project.assets()[0].tasks()[0]
+    task.publishes()[2].set_active(False)
+    with open(legacy_publish_path(root_path, 1), "wb") as publish_file:
+        publish_file.write(b"\0" * 50)
+    os.remove(legacy_publish_path(root_path, 2))
+
+    report = PublishReconciler(db, project, workers=2, batch_size=2).run()
+
+    assert report == ReconcileReport(checked=3, updated=3, missing=1)
+    publishes = task.publishes()
+    assert [(p.size, p.is_active) for p in publishes] == [(50, True), (20, False), (30, True)]
+    assert PublishReconciler(db).run() == ReconcileReport(checked=3, updated=0, missing=1)
@@ -0,0 +1,98 @@
+"""Publish filesystem scanner tests."""
+
+import os
+import time
+
+from sqlalchemy import insert
+
+from tk_db import scanner
+from tk_db.models import Publish
+from tk_db.scanner import PublishScanner
+from tk_db.scanner import ScanReport
+
+from conftest import legacy_publish_path
+
+
+def _asset_directory(root_path):
+    return os.path.join(root_path, "assets", "chr", "hero_main")
+
+
+def test_scan_legacy_layout(legacy_url, project, asset_type, task_type, publish_type):
+    report = PublishScanner(project, workers=2).run()
+
+    assert report == ScanReport(directories=1, files=3, inserted=3, skipped=0)
+    task = project.assets()[0].tasks()[0]
+    assert task.code == "mod"
+    assert [(p.version, p.size) for p in task.publishes()] == [(1, 10), (2, 20), (3, 30)]
+    publish = task.create_next_publish("mainGeo", publish_type, "release")
+    assert publish.path == legacy_publish_path(project.path_resolver().root_path, 4)
+
+
+def test_scan_resumes_from_state_file(
+    tmp_path, legacy_url, project, asset_type, task_type, publish_type, root_path
+):
+    state_path = str(tmp_path / "scan.state")
+    other_directory = os.path.join(root_path, "assets", "chr", "hero_side")
+    os.makedirs(other_directory)
+    with open(state_path, "w", encoding="utf-8") as state_file:
+        state_file.write(f"{_asset_directory(root_path)}\n")
+
+    report = PublishScanner(project, state_path=state_path).run()
+
+    assert report == ScanReport(directories=1, files=0, inserted=0, skipped=0)
+    assert project.assets() == []
+    with open(state_path, encoding="utf-8") as state_file:
+        assert state_file.read().splitlines() == [
+            _asset_directory(root_path),
+            other_directory,
+        ]
+    report = PublishScanner(project, state_path=state_path).run()
+    assert report.directories == 0
+
+
+def test_scan_skips_registered_publish_identity(
+    db, legacy_url, project, asset_type, task_type, publish_type
+):
+    task = project.get_or_create_asset("hero_main", asset_type).get_or_create_task(
+        task_type
+    )
+    # Version 1 registered before at another path, file on disk conflicts.
+    with db.session() as session:
+        session.execute(
+            insert(Publish).values(
+                code="mainGeo",
+                path="/archive/chr_hero_main_mainGeo_geo_r001.abc",
+                version=1,
+                release="release",
+                size=0,
+                active=True,
+                publish_type_id=publish_type.id,
+                task_id=task.id,
+            )
+        )
+        session.commit()
+
+    report = PublishScanner(project).run()
+
+    assert report.inserted == 2
+    assert [p.version for p in task.publishes()] == [1, 2, 3]
+
+
+def test_scan_bounds_directories_in_flight(monkeypatch, tmp_path, db, project):
+    directories = [str(tmp_path / f"dir{index}") for index in range(10)]
+    for directory in directories:
+        os.makedirs(directory)
+    scanned = []
+
+    def scan_directory(path):
+        scanned.append(path)
+        return [], 0
+
+    monkeypatch.setattr(scanner, "scan_directory", scan_directory)
+    scan = PublishScanner(project, workers=1)._scan(directories)
+    next(scan)
+    time.sleep(0.2)
+
+    assert len(scanned) <= 3
+    assert len(list(scan)) == 9
+    assert sorted(scanned) == sorted(directories)
@@ -0,0 +1,63 @@
+"""Code search tests."""
+
+import pytest
+
+from sqlalchemy import insert
+
+from tk_db.dbtask import PublishSpec
+from tk_db.models import Asset
+
+
+@pytest.fixture
+def superheroes(db, project, asset_type):
+    with db.session() as session:
+        session.execute(
+            insert(Asset),
+            [
+                {
+                    "code": f"superhero_{index}",
+                    "project_id": project.id,
+                    "asset_type_id": asset_type.id,
+                    "active": True,
+                }
+                for index in range(1500)
+            ],
+        )
+        session.commit()
+    for code in ("hero_main", "hero"):
+        project.get_or_create_asset(code, asset_type)
+
+
+def test_exact_and_prefix_codes_outrank_matches_past_candidates(db, superheroes):
+    results = db.search("hero", kinds=["asset"], limit=5)
+
+    assert [(result.code, result.score) for result in results] == [
+        ("hero", 0),
+        ("hero_main", 1),
+        ("superhero_0", 2),
+        ("superhero_1", 2),
+        ("superhero_2", 2),
+    ]
+
+
+def test_short_text_and_case(db, superheroes):
+    assert [result.code for result in db.search("HE", kinds=["asset"], limit=2)] == [
+        "hero",
+        "hero_main",
+    ]
+    assert db.search("  ") == []
+    with pytest.raises(ValueError, match="Unknown search kind"):
+        db.search("hero", kinds=["task"])
+
+
+def test_search_publishes(db, task, publish_type):
+    created = task.create_publishes_bulk(
+        [PublishSpec("mainGeo", publish_type, "work"), PublishSpec("proxyGeo", publish_type, "work")]
+    )
+
+    results = db.search("geo", kinds=["publish"])
+
+    assert [(result.code, result.path) for result in results] == [
+        ("mainGeo", created[0].path),
+        ("proxyGeo", created[1].path),
+    ]
@@ -0,0 +1,54 @@
+"""Read-only row snapshot tests."""
+
+import pytest
+
+from tk_db.aio.dbproject import AsyncDbProject
+from tk_db.aio.dbpublish import AsyncDbPublish
+from tk_db.dbasset import DbAsset
+from tk_db.dbproject import DbProject
+from tk_db.dbpublish import DbPublish
+from tk_db.dbtask import DbTask
+from tk_db.dbtask import PublishSpec
+from tk_db.models import Publish
+from tk_db.models import Task
+from tk_db.snapshot import snapshot_select
+from tk_db.snapshot import snapshot_type
+from tk_db.snapshot import split_snapshot
+
+
+def test_snapshot_fields_are_model_columns():
+    assert snapshot_type(Publish)._fields == tuple(Publish.__table__.columns.keys())
+    assert snapshot_type(Publish) is snapshot_type(Publish)
+
+
+def test_split_snapshot(db, task, publish_type):
+    created = task.create_next_publish("mainGeo", publish_type, "release")
+
+    with db.session() as session:
+        row = session.execute(snapshot_select(Publish, Task).join(Task)).one()
+    snapshot, orm_task = split_snapshot(Publish, row)
+
+    assert snapshot.id == created.id
+    assert snapshot.path == created.path
+    assert orm_task.id == task.id
+
+
+def test_list_results_wrap_snapshots(task, publish_type):
+    task.create_publishes_bulk([PublishSpec("mainGeo", publish_type, "work", size=3)] * 3)
+
+    publishes = task.publishes()
+
+    assert [publish.version for publish in publishes] == [1, 2, 3]
+    assert all(isinstance(publish._bc_entity, tuple) for publish in publishes)
+    with pytest.raises(AttributeError):
+        publishes[0]._bc_entity.size = 4
+    publishes[0].set_active(True)
+    assert publishes[0].is_active
+    assert task.publishes()[0].is_active
+
+
+@pytest.mark.parametrize(
+    "entity_type", [DbProject, DbAsset, DbTask, DbPublish, AsyncDbProject, AsyncDbPublish]
+)
+def test_entities_have_no_instance_dict(entity_type):
+    assert not hasattr(entity_type.__new__(entity_type), "__dict__")
@@ -0,0 +1,45 @@
+"""Unit of work transaction tests."""
+
+import pytest
+
+from sqlalchemy import delete
+from sqlalchemy import update
+
+from tk_db.errors import DbPublishVersionConflictError
+from tk_db.models import Publish
+from tk_db.models import PublishVersion
+
+
+def test_transaction_commits_once(db, asset_type, task_type):
+    with db.transaction():
+        project = db.create_project("TRX", "Transaction")
+        asset = project.get_or_create_asset("hero_main", asset_type)
+        asset.get_or_create_task(task_type)
+
+    assert [task.code for task in db.project("TRX").assets()[0].tasks()] == ["mod"]
+
+
+def test_rollback_restores_written_entities(db, project):
+    with pytest.raises(RuntimeError), db.transaction():
+        project.name = "Renamed"
+        project.metadata_update({"fps": 25})
+        assert project.name == "Renamed"
+        raise RuntimeError
+
+    assert db.project("PRJ").name == "Project"
+    assert project.name == "Project"
+    assert "fps" not in project.metadata
+
+
+def test_conflict_in_transaction(db, task, publish_type):
+    publish = task.create_next_publish("mainGeo", publish_type, "release")
+    # Next version gets the path of a publish registered out of its series.
+    with db.session() as session:
+        session.execute(
+            update(Publish).where(Publish.id == publish.id).values(code="oldGeo")
+        )
+        session.execute(delete(PublishVersion))
+        session.commit()
+
+    with pytest.raises(DbPublishVersionConflictError), db.transaction():
+        task.create_next_publish("mainGeo", publish_type, "release")
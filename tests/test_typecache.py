@@ -0,0 +1,38 @@
+"""Type lookup cache tests."""
+
+from sqlalchemy import update
+
+from tk_db.db import Db
+from tk_db.models import AssetType
+from tk_db.models import Meta
+from tk_db.querycount import assert_max_queries
+
+
+def test_cached_lookup_no_query(db, asset_type):
+    assert db.asset_type("chr").id == asset_type.id
+
+    with assert_max_queries(db, 0):
+        assert db.asset_type("chr") is db.asset_type_from_id(asset_type.id)
+
+
+def test_cache_invalidated_by_type_write(db, asset_type):
+    db.asset_type("chr")
+    db.get_or_create_asset_type("prp", "prop")
+
+    assert db.asset_type("prp").name == "prop"
+
+
+def test_versioned_cache_sees_other_process_writes(db, asset_type):
+    versioned_db = Db(db.url, type_cache_versioned=True)
+    assert versioned_db.asset_type("chr").name == "character"
+
+    # Another process renames the type and bumps the version stamp.
+    with db.session() as session:
+        session.execute(
+            update(AssetType).where(AssetType.code == "chr").values(name="char")
+        )
+        session.execute(
+            update(Meta).where(Meta.key == "type_version").values(value=Meta.value + 1)
+        )
+
+    assert versioned_db.asset_type("chr").name == "char"
@@ -0,0 +1,36 @@
+"""Atomic get-or-create tests."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tk_db.errors import DbAssetAlreadyExistError
+from tk_db.errors import DbProjectAlreadyExistsError
+from tk_db.errors import DbTaskTypeAlreadyExistError
+
+
+def test_existing_entities_raise(db, project, asset_type, task_type):
+    project.get_or_create_asset("hero_main", asset_type)
+
+    with pytest.raises(DbAssetAlreadyExistError):
+        project.get_or_create_asset("hero_main", asset_type)
+    with pytest.raises(DbProjectAlreadyExistsError):
+        db.create_project("PRJ", "Project")
+    with pytest.raises(DbTaskTypeAlreadyExistError):
+        db.get_or_create_task_type("mod", "Modeling")
+    assert len(project.assets()) == 1
+
+
+def test_get_or_create_task_returns_existing(asset, task_type):
+    task = asset.get_or_create_task(task_type)
+
+    assert asset.get_or_create_task(code="mod").id == task.id
+    assert len(asset.tasks()) == 1
+
+
+def test_concurrent_get_or_create_task(asset, task_type):
+    with ThreadPoolExecutor(8) as executor:
+        tasks = list(executor.map(lambda _: asset.get_or_create_task(task_type), range(32)))
+
+    assert len({task.id for task in tasks}) == 1
+    assert len(asset.tasks()) == 1
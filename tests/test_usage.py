@@ -0,0 +1,65 @@
+"""Project disk usage rollup tests."""
+
+import pytest
+
+from sqlalchemy import delete
+
+from tk_db.db import Db
+from tk_db.dbtask import PublishSpec
+from tk_db.models import Publish
+
+
+@pytest.fixture
+def publishes(db, project, asset_type, task_type, publish_type, task):
+    rig_type = db.get_or_create_task_type("rig", "Rigging")
+    rig = project.get_or_create_asset("hero_side", asset_type).get_or_create_task(rig_type)
+    task.create_publishes_bulk(
+        [
+            PublishSpec("mainGeo", publish_type, "release", size=100, active=True),
+            PublishSpec("mainGeo", publish_type, "release", size=50, active=True),
+            PublishSpec("mainGeo", publish_type, "work", size=1000),
+        ]
+    )
+    return rig.create_publishes_bulk(
+        [PublishSpec("rigGeo", publish_type, "release", size=7, active=True)]
+    )
+
+
+def _usage(project, group_by, summary):
+    return [tuple(row) for row in project.usage(group_by, summary=summary)]
+
+
+@pytest.mark.parametrize("summary", [False, True])
+def test_usage_levels(project, publishes, summary):
+    assert _usage(project, "project", summary) == [("PRJ", 157, 3)]
+    assert _usage(project, "asset", summary) == [
+        ("PRJ", "chr", "hero_main", 150, 2),
+        ("PRJ", "chr", "hero_side", 7, 1),
+    ]
+    assert _usage(project, "task", summary) == [
+        ("PRJ", "chr", "hero_main", "mod", 150, 2),
+        ("PRJ", "chr", "hero_side", "rig", 7, 1),
+    ]
+
+
+def test_usage_summary_follows_publish_writes(db, project, publishes):
+    publishes[0].set_active(False)
+    with db.session() as session:
+        session.execute(delete(Publish).where(Publish.size == 50))
+        session.commit()
+
+    assert _usage(project, "project", True) == [("PRJ", 100, 1)]
+    assert _usage(project, "task", True) == [("PRJ", "chr", "hero_main", "mod", 100, 1)]
+    for group_by in ("project", "task"):
+        assert _usage(project, group_by, True) == _usage(project, group_by, False)
+
+
+def test_usage_summary_of_migrated_database(legacy_url):
+    project = Db(legacy_url).project("PRJ")
+
+    assert _usage(project, "task", True) == [("PRJ", "chr", "hero_main", "mod", 60, 3)]
+
+
+def test_unknown_usage_level(project):
+    with pytest.raises(ValueError, match="Unknown usage level"):
+        project.usage("publish")
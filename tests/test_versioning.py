@@ -0,0 +1,44 @@
+"""Publish version allocation tests."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import insert
+
+from tk_db.models import Publish
+
+
+def test_concurrent_version_allocation(task, publish_type):
+    def publish(_):
+        return [
+            task.create_next_publish("mainGeo", publish_type, "work").version
+            for _ in range(10)
+        ]
+
+    with ThreadPoolExecutor(8) as executor:
+        versions = [v for chunk in executor.map(publish, range(8)) for v in chunk]
+
+    assert sorted(versions) == list(range(1, 81))
+    assert task.last_version("mainGeo", publish_type, "work") == 80
+
+
+def test_allocation_skips_unallocated_publishes(db, task, publish_type):
+    task.create_next_publish("mainGeo", publish_type, "work")
+    # Registered by a client not using the series counter.
+    with db.session() as session:
+        session.execute(
+            insert(Publish).values(
+                code="mainGeo",
+                path="/unallocated/mainGeo_v005.abc",
+                version=5,
+                release="work",
+                size=0,
+                active=False,
+                publish_type_id=publish_type.id,
+                task_id=task.id,
+            )
+        )
+        session.commit()
+
+    publish = task.create_next_publish("mainGeo", publish_type, "work")
+
+    assert publish.version == 6
@@ -29,6 +29,10 @@ task_code_str = r"[a-z]+(?:_[a-z]+)*"
 task_code_grp = rf"(?P<task_code>{task_code_str})"
 task_code_grp_re = re.compile(rf"^{task_code_grp}$")
 
+# Task directory of publish paths, task type name like `Modeling`, or code.
+task_dir_str = r"[^/\\]+"
+task_dir_grp = rf"(?P<task_dir>{task_dir_str})"
+
 # camelCase, number after first word.
 publish_code_str = r"[a-z]+(?:[A-Z][a-z0-9]*)*"
 publish_code_grp = rf"(?P<publish_code>{publish_code_str})"
@@ -39,3 +43,51 @@ publish_code_grp_re = re.compile(rf"^{publish_code_grp}$")
 file_desc_str = r"[a-z]+"
 file_desc_grp = rf"(?P<file_desc>{file_desc_str})"
 file_desc_grp_re = rf"^{file_desc_grp}$"
+
+
+# Publish path templates, parts are joined with os.path.join.
+publish_release_path_parts = (
+    "{root}",
+    "assets",
+    "{asset_type}",
+    "{asset}",
+    "{task}",
+    "{code}",
+    "{release}",
+    "{version_name}",
+    "{file_name}",
+)
+publish_work_path_parts = (
+    "{root}",
+    "assets",
+    "{asset_type}",
+    "{asset}",
+    "{task}",
+    "{code}",
+    "{release}",
+    "{file_name}",
+)
+publish_file_name_tpl = (
+    "{asset_type}_{asset}_{code}_{file_type}_{version_name}{extension}"
+)
+publish_version_name_tpl = "{release_letter}{version:03d}"
+
+# Release directory and version name, `r` for release, `w` for work.
+publish_release_str = r"release|work"
+publish_release_grp = rf"(?P<release>{publish_release_str})"
+publish_version_name_grp = r"(?P<release_letter>[rw])(?P<version>[0-9]{3,})"
+publish_extension_grp = r"(?P<extension>\.[A-Za-z0-9]+)"
+
+# Whole publish path, see `publish_release_path_parts`/`publish_work_path_parts`.
+publish_path_grp = (
+    rf"^(?P<root>.*[/\\]{project_code_grp})[/\\]assets"
+    rf"[/\\]{asset_type_code_grp}"
+    rf"[/\\]{asset_code_grp}"
+    rf"[/\\]{task_dir_grp}"
+    rf"[/\\]{publish_code_grp}"
+    rf"[/\\]{publish_release_grp}"
+    r"(?:[/\\](?P<version_dir>[rw][0-9]{3,}))?"
+    r"[/\\](?P=asset_type_code)_(?P=asset_code)_(?P=publish_code)"
+    rf"_{file_desc_grp}_{publish_version_name_grp}{publish_extension_grp}$"
+)
+publish_path_grp_re = re.compile(publish_path_grp)
@@ -0,0 +1,5 @@
+"""Asyncio database package, `tk_db` entity API on SQLAlchemy async engines.
+
+Requires `sqlalchemy[asyncio]` and the async driver of the database backend,
+`aiosqlite` for SQLite or `asyncpg` for PostgreSQL.
+"""
@@ -0,0 +1,429 @@
+"""Async database object module."""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import os
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import ClassVar
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from tk_db.aio.dbassettype import AsyncDbAssetType
+from tk_db.aio.dbproject import AsyncDbProject
+from tk_db.aio.dbpublishtype import AsyncDbPublishType
+from tk_db.aio.dbtasktype import AsyncDbTaskType
+from tk_db.aio.engine import get_async_engine
+from tk_db.db import DB_POOL_SIZE_ENV
+from tk_db.db import DB_URL_ENV
+from tk_db.db import DEFAULT_DB_URL
+from tk_db.db import TYPE_VERSION_KEY
+from tk_db.db import bump_type_version
+from tk_db.db import select_type
+from tk_db.db import upsert_project
+from tk_db.db import upsert_type
+from tk_db.dbentity import rollback_entities
+from tk_db.errors import DbAssetTypeAlreadyExistsError
+from tk_db.errors import DbProjectAlreadyExistsError
+from tk_db.errors import DbPublishTypeAlreadyExistError
+from tk_db.errors import DbTaskTypeAlreadyExistError
+from tk_db.errors import MissingDbAssetTypeError
+from tk_db.errors import MissingDbProjectError
+from tk_db.errors import MissingDbPublishTypeError
+from tk_db.errors import MissingDbTaskTypeError
+from tk_db.models import AssetType
+from tk_db.models import Project
+from tk_db.models import PublishType
+from tk_db.models import TaskType
+from tk_db.typecache import TypeCache
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from tk_db.aio.dbentity import AsyncDbEntity
+    from tk_db.models import Base
+
+
+# Transaction session of each `AsyncDb` in current asyncio task.
+_transaction_sessions: contextvars.ContextVar[dict[AsyncDb, AsyncSession] | None] = (
+    contextvars.ContextVar("tk_db_aio_transaction_sessions", default=None)
+)
+
+
+class AsyncDb:
+    """Async database object, `Db` API on a SQLAlchemy `AsyncEngine`.
+
+    Every database access is a coroutine, so many concurrent requests are
+    served by one event loop without blocking it. Engine is pooled and shared
+    by every `AsyncDb` of the process using the same url, schema is migrated
+    through the sync engine of `tk_db.engine` on first use.
+
+    Asset, task and publish types are cached process wide like `Db` ones, a
+    type write from any `Db` or `AsyncDb` bumps the database type version.
+
+    Args:
+        url (str|None): Sync database url, `TK_DB_URL` environment variable or
+            package SQLite database if None. Async driver is chosen from it.
+        pool_size (int|None): Number of pooled connections,
+            `TK_DB_POOL_SIZE` environment variable if None.
+        sqlite_pragmas (dict[str, Any]|None): Pragmas overriding
+            `tk_db.engine.DEFAULT_SQLITE_PRAGMAS` on SQLite connections.
+        type_cache_ttl (float|None): Seconds after which cached types are
+            reloaded from database, never if None.
+    """
+
+    _type_caches: ClassVar[dict[str, TypeCache]] = {}  # Process wide, by database url.
+    _default_url = DEFAULT_DB_URL
+    _type_version_key = TYPE_VERSION_KEY
+
+    def __init__(
+        self,
+        url: str | None = None,
+        pool_size: int | None = None,
+        sqlite_pragmas: dict[str, Any] | None = None,
+        type_cache_ttl: float | None = None,
+    ):
+        if url is None:
+            url = os.environ.get(DB_URL_ENV, self._default_url)
+        if pool_size is None and os.environ.get(DB_POOL_SIZE_ENV):
+            pool_size = int(os.environ[DB_POOL_SIZE_ENV])
+
+        self.url = url
+        self.engine = get_async_engine(url, pool_size, sqlite_pragmas)
+        self.Session = async_sessionmaker(self.engine, expire_on_commit=False)
+
+        self.type_cache_ttl = type_cache_ttl
+        self._type_cache = self._type_caches.setdefault(url, TypeCache())
+
+    def __repr__(self):
+        return f"AsyncDb({self.url})"
+
+    @contextlib.asynccontextmanager
+    async def transaction(self) -> AsyncIterator[AsyncSession]:
+        """Run every entity read and write of the block in one session and commit.
+
+        Same as `Db.transaction`, transaction is bound to current asyncio task
+        instead of current thread.
+
+        Yields:
+            AsyncSession: Transaction session.
+        """
+        sessions = _transaction_sessions.get() or {}
+        session = sessions.get(self)
+        if session is not None:
+            yield session
+            return
+
+        async with self.Session() as session:
+            token = _transaction_sessions.set({**sessions, self: session})
+            try:
+                yield session
+                await session.commit()
+            except BaseException:
+                # Types cached during transaction may have been rolled back.
+                self._type_cache.clear(self._type_cache.version)
+                rollback_entities(session)
+                raise
+            finally:
+                _transaction_sessions.reset(token)
+
+    def in_transaction(self) -> bool:
+        """Return if current asyncio task runs in a `transaction` block."""
+        return self in (_transaction_sessions.get() or {})
+
+    @contextlib.asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """Get session of current transaction, or a new one committed on exit.
+
+        Yields:
+            AsyncSession
+        """
+        session = (_transaction_sessions.get() or {}).get(self)
+        if session is not None:
+            yield session
+            return
+
+        async with self.Session() as session:
+            yield session
+            await session.commit()
+
+    async def project(self, code: str) -> AsyncDbProject:
+        """Get database project from his code.
+
+        Args:
+            code (str): Project code.
+
+        Returns:
+            AsyncDbProject
+
+        Raises:
+            MissingDbProjectError: Given project code not found in database.
+        """
+        async with self.session() as session:
+            found_project = await session.scalar(
+                select(Project).where(Project.code == code)
+            )
+
+        if found_project is None:
+            raise MissingDbProjectError(f"Unable to found project with code: {code!r}")
+
+        return AsyncDbProject(self, found_project)
+
+    async def projects(self) -> list[AsyncDbProject]:
+        """Get all projects in database.
+
+        Returns:
+            list[AsyncDbProject]
+        """
+        async with self.session() as session:
+            projects = await session.scalars(select(Project))
+            return [AsyncDbProject(self, project) for project in projects]
+
+    async def create_project(self, code: str, name: str) -> AsyncDbProject:
+        """Create new project in database, see `Db.create_project`.
+
+        Args:
+            code (str): Project code.
+            name (str): Project name.
+
+        Raises:
+            DbProjectAlreadyExistsError
+
+        Returns:
+            AsyncDbProject
+        """
+        async with self.session() as session:
+            insert_query = upsert_project(session, code, name)
+            project = (await session.scalars(insert_query)).first()
+
+        if project is None:
+            raise DbProjectAlreadyExistsError(
+                f"Project {code!r} - {name!r} already exist."
+            )
+
+        return AsyncDbProject(self, project)
+
+    async def asset_type(self, code: str) -> AsyncDbAssetType:
+        """Get database asset type from his code.
+
+        Raises:
+            MissingDbAssetTypeError: Given asset type code not found in database.
+        """
+        asset_type = await self._cached_type(AssetType, AsyncDbAssetType, "code", code)
+        if asset_type is None:
+            raise MissingDbAssetTypeError(
+                f"Unable to found asset type with code {code!r}"
+            )
+
+        return asset_type
+
+    async def asset_type_from_id(self, id_: int) -> AsyncDbAssetType:
+        """Get database asset type from his id.
+
+        Raises:
+            MissingDbAssetTypeError: Given asset type id not found in database.
+        """
+        asset_type = await self._cached_type(AssetType, AsyncDbAssetType, "id", id_)
+        if asset_type is None:
+            raise MissingDbAssetTypeError(f"Unable to found asset type with id {id_!r}")
+
+        return asset_type
+
+    async def asset_types(self) -> list[AsyncDbAssetType]:
+        """Return all asset types."""
+        return await self._types(AssetType, AsyncDbAssetType)
+
+    async def get_or_create_asset_type(self, code: str, name: str) -> AsyncDbAssetType:
+        """Create new asset type in database, see `Db.get_or_create_asset_type`.
+
+        Raises:
+            DbAssetTypeAlreadyExistsError
+        """
+        asset_type = await self._insert_type(
+            AssetType, AsyncDbAssetType, code=code, name=name, active=True
+        )
+        if asset_type is None:
+            raise DbAssetTypeAlreadyExistsError(
+                f"Asset type {code!r} - {name!r} already exists."
+            )
+
+        return asset_type
+
+    async def task_type(self, code: str) -> AsyncDbTaskType:
+        """Get database task type from his code.
+
+        Raises:
+            MissingDbTaskTypeError: Given task type code not found in database.
+        """
+        task_type = await self._cached_type(TaskType, AsyncDbTaskType, "code", code)
+        if task_type is None:
+            raise MissingDbTaskTypeError(f"Unable to found task type with code {code!r}")
+
+        return task_type
+
+    async def task_type_from_id(self, id_: int) -> AsyncDbTaskType:
+        """Get database task type from his id.
+
+        Raises:
+            MissingDbTaskTypeError: Given task type id not found in database.
+        """
+        task_type = await self._cached_type(TaskType, AsyncDbTaskType, "id", id_)
+        if task_type is None:
+            raise MissingDbTaskTypeError(f"Unable to found task type with id {id_!r}")
+
+        return task_type
+
+    async def task_types(self) -> list[AsyncDbTaskType]:
+        """Return all task types."""
+        return await self._types(TaskType, AsyncDbTaskType)
+
+    async def get_or_create_task_type(self, code: str, name: str) -> AsyncDbTaskType:
+        """Create new task type in database, see `Db.get_or_create_task_type`.
+
+        Raises:
+            DbTaskTypeAlreadyExistError
+        """
+        task_type = await self._insert_type(
+            TaskType, AsyncDbTaskType, code=code, name=name, active=True
+        )
+        if task_type is None:
+            raise DbTaskTypeAlreadyExistError(f"Task type {code!r} already exists.")
+
+        return task_type
+
+    async def publish_type(self, code: str) -> AsyncDbPublishType:
+        """Get database publish type from his code.
+
+        Raises:
+            MissingDbPublishTypeError: Given publish type code not found in database.
+        """
+        publish_type = await self._cached_type(
+            PublishType, AsyncDbPublishType, "code", code
+        )
+        if publish_type is None:
+            raise MissingDbPublishTypeError(
+                f"Unable to found publish type with code {code!r}"
+            )
+
+        return publish_type
+
+    async def publish_type_from_id(self, id_: int) -> AsyncDbPublishType:
+        """Get database publish type from his id.
+
+        Raises:
+            MissingDbPublishTypeError: Given publish type id not found in database.
+        """
+        publish_type = await self._cached_type(PublishType, AsyncDbPublishType, "id", id_)
+        if publish_type is None:
+            raise MissingDbPublishTypeError(
+                f"Unable to found publish type with id {id_!r}"
+            )
+
+        return publish_type
+
+    async def publish_types(self) -> list[AsyncDbPublishType]:
+        """Return all publish types."""
+        return await self._types(PublishType, AsyncDbPublishType)
+
+    async def get_or_create_publish_type(
+        self,
+        code: str,
+        file_type: str,
+        extension: str,
+    ) -> AsyncDbPublishType:
+        """Create new publish type in database, see `Db.get_or_create_publish_type`.
+
+        Raises:
+            DbPublishTypeAlreadyExistError
+        """
+        publish_type = await self._insert_type(
+            PublishType,
+            AsyncDbPublishType,
+            code=code,
+            file_type=file_type,
+            extension=extension,
+            active=True,
+        )
+        if publish_type is None:
+            raise DbPublishTypeAlreadyExistError(f"Publish type {code!r} already exists.")
+
+        return publish_type
+
+    async def invalidate_type_cache(self):
+        """Clear cached types and bump database type version.
+
+        Must be called after any write on asset, task or publish type tables.
+        """
+        async with self.session() as session:
+            new_version = await session.run_sync(
+                bump_type_version, self._type_version_key
+            )
+
+        self._type_cache.clear(new_version)
+
+    async def _insert_type(
+        self,
+        model: type[Base],
+        db_type: type[AsyncDbEntity],
+        **values: Any,
+    ) -> AsyncDbEntity | None:
+        async with self.session() as session:
+            found = (await session.scalars(upsert_type(session, model, **values))).first()
+
+        if found is None:
+            return None
+
+        await self.invalidate_type_cache()
+        return db_type(self, found)
+
+    def _valid_type_cache(self) -> TypeCache:
+        cache = self._type_cache
+        if cache.is_expired(self.type_cache_ttl):
+            cache.clear(cache.version)
+
+        return cache
+
+    async def _cached_type(
+        self,
+        model: type[Base],
+        db_type: type[AsyncDbEntity],
+        key: str,
+        value: Any,
+    ) -> AsyncDbEntity | None:
+        cache = self._valid_type_cache()
+        entity = cache.get(model, key, value)
+        if entity is not None:
+            return entity
+
+        async with self.session() as session:
+            found = await session.scalar(select_type(model, key, value))
+
+        if found is None:
+            return None
+
+        entity = db_type(self, found)
+        cache.add(model, entity)
+        return entity
+
+    async def _types(
+        self,
+        model: type[Base],
+        db_type: type[AsyncDbEntity],
+    ) -> list[AsyncDbEntity]:
+        async with self.session() as session:
+            entities = [
+                db_type(self, found) for found in await session.scalars(select(model))
+            ]
+
+        cache = self._valid_type_cache()
+        for entity in entities:
+            cache.add(model, entity)
+
+        return entities
@@ -0,0 +1,133 @@
+"""Async database asset object module."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from tk_db.aio.dbentity import AsyncDbEntity
+from tk_db.aio.dbtask import AsyncDbTask
+from tk_db.aio.dbtasktype import AsyncDbTaskType
+from tk_db.dbasset import select_task
+from tk_db.dbasset import select_tasks
+from tk_db.dbasset import upsert_task
+from tk_db.errors import MissingDbTaskError
+from tk_db.models import Asset
+
+
+if TYPE_CHECKING:
+    from tk_db.aio.db import AsyncDb
+    from tk_db.aio.dbassettype import AsyncDbAssetType
+    from tk_db.aio.dbproject import AsyncDbProject
+
+
+class AsyncDbAsset(AsyncDbEntity):
+    """Async database asset object.
+
+    Args:
+        asset (Asset): Database asset model.
+        asset_type (AsyncDbAssetType): Asset type of asset.
+        project (AsyncDbProject): Project of asset.
+    """
+
+    __slots__ = ("project", "asset_type")
+
+    model = Asset
+
+    def __init__(
+        self,
+        asset: Asset,
+        asset_type: AsyncDbAssetType,
+        project: AsyncDbProject,
+    ):
+        super().__init__(asset)
+        self.project = project
+        self.asset_type = asset_type
+
+    @property
+    def db(self) -> AsyncDb:
+        """Return async database object."""
+        return self.project.db
+
+    @property
+    def is_active(self) -> bool:
+        """Get if asset is active."""
+        return self._bc_entity.active
+
+    async def set_active(self, value: bool):
+        """Set asset active or not."""
+        await self._update(active=value)
+
+    async def task(
+        self, task_type: AsyncDbTaskType | None = None, code: str | None = None
+    ) -> AsyncDbTask:
+        """Get asset task from its type or code.
+
+        Args:
+            task_type (AsyncDbTaskType|None): Optional task type to found asset task.
+            code (str|None): Optional task code to found asset task.
+
+        Returns:
+            AsyncDbTask
+
+        Raises:
+            ValueError: No task_type and code given
+            MissingDbTaskTypeError: No task type found with given code.
+            MissingDbTaskError: No task found on asset with given code or type.
+        """
+        if task_type is None and code is not None:
+            task_type = await self.db.task_type(code)
+
+        if task_type is None:
+            raise ValueError("No code found from given task_type of code.")
+
+        async with self.db.session() as session:
+            found_task = await session.scalar(select_task(self.id, task_type.id))
+
+        if found_task is None:
+            raise MissingDbTaskError(f"Unable to found task {code!r}")
+
+        return AsyncDbTask(found_task, task_type, self)
+
+    async def tasks(self) -> list[AsyncDbTask]:
+        """Get all tasks of asset, see `DbAsset.tasks`.
+
+        Returns:
+            list[AsyncDbTask]
+        """
+        task_types: dict[int, AsyncDbTaskType] = {}
+        tasks = []
+        async with self.db.session() as session:
+            for task in await session.scalars(select_tasks(self.id)):
+                task_type = task_types.get(task.task_type_id)
+                if task_type is None:
+                    task_type = AsyncDbTaskType(self.db, task.task_type)
+                    task_types[task.task_type_id] = task_type
+                tasks.append(AsyncDbTask(task, task_type, self))
+
+        return tasks
+
+    async def get_or_create_task(
+        self,
+        task_type: AsyncDbTaskType | None = None,
+        code: str | None = None,
+    ) -> AsyncDbTask:
+        """Get or create task of given type on asset, see `DbAsset.get_or_create_task`.
+
+        Args:
+            task_type (AsyncDbTaskType): Type of task to create.
+            code (str): Task code of task to create.
+
+        Returns:
+            AsyncDbTask
+
+        Raises:
+            MissingDbTaskTypeError: Raised if given task type is missing.
+        """
+        if task_type is None and code is not None:
+            task_type = await self.db.task_type(code)
+
+        async with self.db.session() as session:
+            insert_query = upsert_task(session, self.id, task_type.id)
+            task = (await session.scalars(insert_query)).one()
+
+        return AsyncDbTask(task, task_type, self)
@@ -0,0 +1,43 @@
+"""Async database asset type object module."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from tk_db.aio.dbentity import AsyncDbEntity
+from tk_db.models import AssetType
+
+
+if TYPE_CHECKING:
+    from tk_db.aio.db import AsyncDb
+
+
+class AsyncDbAssetType(AsyncDbEntity):
+    """Async database asset type object.
+
+    Args:
+        db (AsyncDb): Async database object.
+        asset_type (AssetType): AssetType model object.
+    """
+
+    __slots__ = ("db",)
+
+    model = AssetType
+
+    def __init__(self, db: AsyncDb, asset_type: AssetType):
+        super().__init__(asset_type)
+        self.db = db
+
+    @property
+    def name(self) -> str:
+        """Return asset type name."""
+        return self._bc_entity.name
+
+    def is_active(self) -> bool:
+        """Get if asset type is active."""
+        return self._bc_entity.active
+
+    async def set_active(self, value: bool):
+        """Set asset type active or not."""
+        await self._update(active=value)
+        await self.db.invalidate_type_cache()
@@ -0,0 +1,44 @@
+"""Async database base entity object module."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+from tk_db.dbentity import BaseDbEntity
+
+
+if TYPE_CHECKING:
+    from tk_db.aio.db import AsyncDb
+
+
+class AsyncDbEntity(BaseDbEntity):
+    """Async database entity object.
+
+    Column values are served from the loaded row like `DbEntity`, database
+    reads and writes are coroutines.
+    """
+
+    __slots__ = ()
+
+    db: AsyncDb
+
+    async def refresh(self):
+        """Reload entity row from database."""
+        async with self.db.session() as session:
+            entity = await session.get(self.model, self.id, populate_existing=True)
+
+        if entity is None:
+            raise ValueError(f"{self!r} no longer exists in database.")
+
+        self._bc_entity = entity
+
+    async def _update(self, **values: Any):
+        """Write given column values to entity row and to loaded row."""
+        async with self.db.session() as session:
+            entity = await session.get(self.model, self.id)
+            self._track_rollback(session, entity, values)
+            for column, value in values.items():
+                setattr(entity, column, value)
+
+        self._bc_entity = entity
@@ -0,0 +1,245 @@
+"""Async database project object module."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+from sqlalchemy.orm.attributes import set_committed_value
+
+from tk_db.aio.dbasset import AsyncDbAsset
+from tk_db.aio.dbassettype import AsyncDbAssetType
+from tk_db.aio.dbentity import AsyncDbEntity
+from tk_db.aio.dbpublish import AsyncDbPublish
+from tk_db.aio.dbtask import AsyncDbTask
+from tk_db.aio.dbtasktype import AsyncDbTaskType
+from tk_db.dbproject import select_asset
+from tk_db.dbproject import select_assets
+from tk_db.dbproject import select_latest_publishes
+from tk_db.dbproject import select_tree
+from tk_db.dbproject import update_metadata
+from tk_db.dbproject import upsert_asset
+from tk_db.errors import DbAssetAlreadyExistError
+from tk_db.errors import MissingDbAssetError
+from tk_db.models import Project
+from tk_db.models import Publish
+from tk_db.pathresolver import PathResolver
+from tk_db.snapshot import split_snapshot
+
+
+if TYPE_CHECKING:
+    from tk_db.aio.db import AsyncDb
+
+
+class AsyncDbProject(AsyncDbEntity):
+    """Async database project object.
+
+    Args:
+        db (AsyncDb): Async database object.
+        project (Project): Database project model.
+    """
+
+    __slots__ = ("db", "_path_resolver")
+
+    model = Project
+
+    def __init__(self, db: AsyncDb, project: Project):
+        super().__init__(project)
+        self.db = db
+        self._path_resolver: PathResolver | None = None
+
+    @property
+    def name(self) -> str:
+        """Return project name."""
+        return self._bc_entity.name
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        """Return project metadata, see `DbProject.metadata`."""
+        return self._bc_entity.metadata_
+
+    async def set_code(self, value: str):
+        """Set project code."""
+        await self._update(code=value)
+
+    async def set_name(self, value: str):
+        """Set project name."""
+        await self._update(name=value)
+
+    async def set_metadata(self, value: dict[str, Any]):
+        """Set metadata to project.
+
+        Args:
+            value (dict[str, Any]): Project metadata like environment, root path ect.
+        """
+        assert isinstance(value, dict)
+        await self._update(metadata_=value)
+
+    async def metadata_update(self, value: dict[str, Any]):
+        """Update top level keys of project metadata, in database.
+
+        Args:
+            value (dict[str, Any]): Project metadata like environment, root path ect.
+        """
+        assert isinstance(value, dict)
+        async with self.db.session() as session:
+            update_query = update_metadata(session, self.id, value)
+            self._track_rollback(session, self._bc_entity, ["metadata_"])
+            metadata = await session.scalar(update_query)
+
+        set_committed_value(self._bc_entity, "metadata_", metadata)
+
+    def path_resolver(self) -> PathResolver:
+        """Return publish path resolver of project, see `DbProject.path_resolver`.
+
+        Raises:
+            ValueError: Project metadata has no root path.
+        """
+        resolver = self._path_resolver
+        root_path = self.metadata.get("env", {}).get("TK_PROJECT_PATH")
+        if resolver is None or resolver.root_path != root_path:
+            resolver = PathResolver.from_metadata(self.metadata)
+            self._path_resolver = resolver
+
+        return resolver
+
+    def is_active(self) -> bool:
+        """Get if project is active."""
+        return self._bc_entity.active
+
+    async def set_active(self, value: bool):
+        """Set project active or not."""
+        await self._update(active=value)
+
+    async def asset(self, asset_type: AsyncDbAssetType, asset_code: str) -> AsyncDbAsset:
+        """Get specific asset in project with given asset type and code.
+
+        Args:
+            asset_type (AsyncDbAssetType): Asset type of looking asset.
+            asset_code (str): Asset code of looking asset.
+
+        Raises:
+            MissingDbAssetError: No asset with given asset type and code in project.
+
+        Returns:
+            AsyncDbAsset
+        """
+        asset_query = select_asset(self.id, asset_type.id, asset_code)
+        async with self.db.session() as session:
+            found_asset = await session.scalar(asset_query)
+
+        if found_asset is None:
+            raise MissingDbAssetError
+
+        return AsyncDbAsset(found_asset, asset_type, self)
+
+    async def assets(self) -> list[AsyncDbAsset]:
+        """Return assets in project, see `DbProject.assets`."""
+        asset_types: dict[int, AsyncDbAssetType] = {}
+        assets = []
+        async with self.db.session() as session:
+            for asset in await session.scalars(select_assets(self.id)):
+                asset_type = asset_types.get(asset.asset_type_id)
+                if asset_type is None:
+                    asset_type = AsyncDbAssetType(self.db, asset.asset_type)
+                    asset_types[asset.asset_type_id] = asset_type
+                assets.append(AsyncDbAsset(asset, asset_type, self))
+
+        return assets
+
+    async def tree(self) -> dict[AsyncDbAsset, dict[AsyncDbTask, list[AsyncDbPublish]]]:
+        """Return the whole project hierarchy, see `DbProject.tree`.
+
+        Returns:
+            dict[AsyncDbAsset, dict[AsyncDbTask, list[AsyncDbPublish]]]
+        """
+        asset_types: dict[int, AsyncDbAssetType] = {}
+        task_types: dict[int, AsyncDbTaskType] = {}
+        tree = {}
+        async with self.db.session() as session:
+            for asset in await session.scalars(select_tree(self.id)):
+                asset_type = asset_types.get(asset.asset_type_id)
+                if asset_type is None:
+                    asset_type = AsyncDbAssetType(self.db, asset.asset_type)
+                    asset_types[asset.asset_type_id] = asset_type
+                db_asset = AsyncDbAsset(asset, asset_type, self)
+
+                tasks = {}
+                for task in asset.task:
+                    task_type = task_types.get(task.task_type_id)
+                    if task_type is None:
+                        task_type = AsyncDbTaskType(self.db, task.task_type)
+                        task_types[task.task_type_id] = task_type
+                    db_task = AsyncDbTask(task, task_type, db_asset)
+                    tasks[db_task] = [
+                        AsyncDbPublish(db_task, publish) for publish in task.publish
+                    ]
+
+                tree[db_asset] = tasks
+
+        return tree
+
+    async def latest_publishes(self, release: str | None = None) -> list[AsyncDbPublish]:
+        """Return the latest active publish of every publish series in project.
+
+        See `DbProject.latest_publishes`.
+
+        Args:
+            release (str|None): Only return publishes of given release if any.
+
+        Returns:
+            list[AsyncDbPublish]
+        """
+        publish_query = select_latest_publishes(self.id, release)
+        async with self.db.session() as session:
+            rows = (await session.execute(publish_query)).all()
+
+        assets: dict[int, AsyncDbAsset] = {}
+        tasks: dict[int, AsyncDbTask] = {}
+        db_publishes = []
+        for row in rows:
+            publish, task_model, asset_model = split_snapshot(Publish, row)
+            task = tasks.get(publish.task_id)
+            if task is None:
+                asset = assets.get(task_model.asset_id)
+                if asset is None:
+                    asset_type = await self.db.asset_type_from_id(
+                        asset_model.asset_type_id
+                    )
+                    asset = AsyncDbAsset(asset_model, asset_type, self)
+                    assets[asset.id] = asset
+                task_type = await self.db.task_type_from_id(task_model.task_type_id)
+                task = AsyncDbTask(task_model, task_type, asset)
+                tasks[task.id] = task
+            db_publishes.append(AsyncDbPublish(task, publish))
+
+        return db_publishes
+
+    async def get_or_create_asset(
+        self,
+        asset_code: str,
+        asset_type: AsyncDbAssetType,
+    ) -> AsyncDbAsset:
+        """Create new asset in database, see `DbProject.get_or_create_asset`.
+
+        Args:
+            asset_code (str): Asset code.
+            asset_type (AsyncDbAssetType): Asset type of asset.
+
+        Raises:
+            DbAssetAlreadyExistError
+
+        Returns:
+            AsyncDbAsset
+        """
+        async with self.db.session() as session:
+            insert_query = upsert_asset(session, self.id, asset_type.id, asset_code)
+            asset = (await session.scalars(insert_query)).first()
+
+        if asset is None:
+            raise DbAssetAlreadyExistError(
+                f"Asset '{asset_type.code}_{asset_code}' "
+                f"already exists in project {self.code!r}."
+            )
+
+        return AsyncDbAsset(asset, asset_type, self)
@@ -0,0 +1,74 @@
+"""Async database publish object module."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from tk_db.aio.dbentity import AsyncDbEntity
+from tk_db.models import Publish
+
+
+if TYPE_CHECKING:
+    from tk_db.aio.db import AsyncDb
+    from tk_db.aio.dbpublishtype import AsyncDbPublishType
+    from tk_db.aio.dbtask import AsyncDbTask
+
+
+class AsyncDbPublish(AsyncDbEntity):
+    """Async database publish object.
+
+    Args:
+        task (AsyncDbTask): Async database task object.
+        publish (Publish): Publish model object.
+    """
+
+    __slots__ = ("task",)
+
+    model = Publish
+
+    def __init__(self, task: AsyncDbTask, publish: Publish):
+        super().__init__(publish)
+        self.task = task
+
+    @property
+    def db(self) -> AsyncDb:
+        """Return async database object."""
+        return self.task.db
+
+    @property
+    def path(self) -> str:
+        """Return publish file path."""
+        return self._bc_entity.path
+
+    @property
+    def version(self) -> int:
+        """Return publish version."""
+        return self._bc_entity.version
+
+    @property
+    def version_name(self) -> str:
+        """Return publish version as fancy name."""
+        return f"{self.release[0]}{self.version:03d}"
+
+    @property
+    def release(self) -> str:
+        """Return if publish is release or work."""
+        return self._bc_entity.release
+
+    @property
+    def size(self) -> int:
+        """Return size of publish file."""
+        return self._bc_entity.size
+
+    @property
+    def is_active(self) -> bool:
+        """Return if publish is active or not."""
+        return self._bc_entity.active
+
+    async def publish_type(self) -> AsyncDbPublishType:
+        """Return publish type object."""
+        return await self.db.publish_type_from_id(self._bc_entity.publish_type_id)
+
+    async def set_active(self, value: bool):
+        """Set publish active or not."""
+        await self._update(active=value)
@@ -0,0 +1,48 @@
+"""Async database publish type object module."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from tk_db.aio.dbentity import AsyncDbEntity
+from tk_db.models import PublishType
+
+
+if TYPE_CHECKING:
+    from tk_db.aio.db import AsyncDb
+
+
+class AsyncDbPublishType(AsyncDbEntity):
+    """Async database publish type object.
+
+    Args:
+        db (AsyncDb): Async database object.
+        publish_type (PublishType): Publish type model object.
+    """
+
+    __slots__ = ("db",)
+
+    model = PublishType
+
+    def __init__(self, db: AsyncDb, publish_type: PublishType):
+        super().__init__(publish_type)
+        self.db = db
+
+    @property
+    def file_type(self) -> str:
+        """Return publish type file type."""
+        return self._bc_entity.file_type
+
+    @property
+    def extension(self) -> str:
+        """Return publish type extension."""
+        return self._bc_entity.extension
+
+    def is_active(self) -> bool:
+        """Get if publish type is active."""
+        return self._bc_entity.active
+
+    async def set_active(self, value: bool):
+        """Set publish type active or not."""
+        await self._update(active=value)
+        await self.db.invalidate_type_cache()
@@ -0,0 +1,247 @@
+"""Async database task object module."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy.exc import IntegrityError
+
+from tk_db.aio.dbentity import AsyncDbEntity
+from tk_db.aio.dbpublish import AsyncDbPublish
+from tk_db.dbtask import PublishSpec
+from tk_db.dbtask import insert_publishes
+from tk_db.dbtask import select_last_active_publish
+from tk_db.dbtask import select_last_version
+from tk_db.dbtask import select_publish
+from tk_db.dbtask import select_publishes
+from tk_db.errors import DbPublishVersionConflictError
+from tk_db.errors import MissingDbPublishError
+from tk_db.models import Publish
+from tk_db.models import Task
+from tk_db.snapshot import snapshot_type
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from tk_db.aio.db import AsyncDb
+    from tk_db.aio.dbasset import AsyncDbAsset
+    from tk_db.aio.dbpublishtype import AsyncDbPublishType
+    from tk_db.aio.dbtasktype import AsyncDbTaskType
+    from tk_db.pathresolver import PathResolver
+
+
+class AsyncDbTask(AsyncDbEntity):
+    """Async database task object.
+
+    Args:
+        task (Task): Task model object.
+        task_type (AsyncDbTaskType): Type of task.
+        asset (AsyncDbAsset): Asset of task.
+    """
+
+    __slots__ = ("asset", "task_type")
+
+    model = Task
+
+    def __init__(self, task: Task, task_type: AsyncDbTaskType, asset: AsyncDbAsset):
+        super().__init__(task)
+        self.asset = asset
+        self.task_type = task_type
+
+    @property
+    def db(self) -> AsyncDb:
+        """Return async database object."""
+        return self.asset.db
+
+    @property
+    def code(self) -> str:
+        """Return task type code."""
+        return self.task_type.code
+
+    @property
+    def name(self) -> str:
+        """Return task type name."""
+        return self.task_type.name
+
+    @property
+    def is_active(self) -> bool:
+        """Return if task is active or not."""
+        return self._bc_entity.active
+
+    async def set_active(self, value: bool):
+        """Set task active or not."""
+        await self._update(active=value)
+
+    async def publish(
+        self,
+        code: str,
+        publish_type: AsyncDbPublishType,
+        release: str,
+        version: int,
+    ) -> AsyncDbPublish:
+        """Get specific publish form task.
+
+        Args:
+            code (str): Publish code.
+            publish_type (AsyncDbPublishType): Type of publish.
+            release (str): Is release or work.
+            version (int): Publish version.
+
+        Returns:
+            AsyncDbPublish
+
+        Raises:
+            MissingDbPublishError: Raised when publish is missing in database.
+        """
+        publish_query = select_publish(self.id, code, publish_type.id, release, version)
+        async with self.db.session() as session:
+            publish = await session.scalar(publish_query)
+
+        if publish is None:
+            raise MissingDbPublishError(
+                f"Unable to found publish {release} {code!r} type "
+                f"{publish_type.code!r} version {version!r} in database."
+            )
+
+        return AsyncDbPublish(self, publish)
+
+    async def publishes(
+        self,
+        code: str | None = None,
+        publish_type: AsyncDbPublishType | None = None,
+        release: str | None = None,
+    ) -> list[AsyncDbPublish]:
+        """Get list of publishes with given params, as read-only row snapshots."""
+        publish_type_id = publish_type.id if publish_type else None
+        publish_query = select_publishes(self.id, code, publish_type_id, release)
+        snapshot = snapshot_type(Publish)
+        async with self.db.session() as session:
+            rows = await session.execute(publish_query)
+            return [AsyncDbPublish(self, snapshot._make(row)) for row in rows]
+
+    async def last_active_publish(
+        self, code: str, publish_type: AsyncDbPublishType, release: str
+    ) -> AsyncDbPublish:
+        """Get the last active publish of given publish code/type.
+
+        Args:
+            code (str): Publish code.
+            publish_type (AsyncDbPublishType): Type of publish.
+            release (str): Is release or work.
+
+        Returns:
+            AsyncDbPublish
+
+        Raises:
+            MissingDbPublishError: No active publish found.
+        """
+        publish_query = select_last_active_publish(
+            self.id, code, publish_type.id, release
+        )
+        async with self.db.session() as session:
+            publish = await session.scalar(publish_query)
+
+        if publish is None:
+            raise MissingDbPublishError(
+                f"No active {release} publish {code!r} type {publish_type.code!r}."
+            )
+
+        return AsyncDbPublish(self, publish)
+
+    async def last_version(
+        self, code: str, publish_type: AsyncDbPublishType, release: str
+    ) -> int:
+        """Get the last version of given publish code/type, active or not.
+
+        Args:
+            code (str): Publish code.
+            publish_type (AsyncDbPublishType): Type of publish.
+            release (str): Is release or work.
+
+        Returns:
+            int: Last version, 0 if no publish.
+        """
+        version_query = select_last_version(self.id, code, publish_type.id, release)
+        async with self.db.session() as session:
+            version = await session.scalar(version_query)
+
+        return version or 0
+
+    async def create_next_publish(
+        self,
+        code: str,
+        publish_type: AsyncDbPublishType,
+        release: str,
+        retries: int = 3,
+    ) -> AsyncDbPublish:
+        """Create publish at next version, see `create_publishes_bulk`.
+
+        Args:
+            code (str): Publish code.
+            publish_type (AsyncDbPublishType): Type of publish.
+            release (str): Is release or work.
+            retries (int): Number of retries when insert conflicts.
+
+        Returns:
+            AsyncDbPublish
+        """
+        spec = PublishSpec(code, publish_type, release)
+        return (await self.create_publishes_bulk([spec], retries))[0]
+
+    async def create_publishes_bulk(
+        self,
+        specs: Iterable[PublishSpec],
+        retries: int = 3,
+    ) -> list[AsyncDbPublish]:
+        """Create many publishes at their next versions in a single transaction.
+
+        Same allocation as `DbTask.create_publishes_bulk`, concurrent sync and
+        async publishers never allocate the same version.
+
+        Args:
+            specs (Iterable[PublishSpec]): Publishes to create.
+            retries (int): Number of retries when insert conflicts.
+
+        Returns:
+            list[AsyncDbPublish]: Created publishes, in specs order.
+
+        Raises:
+            DbPublishVersionConflictError: Insert still conflicts after retries,
+                or conflicts inside an `AsyncDb.transaction` block.
+        """
+        specs = list(specs)
+        if not specs:
+            return []
+
+        path_resolver = self.asset.project.path_resolver()
+        for _ in range(retries + 1):
+            publishes = await self._insert_publishes(specs, path_resolver)
+            if publishes is not None:
+                return publishes
+
+        raise DbPublishVersionConflictError(
+            f"Unable to allocate publish versions on {self!r} after {retries} retries."
+        )
+
+    async def _insert_publishes(
+        self,
+        specs: list[PublishSpec],
+        path_resolver: PathResolver,
+    ) -> list[AsyncDbPublish] | None:
+        path_codes = (self.asset.asset_type.code, self.asset.code, self.name)
+        async with self.db.session() as session:
+            try:
+                publishes = await session.run_sync(
+                    insert_publishes, self.id, path_codes, specs, path_resolver
+                )
+            except IntegrityError as error:
+                if self.db.in_transaction():
+                    # Outer transaction is aborted, it can not be retried here.
+                    raise DbPublishVersionConflictError(
+                        f"Publish versions of {self!r} conflict in transaction."
+                    ) from error
+                await session.rollback()
+                return None
+
+        return [AsyncDbPublish(self, publish) for publish in publishes]
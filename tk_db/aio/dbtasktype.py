@@ -0,0 +1,43 @@
+"""Async database task type object module."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from tk_db.aio.dbentity import AsyncDbEntity
+from tk_db.models import TaskType
+
+
+if TYPE_CHECKING:
+    from tk_db.aio.db import AsyncDb
+
+
+class AsyncDbTaskType(AsyncDbEntity):
+    """Async database task type object.
+
+    Args:
+        db (AsyncDb): Async database object.
+        task_type (TaskType): TaskType model object.
+    """
+
+    __slots__ = ("db",)
+
+    model = TaskType
+
+    def __init__(self, db: AsyncDb, task_type: TaskType):
+        super().__init__(task_type)
+        self.db = db
+
+    @property
+    def name(self) -> str:
+        """Return task type name."""
+        return self._bc_entity.name
+
+    def is_active(self) -> bool:
+        """Get if task type is active."""
+        return self._bc_entity.active
+
+    async def set_active(self, value: bool):
+        """Set task type active or not."""
+        await self._update(active=value)
+        await self.db.invalidate_type_cache()
@@ -0,0 +1,82 @@
+"""Async database engine module."""
+
+from __future__ import annotations
+
+import threading
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from tk_db.engine import get_engine
+from tk_db.engine import set_sqlite_pragmas
+
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+# Async driver of each supported database backend.
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+_async_engines: dict[str, AsyncEngine] = {}
+_async_engines_lock = threading.Lock()
+
+
+def async_url(url: str) -> str:
+    """Return given database url using the async driver of its backend.
+
+    Args:
+        url (str): Database url, e.g. `sqlite:////path/to/test_alchemy.db`.
+
+    Returns:
+        str
+
+    Raises:
+        NotImplementedError: Database backend has no supported async driver.
+    """
+    parsed_url = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed_url.get_backend_name())
+    if driver is None:
+        raise NotImplementedError(f"No async driver for database url {url!r}.")
+
+    return parsed_url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def get_async_engine(
+    url: str,
+    pool_size: int | None = None,
+    sqlite_pragmas: dict[str, Any] | None = None,
+) -> AsyncEngine:
+    """Get pooled async engine of given database url, shared by the whole process.
+
+    Database schema is migrated through the sync engine of same url on first
+    call, see `tk_db.engine.get_engine`.
+
+    Args:
+        url (str): Sync database url, async driver is chosen from its backend.
+        pool_size (int|None): Number of pooled connections, SQLAlchemy default
+            if None.
+        sqlite_pragmas (dict[str, Any]|None): Pragmas set on every SQLite
+            connection, merged over `DEFAULT_SQLITE_PRAGMAS`.
+
+    Returns:
+        AsyncEngine
+    """
+    with _async_engines_lock:
+        engine = _async_engines.get(url)
+        if engine is None:
+            get_engine(url, pool_size, sqlite_pragmas)
+            kwargs = {}
+            if pool_size is not None:
+                kwargs["pool_size"] = pool_size
+            engine = create_async_engine(async_url(url), **kwargs)
+            set_sqlite_pragmas(engine.sync_engine, sqlite_pragmas)
+            _async_engines[url] = engine
+
+    return engine
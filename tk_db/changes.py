@@ -0,0 +1,132 @@
+"""Entity change log module.
+
+Every insert, update and delete of entity tables is recorded in `change_log`
+by triggers in the transaction of the write, see `tk_db.triggers`. Each
+record gets a new revision, clients remember last revision they read and poll
+changes since it::
+
+    revision = db.revision()
+    ...
+    changes = db.changes_since(revision)
+    if changes:
+        revision = changes[-1].revision
+
+Log grows with every write, `prune_changes` drops old records. Reading changes
+since a pruned revision raises `DbChangesPrunedError`: client missed changes
+and must reload its entities.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+
+from sqlalchemy import BigInteger
+from sqlalchemy import String
+from sqlalchemy import cast
+from sqlalchemy import delete
+from sqlalchemy import func
+from sqlalchemy import select
+
+from tk_db.errors import DbChangesPrunedError
+from tk_db.models import ChangeLog
+from tk_db.models import Meta
+
+
+if TYPE_CHECKING:
+    from sqlalchemy import Select
+    from sqlalchemy.orm import Session
+
+
+# Meta key of last pruned revision.
+PRUNED_REVISION_KEY = "change_log_pruned"
+
+
+class Change(NamedTuple):
+    """Entity write recorded in change log."""
+
+    revision: int
+    table: str  # Entity table name, like `publish`.
+    id: int  # Entity id.
+    op: str  # `insert`, `update` or `delete`.
+
+
+def last_revision(session: Session) -> int:
+    """Return revision of last recorded change, 0 if none."""
+    revision = session.scalar(_settled(session, select(func.max(ChangeLog.revision))))
+    if revision is None:
+        return pruned_revision(session)
+    return revision
+
+
+def pruned_revision(session: Session) -> int:
+    """Return last pruned revision, 0 if change log was never pruned."""
+    pruned = session.get(Meta, PRUNED_REVISION_KEY)
+    return 0 if pruned is None else pruned.value
+
+
+def changes_since(
+    session: Session, revision: int, limit: int | None = None
+) -> list[Change]:
+    """Return changes recorded after given revision, oldest first.
+
+    Args:
+        session (Session): Session to read changes in.
+        revision (int): Last revision already read, 0 for every change.
+        limit (int|None): Maximum number of changes, all if None.
+
+    Returns:
+        list[Change]
+
+    Raises:
+        DbChangesPrunedError: Changes after revision were pruned.
+    """
+    pruned = pruned_revision(session)
+    if revision < pruned:
+        raise DbChangesPrunedError(
+            f"Changes since revision {revision} were pruned up to revision {pruned}."
+        )
+
+    query = (
+        select(
+            ChangeLog.revision, ChangeLog.table_name, ChangeLog.entity_id, ChangeLog.op
+        )
+        .where(ChangeLog.revision > revision)
+        .order_by(ChangeLog.revision)
+        .limit(limit)
+    )
+    return [Change(*row) for row in session.execute(_settled(session, query))]
+
+
+def prune_changes(session: Session, revision: int):
+    """Delete changes up to given revision included from change log.
+
+    Args:
+        session (Session): Session to delete changes in.
+        revision (int): Last revision to delete, clamped to last recorded one.
+    """
+    revision = min(revision, last_revision(session))
+    pruned = session.get(Meta, PRUNED_REVISION_KEY)
+    if pruned is None:
+        pruned = Meta(key=PRUNED_REVISION_KEY, value=0)
+        session.add(pruned)
+    if revision <= pruned.value:
+        return
+
+    session.execute(delete(ChangeLog).where(ChangeLog.revision <= revision))
+    pruned.value = revision
+
+
+def _settled(session: Session, query: Select) -> Select:
+    """Filter query on changes no running transaction can precede anymore.
+
+    SQLite writers are serialized, revisions commit in order. PostgreSQL
+    writers run concurrently and a revision can commit after a later one:
+    changes are only served once every transaction older than theirs ended,
+    so pollers do not skip a revision committed late.
+    """
+    if session.get_bind().dialect.name != "postgresql":
+        return query
+
+    xmin = func.pg_snapshot_xmin(func.pg_current_snapshot())
+    return query.where(ChangeLog.xact_id < cast(cast(xmin, String), BigInteger))
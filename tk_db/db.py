@@ -2,15 +2,27 @@
 
 from __future__ import annotations
 
+import contextlib
 import os
+import threading
 
-from sqlalchemy import create_engine
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import ClassVar
+
+from sqlalchemy import select
 from sqlalchemy.orm import sessionmaker
 
+from tk_db.changes import changes_since
+from tk_db.changes import last_revision
+from tk_db.changes import prune_changes
 from tk_db.dbassettype import DbAssetType
+from tk_db.dbentity import rollback_entities
 from tk_db.dbproject import DbProject
 from tk_db.dbpublishtype import DbPublishType
 from tk_db.dbtasktype import DbTaskType
+from tk_db.dialect import upsert
+from tk_db.engine import get_engine
 from tk_db.errors import DbAssetTypeAlreadyExistsError
 from tk_db.errors import DbProjectAlreadyExistsError
 from tk_db.errors import DbPublishTypeAlreadyExistError
@@ -20,24 +32,178 @@ from tk_db.errors import MissingDbProjectError
 from tk_db.errors import MissingDbPublishTypeError
 from tk_db.errors import MissingDbTaskTypeError
 from tk_db.models import AssetType
-from tk_db.models import Base
+from tk_db.models import Meta
 from tk_db.models import Project
 from tk_db.models import PublishType
 from tk_db.models import TaskType
+from tk_db.pathparser import parse_publish_paths
+from tk_db.query import PublishQuery
+from tk_db.search import SEARCH_KINDS
+from tk_db.search import SearchResult
+from tk_db.search import search
+from tk_db.typecache import TypeCache
 
 
-class Db:
-    """Database object."""
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+    from sqlalchemy import Insert
+    from sqlalchemy import Select
+    from sqlalchemy.orm import Session
+
+    from tk_db.changes import Change
+    from tk_db.dbentity import DbEntity
+    from tk_db.dbpublish import DbPublish
+    from tk_db.models import Base
+
+
+DB_URL_ENV = "TK_DB_URL"
+DB_POOL_SIZE_ENV = "TK_DB_POOL_SIZE"
+DEFAULT_DB_URL = f"sqlite:///{os.path.dirname(__file__)}/test_alchemy.db"
+# Meta key of type tables version, bumped on each type write.
+TYPE_VERSION_KEY = "type_version"
+
+
+def upsert_project(session: Session, code: str, name: str) -> Insert:
+    """Return statement inserting a project and returning it, nothing if it exists."""
+    return (
+        upsert(session, Project)
+        .values(code=code, name=name, metadata_={}, active=True)
+        .on_conflict_do_nothing(index_elements=["code"])
+        .returning(Project)
+    )
 
-    _db_path = f"sqlite:///{os.path.dirname(__file__)}/test_alchemy.db"
 
-    def __init__(self):
-        engine = create_engine(self._db_path)
-        self.Session = sessionmaker(engine)
-        Base.metadata.create_all(bind=engine)
+def upsert_type(session: Session, model: type[Base], **values: Any) -> Insert:
+    """Return statement inserting a type and returning it, nothing if it exists."""
+    return (
+        upsert(session, model)
+        .values(**values)
+        .on_conflict_do_nothing(index_elements=["code"])
+        .returning(model)
+    )
+
+
+def select_type(model: type[Base], key: str, value: Any) -> Select:
+    """Return query of a type from his code or id."""
+    return select(model).where(getattr(model, key) == value)
+
+
+def bump_type_version(session: Session, key: str = TYPE_VERSION_KEY) -> int:
+    """Increment database type version in session and return it.
+
+    Shared by sync and async databases, async ones run it with
+    `AsyncSession.run_sync`.
+    """
+    version = session.get(Meta, key)
+    if version is None:
+        version = Meta(key=key, value=0)
+        session.add(version)
+    version.value += 1
+    return version.value
+
+
+class Db:
+    """Database object.
+
+    Engine is pooled and shared by every `Db` of the process using the same url,
+    database schema is only migrated when its stored version is outdated.
+
+    Asset, task and publish types are cached process wide. Cache is
+    invalidated by type writes made from this process, use `type_cache_ttl`
+    and/or `type_cache_versioned` when other processes write in same database.
+
+    Args:
+        url (str|None): Database url, `TK_DB_URL` environment variable or
+            package SQLite database if None.
+        pool_size (int|None): Number of pooled connections,
+            `TK_DB_POOL_SIZE` environment variable if None.
+        sqlite_pragmas (dict[str, Any]|None): Pragmas overriding
+            `tk_db.engine.DEFAULT_SQLITE_PRAGMAS` on SQLite connections.
+        type_cache_ttl (float|None): Seconds after which cached types are
+            reloaded from database, never if None.
+        type_cache_versioned (bool): Check database type version stamp before
+            each cached lookup, reload cache when another process changed types.
+    """
+
+    _default_url = DEFAULT_DB_URL
+    _type_caches: ClassVar[dict[str, TypeCache]] = {}  # Process wide, by database url.
+    _type_version_key = TYPE_VERSION_KEY
+
+    def __init__(
+        self,
+        url: str | None = None,
+        pool_size: int | None = None,
+        sqlite_pragmas: dict[str, Any] | None = None,
+        type_cache_ttl: float | None = None,
+        type_cache_versioned: bool = False,
+    ):
+        if url is None:
+            url = os.environ.get(DB_URL_ENV, self._default_url)
+        if pool_size is None and os.environ.get(DB_POOL_SIZE_ENV):
+            pool_size = int(os.environ[DB_POOL_SIZE_ENV])
+
+        self.url = url
+        self.engine = get_engine(url, pool_size, sqlite_pragmas)
+        self.Session = sessionmaker(self.engine, expire_on_commit=False)
+        self._local = threading.local()  # Current transaction session by thread.
+
+        self.type_cache_ttl = type_cache_ttl
+        self.type_cache_versioned = type_cache_versioned
+        self._type_cache = self._type_caches.setdefault(url, TypeCache())
 
     def __repr__(self):
-        return f"Db({self._db_path})"
+        return f"Db({self.url})"
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[Session]:
+        """Run every entity read and write of the block in one session and commit.
+
+        Entity accessors reuse the transaction session of their thread instead
+        of opening their own, nested transactions are merged into the outer one.
+        Nothing is committed if the block raises.
+
+        Yields:
+            Session: Transaction session.
+        """
+        session = getattr(self._local, "session", None)
+        if session is not None:
+            yield session
+            return
+
+        with self.Session() as session:
+            self._local.session = session
+            try:
+                yield session
+                session.commit()
+            except BaseException:
+                # Types cached during transaction may have been rolled back.
+                self._type_cache.clear(self._type_cache.version)
+                rollback_entities(session)
+                raise
+            finally:
+                self._local.session = None
+
+    def in_transaction(self) -> bool:
+        """Return if current thread runs in a `transaction` block."""
+        return getattr(self._local, "session", None) is not None
+
+    @contextlib.contextmanager
+    def session(self) -> Iterator[Session]:
+        """Get session of current transaction, or a new one committed on exit.
+
+        Yields:
+            Session
+        """
+        session = getattr(self._local, "session", None)
+        if session is not None:
+            yield session
+            return
+
+        with self.Session() as session:
+            yield session
+            session.commit()
 
     def project(self, code: str) -> DbProject:
         """Get Database project from his code.
@@ -51,7 +217,7 @@ class Db:
         Raises:
             MissingDbProjectError: Given project code not found in database.
         """
-        with self.Session() as session:
+        with self.session() as session:
             project_query = session.query(Project).where(Project.code == code)
             found_project = project_query.first()
 
@@ -66,16 +232,107 @@ class Db:
         Returns:
             list[DbProject]
         """
-        with self.Session() as session:
+        with self.session() as session:
             project_query = session.query(Project)
             projects = [DbProject(self, project) for project in project_query]
 
         return projects
 
+    def publishes_from_paths(self, paths: Iterable[str]) -> dict[str, DbPublish]:
+        """Resolve publish file paths to their publishes.
+
+        Paths are first matched against the publish path template, others are
+        skipped without query. Projects of matching paths are loaded in one
+        query, then publishes are resolved by `DbProject.publishes_from_paths`.
+
+        Args:
+            paths (Iterable[str]): File paths, e.g. from a directory scan.
+
+        Returns:
+            dict[str, DbPublish]: Publishes by path, missing publishes are skipped.
+        """
+        project_paths: dict[str, list[str]] = {}
+        for path, info in parse_publish_paths(paths).items():
+            project_paths.setdefault(info.project, []).append(path)
+
+        publishes = {}
+        if not project_paths:
+            return publishes
+
+        with self.session() as session:
+            project_query = session.query(Project).where(Project.code.in_(project_paths))
+            for project in project_query:
+                db_project = DbProject(self, project)
+                publishes.update(
+                    db_project.publishes_from_paths(project_paths[project.code])
+                )
+
+        return publishes
+
+    def publish_query(self) -> PublishQuery:
+        """Return an unfiltered publish query on database, see `PublishQuery`."""
+        return PublishQuery(self)
+
+    def search(
+        self,
+        text: str,
+        kinds: Iterable[str] = tuple(SEARCH_KINDS),
+        limit: int = 50,
+    ) -> list[SearchResult]:
+        """Search assets and publishes which code contains given text.
+
+        Served by trigram indexes, only a bounded number of matches is ranked,
+        see `tk_db.search`.
+
+        Args:
+            text (str): Text to look for in codes, case insensitive.
+            kinds (Iterable[str]): Kinds of entities to search, `asset`, `publish`.
+            limit (int): Maximum number of results.
+
+        Returns:
+            list[SearchResult]: Best results first, exact codes then prefixes.
+        """
+        with self.session() as session:
+            return search(session, text, kinds, limit)
+
+    def revision(self) -> int:
+        """Return revision of last entity change, starting point of `changes_since`."""
+        with self.session() as session:
+            return last_revision(session)
+
+    def changes_since(self, revision: int, limit: int | None = None) -> list[Change]:
+        """Return entity changes recorded after given revision, oldest first.
+
+        Changes are written by triggers in the transaction of each entity write,
+        see `tk_db.changes`. Poll with revision of last change read.
+
+        Args:
+            revision (int): Last revision already read, see `revision`.
+            limit (int|None): Maximum number of changes, all if None.
+
+        Returns:
+            list[Change]
+
+        Raises:
+            DbChangesPrunedError: Changes after revision were pruned, entities
+                must be reloaded.
+        """
+        with self.session() as session:
+            return changes_since(session, revision, limit)
+
+    def prune_changes(self, revision: int):
+        """Delete entity changes up to given revision included from change log.
+
+        Clients polling from an older revision get `DbChangesPrunedError`.
+        """
+        with self.session() as session:
+            prune_changes(session, revision)
+
     def create_project(self, code: str, name: str) -> DbProject:
         """Create new project in database project table.
 
-        If given code:name already exist in database, return it.
+        Project is inserted with a single `INSERT ... ON CONFLICT DO NOTHING`
+        statement, safe when several processes create the same project.
 
         Args:
             code (str): Project code.
@@ -87,20 +344,15 @@ class Db:
         Returns:
             DbProject
         """
-        try:
-            self.project(code)
-        except MissingDbProjectError:
-            with self.Session() as session:
-                project_obj = Project(code=code, name=name, metadata_="{}", active=True)
+        with self.session() as session:
+            project = session.scalars(upsert_project(session, code, name)).first()
 
-                session.add(project_obj)
-                session.commit()
-        else:
+        if project is None:
             raise DbProjectAlreadyExistsError(
                 f"Project {code!r} - {name!r} already exist."
             )
 
-        return self.project(code)
+        return DbProject(self, project)
 
     def asset_type(self, code: str) -> DbAssetType:
         """Get database asset type from his code.
@@ -114,16 +366,31 @@ class Db:
         Raises:
             MissingDbAssetTypeError: Given asset type code not found in database.
         """
-        with self.Session() as session:
-            asset_type_query = session.query(AssetType).where(AssetType.code == code)
-            found_asset_type = asset_type_query.first()
-
-        if found_asset_type is None:
+        asset_type = self._cached_type(AssetType, DbAssetType, "code", code)
+        if asset_type is None:
             raise MissingDbAssetTypeError(
                 f"Unable to found asset type with code {code!r}"
             )
 
-        return DbAssetType(self, found_asset_type)
+        return asset_type
+
+    def asset_type_from_id(self, id_: int) -> DbAssetType:
+        """Get database asset type from his id.
+
+        Args:
+            id_ (int): Asset type id.
+
+        Returns:
+            DbAssetType: Instance of database asset type.
+
+        Raises:
+            MissingDbAssetTypeError: Given asset type id not found in database.
+        """
+        asset_type = self._cached_type(AssetType, DbAssetType, "id", id_)
+        if asset_type is None:
+            raise MissingDbAssetTypeError(f"Unable to found asset type with id {id_!r}")
+
+        return asset_type
 
     def asset_types(self) -> list[DbAssetType]:
         """Get all asset type table.
@@ -131,40 +398,40 @@ class Db:
         Returns:
             list[DbAssetType
         """
-        with self.Session() as session:
+        with self.session() as session:
             asset_type_query = session.query(AssetType)
             asset_types = [
                 DbAssetType(self, asset_type) for asset_type in asset_type_query
             ]
 
+        self._cache_types(AssetType, asset_types)
         return asset_types
 
     def get_or_create_asset_type(self, code: str, name: str) -> DbAssetType:
         """Create new asset type in database asset_type table.
 
-        If given code:name already exist in database, return it.
+        Asset type is inserted with a single `INSERT ... ON CONFLICT DO NOTHING`
+        statement, safe when several processes create the same asset type.
 
         Args:
             code (str): Asset type code.
             name (str): Asset type name.
 
+        Raises:
+            DbAssetTypeAlreadyExistsError
+
         Returns:
             DbAssetType
         """
-        try:
-            self.asset_type(code)
-        except MissingDbAssetTypeError:
-            with self.Session() as session:
-                asset_type_obj = AssetType(code=code, name=name, active=True)
-                session.add(asset_type_obj)
-                session.commit()
-
-        else:
+        asset_type = self._insert_type(
+            AssetType, DbAssetType, code=code, name=name, active=True
+        )
+        if asset_type is None:
             raise DbAssetTypeAlreadyExistsError(
                 f"Asset type {code!r} - {name!r} already exists."
             )
 
-        return self.asset_type(code)
+        return asset_type
 
     def task_type(self, code: str) -> DbTaskType:
         """Get task type object.
@@ -178,14 +445,29 @@ class Db:
         Raises:
             MissingDbTaskTypeError: Given task type code not found in database.
         """
-        with self.Session() as session:
-            task_type_query = session.query(TaskType).where(TaskType.code == code)
-            found_task_type = task_type_query.first()
-
-        if found_task_type is None:
+        task_type = self._cached_type(TaskType, DbTaskType, "code", code)
+        if task_type is None:
             raise MissingDbTaskTypeError(f"Unable to found task type with code {code!r}")
 
-        return DbTaskType(self, found_task_type)
+        return task_type
+
+    def task_type_from_id(self, id_: int) -> DbTaskType:
+        """Get task type object from his id.
+
+        Args:
+            id_ (int): Task type id.
+
+        Returns:
+            DbTaskType: Instance of database task type.
+
+        Raises:
+            MissingDbTaskTypeError: Given task type id not found in database.
+        """
+        task_type = self._cached_type(TaskType, DbTaskType, "id", id_)
+        if task_type is None:
+            raise MissingDbTaskTypeError(f"Unable to found task type with id {id_!r}")
+
+        return task_type
 
     def task_types(self) -> list[DbTaskType]:
         """Return all task types table.
@@ -193,15 +475,19 @@ class Db:
         Returns:
             list[DbAssetType]
         """
-        with self.Session() as session:
+        with self.session() as session:
             tasks_query = session.query(TaskType)
             task_types = [DbTaskType(self, task) for task in tasks_query]
 
+        self._cache_types(TaskType, task_types)
         return task_types
 
     def get_or_create_task_type(self, code: str, name: str) -> DbTaskType:
         """Create new task type in database.
 
+        Task type is inserted with a single `INSERT ... ON CONFLICT DO NOTHING`
+        statement, safe when several processes create the same task type.
+
         Args:
             code (str): Task type code.
             name (str): Task type name.
@@ -212,20 +498,15 @@ class Db:
         Returns:
             DbTaskType
         """
-        try:
-            self.task_type(code)
-        except MissingDbTaskTypeError:
-            with self.Session() as session:
-                task_type_obj = TaskType(code=code, name=name, active=True)
-                session.add(task_type_obj)
-                session.commit()
-
-        else:
+        task_type = self._insert_type(
+            TaskType, DbTaskType, code=code, name=name, active=True
+        )
+        if task_type is None:
             raise DbTaskTypeAlreadyExistError(
                 f"Task type {code!r} - {name!r} already exists."
             )
 
-        return self.task_type(code)
+        return task_type
 
     def publish_type(self, code: str) -> DbPublishType:
         """Get publish type object.
@@ -239,18 +520,33 @@ class Db:
         Raises:
             MissingDbPublishTypeError: Given publish type code not found in database.
         """
-        with self.Session() as session:
-            publish_type_query = session.query(PublishType).where(
-                PublishType.code == code
+        publish_type = self._cached_type(PublishType, DbPublishType, "code", code)
+        if publish_type is None:
+            raise MissingDbPublishTypeError(
+                f"Unable to found task type with code {code!r}"
             )
-            found_publish_type = publish_type_query.first()
 
-        if found_publish_type is None:
+        return publish_type
+
+    def publish_type_from_id(self, id_: int) -> DbPublishType:
+        """Get publish type object from his id.
+
+        Args:
+            id_ (int): Publish type id.
+
+        Returns:
+            DbPublishType: Instance of database publish type.
+
+        Raises:
+            MissingDbPublishTypeError: Given publish type id not found in database.
+        """
+        publish_type = self._cached_type(PublishType, DbPublishType, "id", id_)
+        if publish_type is None:
             raise MissingDbPublishTypeError(
-                f"Unable to found task type with code {code!r}"
+                f"Unable to found publish type with id {id_!r}"
             )
 
-        return DbPublishType(self, found_publish_type)
+        return publish_type
 
     def publish_types(self) -> list[DbPublishType]:
         """Return all publish types table.
@@ -258,10 +554,11 @@ class Db:
         Returns:
             list[DbPublishType]
         """
-        with self.Session() as session:
+        with self.session() as session:
             publishs_query = session.query(PublishType)
             publish_types = [DbPublishType(self, publish) for publish in publishs_query]
 
+        self._cache_types(PublishType, publish_types)
         return publish_types
 
     def get_or_create_publish_type(
@@ -270,7 +567,10 @@ class Db:
         file_type: str,
         extension: str,
     ) -> DbPublishType:
-        """Create new task type in database.
+        """Create new publish type in database.
+
+        Publish type is inserted with a single `INSERT ... ON CONFLICT DO NOTHING`
+        statement, safe when several processes create the same publish type.
 
         Args:
             code (str): Publish type description.
@@ -278,25 +578,89 @@ class Db:
             extension (str): Publish type extension.
 
         Raises:
-            DbTaskTypeAlreadyExistError
+            DbPublishTypeAlreadyExistError
 
         Returns:
-            DbTaskType
+            DbPublishType
         """
-        try:
-            self.publish_type(code)
-        except MissingDbPublishTypeError:
-            with self.Session() as session:
-                publish_type_obj = PublishType(
-                    code=code,
-                    file_type=file_type,
-                    extension=extension,
-                    active=True
-                )
-                session.add(publish_type_obj)
-                session.commit()
-
-        else:
+        publish_type = self._insert_type(
+            PublishType,
+            DbPublishType,
+            code=code,
+            file_type=file_type,
+            extension=extension,
+            active=True,
+        )
+        if publish_type is None:
             raise DbPublishTypeAlreadyExistError(f"Publish type {code!r} already exists.")
 
-        return self.publish_type(code)
+        return publish_type
+
+    def invalidate_type_cache(self):
+        """Clear cached types and bump database type version.
+
+        Must be called after any write on asset, task or publish type tables.
+        """
+        with self.session() as session:
+            new_version = bump_type_version(session, self._type_version_key)
+
+        self._type_cache.clear(new_version)
+
+    def _insert_type(
+        self,
+        model: type[Base],
+        db_type: type[DbEntity],
+        **values: Any,
+    ) -> DbEntity | None:
+        with self.session() as session:
+            found = session.scalars(upsert_type(session, model, **values)).first()
+
+        if found is None:
+            return None
+
+        self.invalidate_type_cache()
+        return db_type(self, found)
+
+    def _type_version(self) -> int:
+        with self.session() as session:
+            version = session.get(Meta, self._type_version_key)
+            return 0 if version is None else version.value
+
+    def _valid_type_cache(self) -> TypeCache:
+        cache = self._type_cache
+        if cache.is_expired(self.type_cache_ttl):
+            cache.clear(cache.version)
+
+        if self.type_cache_versioned:
+            version = self._type_version()
+            if version != cache.version:
+                cache.clear(version)
+
+        return cache
+
+    def _cached_type(
+        self,
+        model: type[Base],
+        db_type: type[DbEntity],
+        key: str,
+        value: Any,
+    ) -> DbEntity | None:
+        cache = self._valid_type_cache()
+        entity = cache.get(model, key, value)
+        if entity is not None:
+            return entity
+
+        with self.session() as session:
+            found = session.scalar(select_type(model, key, value))
+
+        if found is None:
+            return None
+
+        entity = db_type(self, found)
+        cache.add(model, entity)
+        return entity
+
+    def _cache_types(self, model: type[Base], entities: list[DbEntity]):
+        cache = self._valid_type_cache()
+        for entity in entities:
+            cache.add(model, entity)
@@ -4,18 +4,53 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
+
 from tk_db.dbentity import DbEntity
 from tk_db.dbtask import DbTask
+from tk_db.dbtasktype import DbTaskType
+from tk_db.dialect import upsert
 from tk_db.errors import MissingDbTaskError
 from tk_db.models import Asset
 from tk_db.models import Task
-from tk_db.models import TaskType
 
 
 if TYPE_CHECKING:
+    from sqlalchemy import Insert
+    from sqlalchemy import Select
+    from sqlalchemy.orm import Session
+
+    from tk_db.db import Db
     from tk_db.dbassettype import DbAssetType
     from tk_db.dbproject import DbProject
-    from tk_db.dbtasktype import DbTaskType
+
+
+def select_task(asset_id: int, task_type_id: int) -> Select:
+    """Return query of the task of given type of an asset."""
+    return select(Task).where(
+        Task.asset_id == asset_id, Task.task_type_id == task_type_id
+    )
+
+
+def select_tasks(asset_id: int) -> Select:
+    """Return query of tasks of an asset, with their task type loaded."""
+    return (
+        select(Task).options(joinedload(Task.task_type)).where(Task.asset_id == asset_id)
+    )
+
+
+def upsert_task(session: Session, asset_id: int, task_type_id: int) -> Insert:
+    """Return statement inserting a task and returning it, or the existing one."""
+    insert_query = upsert(session, Task).values(
+        asset_id=asset_id,
+        task_type_id=task_type_id,
+    )
+    # No-op update so conflicting existing row is returned.
+    return insert_query.on_conflict_do_update(
+        index_elements=["asset_id", "task_type_id"],
+        set_={"task_type_id": insert_query.excluded.task_type_id},
+    ).returning(Task)
 
 
 class DbAsset(DbEntity):
@@ -27,6 +62,10 @@ class DbAsset(DbEntity):
         asset_type (DbAssetType): Asset type of asset.
     """
 
+    __slots__ = ("project", "asset_type")
+
+    model = Asset
+
     def __init__(
         self,
         asset: Asset,
@@ -37,22 +76,19 @@ class DbAsset(DbEntity):
         self.project = project
         self.asset_type = asset_type
 
+    @property
+    def db(self) -> Db:
+        """Return database object."""
+        return self.project.db
+
     @property
     def is_active(self):
         """Get if asset is active."""
-        with self.project.db.Session() as session:
-            query = session.query(Asset).where(Asset.id == self.id).first()
-            active = query.active
-
-        return active
+        return self._bc_entity.active
 
     def set_active(self, value: bool):
         """Set asset active or not."""
-        with self.project.db.Session() as session:
-            query = session.query(Asset).where(Asset.id == self.id).first()
-            query.active = value
-            session.commit()
-
+        self._update(active=value)
 
     def task(
         self, task_type: DbTaskType | None = None, code: str | None = None
@@ -68,21 +104,17 @@ class DbAsset(DbEntity):
 
         Raises:
             ValueError: No task_type and code given
+            MissingDbTaskTypeError: No task type found with given code.
             MissingDbTaskError: No task found on asset with given code or type.
         """
-        with self.project.db.Session() as session:
-            if task_type is None and code is not None:
-                task_type = session.query(TaskType).where(TaskType.code == code).first()
+        if task_type is None and code is not None:
+            task_type = self.db.task_type(code)
 
-            if task_type is None:
-                raise ValueError("No code found from given task_type of code.")
+        if task_type is None:
+            raise ValueError("No code found from given task_type of code.")
 
-            task_qr = session.query(Task).join(TaskType).join(Asset)
-            task_filter = task_qr.filter(
-                TaskType.id == task_type.id,
-                Asset.id == self.id,
-            )
-            found_task = task_filter.first()
+        with self.db.session() as session:
+            found_task = session.scalar(select_task(self.id, task_type.id))
 
         if found_task is None:
             raise MissingDbTaskError(f"Unable to found task {code!r}")
@@ -92,18 +124,19 @@ class DbAsset(DbEntity):
     def tasks(self) -> list[DbTask]:
         """Get all tasks of asset.
 
+        Task types are loaded in the same query as the tasks.
+
         Returns:
             list[DbTask]
         """
+        task_types: dict[int, DbTaskType] = {}
         tasks = []
-        with self.project.db.Session() as session:
-            task_query = session.query(Task).where(Task.asset_id == self.id)
-            for task in task_query:
-                task_type = (
-                    session.query(TaskType)
-                    .where(TaskType.id == task.task_type_id)
-                    .first()
-                )
+        with self.db.session() as session:
+            for task in session.scalars(select_tasks(self.id)):
+                task_type = task_types.get(task.task_type_id)
+                if task_type is None:
+                    task_type = DbTaskType(self.db, task.task_type)
+                    task_types[task.task_type_id] = task_type
                 tasks.append(DbTask(task, task_type, self))
 
         return tasks
@@ -113,7 +146,11 @@ class DbAsset(DbEntity):
         task_type: DbTaskType | None = None,
         code: str | None = None,
     ) -> DbTask:
-        """Create new task.
+        """Get or create task of given type on asset.
+
+        Task is upserted with a single `INSERT ... ON CONFLICT DO UPDATE`
+        statement returning the existing or created row, safe when several
+        processes create the same task.
 
         Args:
             task_type (DbTaskType): Type of task to create.
@@ -126,17 +163,9 @@ class DbAsset(DbEntity):
             MissingDbTaskTypeError: Raised if given task type is missing.
         """
         if task_type is None and code is not None:
-            task_type = self.project.db.task_type(code)
-
-        try:
-            self.task(task_type)
-        except MissingDbTaskError:
-            with self.project.db.Session() as session:
-                task_obj = Task(
-                    asset_id=self.id,
-                    task_type_id=task_type.id,
-                )
-                session.add(task_obj)
-                session.commit()
-
-        return self.task(task_type)
+            task_type = self.db.task_type(code)
+
+        with self.db.session() as session:
+            task = session.scalars(upsert_task(session, self.id, task_type.id)).one()
+
+        return DbTask(task, task_type, self)
@@ -20,6 +20,10 @@ class DbAssetType(DbEntity):
         asset_type (AssetType) AssetType model object.
     """
 
+    __slots__ = ("db",)
+
+    model = AssetType
+
     def __init__(self, db: Db, asset_type: AssetType):
         super().__init__(asset_type)
         self.db = db
@@ -31,15 +35,9 @@ class DbAssetType(DbEntity):
 
     def is_active(self) -> bool:
         """Get if project is active."""
-        with self.db.Session() as session:
-            project = session.query(AssetType).where(AssetType.id == self.id).first()
-            active = project.active
-
-        return active
+        return self._bc_entity.active
 
     def set_active(self, value: bool):
         """Set project active or not."""
-        with self.db.Session() as session:
-            project = session.query(AssetType).where(AssetType.id == self.id).first()
-            project.active = value
-            session.commit()
+        self._update(active=value)
+        self.db.invalidate_type_cache()
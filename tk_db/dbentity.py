@@ -1,12 +1,60 @@
 """Database base entity object module."""
 
-from tk_db.models import Base
+from __future__ import annotations
 
+import functools
 
-class DbEntity:
-    """Database entity object."""
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import ClassVar
 
-    def __init__(self, entity: Base):
+from sqlalchemy.orm.attributes import set_committed_value
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import Session
+
+    from tk_db.models import Base
+
+
+# Session info key of callbacks restoring entities written in a transaction.
+_ROLLBACK_KEY = "tk_db_entity_rollbacks"
+
+
+def rollback_entities(session: Session | AsyncSession):
+    """Restore loaded rows of entities written in a rolled back transaction.
+
+    Called by `Db.transaction` and `AsyncDb.transaction` when their block
+    raises, entities written in it serve their committed column values again.
+
+    Args:
+        session (Session|AsyncSession): Transaction session.
+    """
+    # Most recent first, first write of an entity restores its committed values.
+    for restore in reversed(session.info.pop(_ROLLBACK_KEY, [])):
+        restore()
+
+
+class BaseDbEntity:
+    """Database entity object, without database access.
+
+    Column values are served from the row loaded when entity was fetched, or
+    last written through this object, without querying database. Subclasses
+    provide the `db` object and their `model`, and read and write their row,
+    see `DbEntity` and `tk_db.aio.dbentity.AsyncDbEntity`.
+
+    Loaded row is either a model instance or a read-only snapshot of its column
+    values, see `tk_db.snapshot`.
+    """
+
+    __slots__ = ("_bc_entity",)
+
+    model: ClassVar[type[Base]]
+
+    def __init__(self, entity: Base | tuple):
         self._bc_entity = entity
 
     def __repr__(self):
@@ -34,4 +82,53 @@ class DbEntity:
     @property
     def columns(self):
         """Return entity table column names."""
-        return self._bc_entity.__table__.columns.keys()
+        return self.model.__table__.columns.keys()
+
+    def _track_rollback(
+        self, session: Session | AsyncSession, entity: Base, columns: Iterable[str]
+    ):
+        """Restore entity column values if transaction of session rolls back.
+
+        Written values are served before an outer transaction commits, see
+        `rollback_entities`. Nothing is tracked outside of transactions.
+        """
+        if not self.db.in_transaction():
+            return
+
+        previous = {column: getattr(entity, column) for column in columns}
+        restore = functools.partial(self._restore, entity, previous)
+        session.info.setdefault(_ROLLBACK_KEY, []).append(restore)
+
+    def _restore(self, entity: Base, values: dict[str, Any]):
+        for column, value in values.items():
+            set_committed_value(entity, column, value)
+        self._bc_entity = entity
+
+
+class DbEntity(BaseDbEntity):
+    """Database entity object.
+
+    Call `refresh` to see changes made by others.
+    """
+
+    __slots__ = ()
+
+    def refresh(self):
+        """Reload entity row from database."""
+        with self.db.session() as session:
+            entity = session.get(self.model, self.id, populate_existing=True)
+
+        if entity is None:
+            raise ValueError(f"{self!r} no longer exists in database.")
+
+        self._bc_entity = entity
+
+    def _update(self, **values: Any):
+        """Write given column values to entity row and to loaded row."""
+        with self.db.session() as session:
+            entity = session.get(self.model, self.id)
+            self._track_rollback(session, entity, values)
+            for column, value in values.items():
+                setattr(entity, column, value)
+
+        self._bc_entity = entity
@@ -5,19 +5,152 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from typing import Any
 
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy import update
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+
 from tk_db.dbasset import DbAsset
 from tk_db.dbassettype import DbAssetType
 from tk_db.dbentity import DbEntity
+from tk_db.dbpublish import DbPublish
+from tk_db.dbtask import STREAM_BATCH_SIZE
+from tk_db.dbtask import DbTask
+from tk_db.dbtasktype import DbTaskType
+from tk_db.dialect import json_set_keys
+from tk_db.dialect import upsert
 from tk_db.errors import DbAssetAlreadyExistError
 from tk_db.errors import MissingDbAssetError
 from tk_db.models import Asset
 from tk_db.models import AssetType
 from tk_db.models import Project
+from tk_db.models import Publish
+from tk_db.models import PublishUsage
+from tk_db.models import Task
+from tk_db.models import TaskType
+from tk_db.pathresolver import PathResolver
+from tk_db.snapshot import snapshot_select
+from tk_db.snapshot import split_snapshot
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+    from sqlalchemy import Insert
+    from sqlalchemy import Select
+    from sqlalchemy import Update
+    from sqlalchemy.engine import Row
+    from sqlalchemy.orm import Session
+
     from tk_db.db import Db
 
+# Max bound parameters of a single `IN` query, below SQLite variable limit.
+IN_QUERY_CHUNK_SIZE = 900
+
+# Disk usage grouping levels, each level is also grouped by its parent levels.
+USAGE_LEVELS = ("project", "asset_type", "asset", "task")
+
+
+def update_metadata(session: Session, project_id: int, value: dict[str, Any]) -> Update:
+    """Return statement setting top level metadata keys of a project.
+
+    Statement returns the updated metadata.
+    """
+    return (
+        update(Project)
+        .where(Project.id == project_id)
+        .values(metadata_=json_set_keys(session, Project.metadata_, value))
+        .returning(Project.metadata_)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def select_asset(project_id: int, asset_type_id: int, code: str) -> Select:
+    """Return query of an asset of a project from its type and code."""
+    return select(Asset).where(
+        Asset.project_id == project_id,
+        Asset.asset_type_id == asset_type_id,
+        Asset.code == code,
+    )
+
+
+def select_assets(project_id: int) -> Select:
+    """Return query of assets of a project, with their asset type loaded."""
+    return (
+        select(Asset)
+        .options(joinedload(Asset.asset_type))
+        .where(Asset.project_id == project_id)
+    )
+
+
+def select_tree(project_id: int) -> Select:
+    """Return query of assets of a project with their types, tasks and publishes.
+
+    Tasks and publishes are loaded by one more query each.
+    """
+    return (
+        select(Asset)
+        .options(
+            joinedload(Asset.asset_type),
+            selectinload(Asset.task).joinedload(Task.task_type),
+            selectinload(Asset.task).selectinload(Task.publish),
+        )
+        .where(Asset.project_id == project_id)
+    )
+
+
+def select_latest_publishes(project_id: int, release: str | None = None) -> Select:
+    """Return query of the latest active publish of every series of a project.
+
+    Latest versions are resolved in database with a window function. Rows hold
+    publish snapshot columns then task and asset, see `tk_db.snapshot`.
+    """
+    ranked = (
+        select(
+            Publish.id,
+            func.row_number()
+            .over(
+                partition_by=(
+                    Publish.task_id,
+                    Publish.code,
+                    Publish.publish_type_id,
+                    Publish.release,
+                ),
+                order_by=Publish.version.desc(),
+            )
+            .label("rank"),
+        )
+        .join(Task)
+        .join(Asset)
+        .where(Asset.project_id == project_id, Publish.active.is_(True))
+    )
+    if release:
+        ranked = ranked.where(Publish.release == release)
+    ranked = ranked.subquery()
+
+    return (
+        snapshot_select(Publish, Task, Asset)
+        .join(ranked, Publish.id == ranked.c.id)
+        .join(Task, Publish.task_id == Task.id)
+        .join(Asset, Task.asset_id == Asset.id)
+        .where(ranked.c.rank == 1)
+    )
+
+
+def upsert_asset(
+    session: Session, project_id: int, asset_type_id: int, code: str
+) -> Insert:
+    """Return statement inserting an asset and returning it, nothing if it exists."""
+    return (
+        upsert(session, Asset)
+        .values(code=code, asset_type_id=asset_type_id, project_id=project_id)
+        .on_conflict_do_nothing(index_elements=["project_id", "asset_type_id", "code"])
+        .returning(Asset)
+    )
+
 
 class DbProject(DbEntity):
     """Database project object.
@@ -27,17 +160,19 @@ class DbProject(DbEntity):
         project (Project): Database project model.
     """
 
+    __slots__ = ("db", "_path_resolver")
+
+    model = Project
+
     def __init__(self, db: Db, project: Project):
         super().__init__(project)
         self.db = db
+        self._path_resolver: PathResolver | None = None
 
     @DbEntity.code.setter
     def code(self, value: str):
         """Set project code."""
-        with self.db.Session() as session:
-            project = session.query(Project).where(Project.id == self.id).first()
-            project.code = value
-            session.commit()
+        self._update(code=value)
 
     @property
     def name(self) -> str:
@@ -47,18 +182,16 @@ class DbProject(DbEntity):
     @name.setter
     def name(self, value: str):
         """Set project name."""
-        with self.db.Session() as session:
-            project = session.query(Project).where(Project.id == self.id).first()
-            project.name = value
-            session.commit()
+        self._update(name=value)
 
     @property
-    def metadata(self) -> dict:
-        """Return project metadata."""
-        with self.db.Session() as session:
-            project_q = session.query(Project).where(Project.code == self.code).first()
+    def metadata(self) -> dict[str, Any]:
+        """Return project metadata.
 
-        return eval(project_q.metadata_)
+        Metadata is parsed once when project row is loaded, returned dict must
+        not be modified, use `metadata` setter or `metadata_update` instead.
+        """
+        return self._bc_entity.metadata_
 
     @metadata.setter
     def metadata(self, value: dict[str, Any]):
@@ -68,37 +201,47 @@ class DbProject(DbEntity):
             value (dict[str, Any]): Project metadata like environment, root path ect.
         """
         assert isinstance(value, dict)
-        with self.db.Session() as session:
-            project = session.query(Project).where(Project.code == self.code).first()
-
-            project.metadata_ = str(value)
+        self._update(metadata_=value)
 
-            session.commit()
+    def metadata_update(self, value: dict[str, Any]):
+        """Update top level keys of project metadata, in database.
 
-    def metadata_update(self, value: dict):
-        """Update project metadata.
+        Other keys are left untouched, even if changed concurrently by others.
 
         Args:
             value (dict[str, Any]): Project metadata like environment, root path ect.
         """
         assert isinstance(value, dict)
-        updated = self.metadata.update(value)
-        self.metadata = updated
+        with self.db.session() as session:
+            update_query = update_metadata(session, self.id, value)
+            self._track_rollback(session, self._bc_entity, ["metadata_"])
+            metadata = session.scalar(update_query)
+
+        set_committed_value(self._bc_entity, "metadata_", metadata)
+
+    def path_resolver(self) -> PathResolver:
+        """Return publish path resolver of project.
+
+        Resolver is built once and rebuilt only when project root path changes.
+
+        Raises:
+            ValueError: Project metadata has no root path.
+        """
+        resolver = self._path_resolver
+        root_path = self.metadata.get("env", {}).get("TK_PROJECT_PATH")
+        if resolver is None or resolver.root_path != root_path:
+            resolver = PathResolver.from_metadata(self.metadata)
+            self._path_resolver = resolver
+
+        return resolver
 
     def is_active(self) -> bool:
         """Get if project is active."""
-        with self.db.Session() as session:
-            project = session.query(Project).where(Project.id == self.id).first()
-            active = project.active
-
-        return active
+        return self._bc_entity.active
 
     def set_active(self, value: bool):
         """Set project active or not."""
-        with self.db.Session() as session:
-            project = session.query(Project).where(Project.id == self.id).first()
-            project.active = value
-            session.commit()
+        self._update(active=value)
 
     def asset(self, asset_type: DbAssetType, asset_code: str) -> DbAsset:
         """Get specific asset in project with given asset type and code.
@@ -113,12 +256,8 @@ class DbProject(DbEntity):
         Returns:
             DbAsset
         """
-        with self.db.Session() as session:
-            asset_query = session.query(Asset).join(Project).join(AssetType)
-            found_asset = asset_query.filter(
-                Project.id == self.id, AssetType.id == asset_type.id
-            ).where(Asset.code == asset_code)
-            found_asset = found_asset.first()
+        with self.db.session() as session:
+            found_asset = session.scalar(select_asset(self.id, asset_type.id, asset_code))
 
         if found_asset is None:
             raise MissingDbAssetError
@@ -126,25 +265,254 @@ class DbProject(DbEntity):
         return DbAsset(found_asset, asset_type, self)
 
     def assets(self) -> list[DbAsset]:
-        """Return assets in project."""
-        assets = []
-        with self.db.Session() as session:
-            assets_query = (
-                session.query(Asset).join(Project)
-                .where(Project.code == self.code)
-            )
+        """Return assets in project.
 
-            for asset in assets_query:
-                asset_type_query = (
-                    session.query(AssetType)
-                    .where(AssetType.id == asset.asset_type_id)
-                    .first()
-                )
-                asset_type = DbAssetType(self.db, asset_type_query)
+        Asset types are loaded in the same query as the assets.
+        """
+        asset_types: dict[int, DbAssetType] = {}
+        assets = []
+        with self.db.session() as session:
+            for asset in session.scalars(select_assets(self.id)):
+                asset_type = asset_types.get(asset.asset_type_id)
+                if asset_type is None:
+                    asset_type = DbAssetType(self.db, asset.asset_type)
+                    asset_types[asset.asset_type_id] = asset_type
                 assets.append(DbAsset(asset, asset_type, self))
 
         return assets
 
+    def tree(self) -> dict[DbAsset, dict[DbTask, list[DbPublish]]]:
+        """Return the whole project hierarchy: assets, their tasks and publishes.
+
+        Everything is loaded in a constant number of queries whatever the
+        project size (one per hierarchy level).
+
+        Returns:
+            dict[DbAsset, dict[DbTask, list[DbPublish]]]
+        """
+        asset_types: dict[int, DbAssetType] = {}
+        task_types: dict[int, DbTaskType] = {}
+        tree = {}
+        with self.db.session() as session:
+            for asset in session.scalars(select_tree(self.id)):
+                asset_type = asset_types.get(asset.asset_type_id)
+                if asset_type is None:
+                    asset_type = DbAssetType(self.db, asset.asset_type)
+                    asset_types[asset.asset_type_id] = asset_type
+                db_asset = DbAsset(asset, asset_type, self)
+
+                tasks = {}
+                for task in asset.task:
+                    task_type = task_types.get(task.task_type_id)
+                    if task_type is None:
+                        task_type = DbTaskType(self.db, task.task_type)
+                        task_types[task.task_type_id] = task_type
+                    db_task = DbTask(task, task_type, db_asset)
+                    tasks[db_task] = [
+                        DbPublish(db_task, publish) for publish in task.publish
+                    ]
+
+                tree[db_asset] = tasks
+
+        return tree
+
+    def latest_publishes(self, release: str | None = None) -> list[DbPublish]:
+        """Return the latest active publish of every publish series in project.
+
+        A publish series is a task publish code/type/release. Latest versions are
+        resolved in database with a single window function query.
+
+        Args:
+            release (str|None): Only return publishes of given release if any.
+
+        Returns:
+            list[DbPublish]
+        """
+        publish_query = select_latest_publishes(self.id, release)
+        with self.db.session() as session:
+            publishes = self._db_publishes(session.execute(publish_query))
+
+        return publishes
+
+    def publishes_page(
+        self,
+        after_id: int = 0,
+        limit: int = 500,
+        release: str | None = None,
+    ) -> list[DbPublish]:
+        """Return a page of project publishes, by id order.
+
+        Pages are keyset paginated: next page starts after last publish id of
+        previous one, so any page costs the same whatever its position.
+
+        Args:
+            after_id (int): Id of last publish of previous page, 0 for first page.
+            limit (int): Maximum number of publishes in page.
+            release (str|None): Only return publishes of given release if any.
+
+        Returns:
+            list[DbPublish]: Page publishes, less than limit on last page.
+        """
+        # Project filter as correlated EXISTS and outer joins, so publishes are
+        # walked in primary key order from after_id instead of sorted on each page.
+        in_project = (
+            select(Task.id)
+            .join(Asset)
+            .where(Task.id == Publish.task_id, Asset.project_id == self.id)
+            .exists()
+        )
+        publish_query = (
+            snapshot_select(Publish, Task, Asset)
+            .outerjoin(Task, Publish.task_id == Task.id)
+            .outerjoin(Asset, Task.asset_id == Asset.id)
+            .where(Publish.id > after_id, in_project)
+        )
+        if release:
+            publish_query = publish_query.where(Publish.release == release)
+        publish_query = publish_query.order_by(Publish.id).limit(limit)
+        with self.db.session() as session:
+            publishes = self._db_publishes(session.execute(publish_query))
+
+        return publishes
+
+    def iter_publishes(
+        self,
+        release: str | None = None,
+        active: bool | None = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[DbPublish]:
+        """Stream all publishes of project, as read-only row snapshots.
+
+        Rows are fetched by batches from a server side cursor when database
+        supports it, memory stays flat whatever the number of publishes, only
+        tasks and assets met so far are kept. The session stays open until
+        generator is exhausted or closed.
+
+        Args:
+            release (str|None): Only yield publishes of given release if any.
+            active (bool|None): Only yield active or inactive publishes if given.
+            batch_size (int): Number of rows fetched at once.
+
+        Yields:
+            DbPublish
+        """
+        publish_query = (
+            snapshot_select(Publish, Task, Asset)
+            .join(Task, Publish.task_id == Task.id)
+            .join(Asset, Task.asset_id == Asset.id)
+            .where(Asset.project_id == self.id)
+        )
+        if release:
+            publish_query = publish_query.where(Publish.release == release)
+        if active is not None:
+            publish_query = publish_query.where(Publish.active.is_(active))
+
+        with self.db.session() as session:
+            rows = session.execute(publish_query.execution_options(yield_per=batch_size))
+            yield from iter_db_publishes(self.db, rows, self)
+
+    def publishes_from_paths(self, paths: Iterable[str]) -> dict[str, DbPublish]:
+        """Resolve publish file paths of project to their publishes.
+
+        Paths are resolved with a bulk `IN` query on publish path, split in
+        chunks below database bound parameter limit.
+
+        Args:
+            paths (Iterable[str]): Publish file paths.
+
+        Returns:
+            dict[str, DbPublish]: Publishes by path, missing publishes are skipped.
+        """
+        paths = list(paths)
+        publishes = []
+        with self.db.session() as session:
+            for start in range(0, len(paths), IN_QUERY_CHUNK_SIZE):
+                publish_query = (
+                    snapshot_select(Publish, Task, Asset)
+                    .join(Task, Publish.task_id == Task.id)
+                    .join(Asset, Task.asset_id == Asset.id)
+                    .where(
+                        Asset.project_id == self.id,
+                        Publish.path.in_(paths[start : start + IN_QUERY_CHUNK_SIZE]),
+                    )
+                )
+                publishes.extend(self._db_publishes(session.execute(publish_query)))
+
+        return {publish.path: publish for publish in publishes}
+
+    def usage(self, group_by: str = "asset", summary: bool = False) -> list[Row]:
+        """Return disk usage of project active publishes.
+
+        Usage is aggregated in database by a single `GROUP BY` query.
+
+        Args:
+            group_by (str): Grouping level in `USAGE_LEVELS`, rows of `asset`
+                level have `asset_type` and `asset` columns, `task` level rows
+                have `task` column too.
+            summary (bool): Aggregate `publish_usage` summary table, maintained
+                by triggers on publish writes, instead of publishes.
+
+        Returns:
+            list[Row]: Rows of level codes, `size` and `count` columns.
+
+        Raises:
+            ValueError: Unknown grouping level.
+        """
+        if group_by not in USAGE_LEVELS:
+            raise ValueError(f"Unknown usage level {group_by!r}, use {USAGE_LEVELS}.")
+
+        level = USAGE_LEVELS.index(group_by)
+        columns = [
+            column
+            for index, column in enumerate(
+                (
+                    Project.code.label("project"),
+                    AssetType.code.label("asset_type"),
+                    Asset.code.label("asset"),
+                    TaskType.code.label("task"),
+                )
+            )
+            if index <= level
+        ]
+        if summary:
+            # Summary rows of groups without active publish left are kept at zero.
+            usage_query = (
+                select(
+                    *columns,
+                    func.coalesce(func.sum(PublishUsage.size), 0).label("size"),
+                    func.coalesce(func.sum(PublishUsage.publish_count), 0).label("count"),
+                )
+                .select_from(PublishUsage)
+                .having(func.sum(PublishUsage.publish_count) > 0)
+            )
+        else:
+            usage_query = (
+                select(
+                    *columns,
+                    func.coalesce(func.sum(Publish.size), 0).label("size"),
+                    func.count(Publish.id).label("count"),
+                )
+                .select_from(Publish)
+                .where(Publish.active.is_(True))
+            )
+
+        usage_query = (
+            usage_query.join(Task)
+            .join(TaskType)
+            .join(Asset)
+            .join(AssetType)
+            .join(Project)
+            .where(Project.id == self.id)
+            .group_by(*columns)
+            .order_by(*columns)
+        )
+        with self.db.session() as session:
+            return session.execute(usage_query).all()
+
+    def _db_publishes(self, rows: Iterable[Row]) -> list[DbPublish]:
+        """Wrap rows of `snapshot_select(Publish, Task, Asset)` of project."""
+        return list(iter_db_publishes(self.db, rows, self))
+
     def get_or_create_asset(
         self,
         asset_code: str,
@@ -152,6 +520,9 @@ class DbProject(DbEntity):
     ) -> DbAsset:
         """Create new asset in database related to given project.
 
+        Asset is inserted with a single `INSERT ... ON CONFLICT DO NOTHING`
+        statement, safe when several processes create the same asset.
+
         Args:
             asset_code (str): Asset code.
             asset_type (DbAssetType): Asset type of asset.
@@ -162,21 +533,53 @@ class DbProject(DbEntity):
         Returns:
             DbAsset
         """
-        try:
-            self.asset(asset_type, asset_code)
-        except MissingDbAssetError:
-            with self.db.Session() as session:
-                asset_obj = Asset(
-                    code=asset_code,
-                    asset_type_id=asset_type.id,
-                    project_id=self.id,
-                )
-                session.add(asset_obj)
-                session.commit()
-        else:
+        with self.db.session() as session:
+            insert_query = upsert_asset(session, self.id, asset_type.id, asset_code)
+            asset = session.scalars(insert_query).first()
+
+        if asset is None:
             raise DbAssetAlreadyExistError(
                 f"Asset '{asset_type.code}_{asset_code}' "
                 f"already exists in project {self.code!r}."
             )
 
-        return self.asset(asset_type, asset_code)
+        return DbAsset(asset, asset_type, self)
+
+
+def iter_db_publishes(
+    db: Db, rows: Iterable[Row], project: DbProject | None = None
+) -> Iterator[DbPublish]:
+    """Wrap publish snapshot rows lazily.
+
+    Publishes are read-only snapshots, projects, assets and tasks are shared
+    by publishes of same project, asset and task.
+
+    Args:
+        db (Db): Database object rows come from.
+        rows (Iterable[Row]): Rows of `snapshot_select(Publish, Task, Asset)`,
+            followed by `Project` unless project is given.
+        project (DbProject|None): Project of all rows, if known.
+
+    Yields:
+        DbPublish
+    """
+    projects: dict[int, DbProject] = {} if project is None else {project.id: project}
+    assets: dict[int, DbAsset] = {}
+    tasks: dict[int, DbTask] = {}
+    for row in rows:
+        publish, task_model, asset_model, *project_model = split_snapshot(Publish, row)
+        task = tasks.get(publish.task_id)
+        if task is None:
+            asset = assets.get(task_model.asset_id)
+            if asset is None:
+                asset_project = projects.get(asset_model.project_id)
+                if asset_project is None:
+                    asset_project = DbProject(db, *project_model)
+                    projects[asset_project.id] = asset_project
+                asset_type = db.asset_type_from_id(asset_model.asset_type_id)
+                asset = DbAsset(asset_model, asset_type, asset_project)
+                assets[asset.id] = asset
+            task_type = db.task_type_from_id(task_model.task_type_id)
+            task = DbTask(task_model, task_type, asset)
+            tasks[task.id] = task
+        yield DbPublish(task, publish)
@@ -5,12 +5,12 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from tk_db.dbentity import DbEntity
-from tk_db.dbpublishtype import DbPublishType
 from tk_db.models import Publish
-from tk_db.models import PublishType
 
 
 if TYPE_CHECKING:
+    from tk_db.db import Db
+    from tk_db.dbpublishtype import DbPublishType
     from tk_db.dbtask import DbTask
 
 
@@ -22,10 +22,19 @@ class DbPublish(DbEntity):
         publish (Publish): Publish model object.
     """
 
+    __slots__ = ("task",)
+
+    model = Publish
+
     def __init__(self, task: DbTask, publish: Publish):
         super().__init__(publish)
         self.task = task
 
+    @property
+    def db(self) -> Db:
+        """Return database object."""
+        return self.task.db
+
     @property
     def path(self) -> str:
         """Return publish type code."""
@@ -44,14 +53,7 @@ class DbPublish(DbEntity):
     @property
     def publish_type(self) -> DbPublishType:
         """Return publish type object."""
-        with self.task.asset.project.db.Session() as session:
-            publish_type = (
-                session.query(PublishType)
-                .where(PublishType.id == self._bc_entity.publish_type_id)
-                .first()
-            )
-            db_publish_type = DbPublishType(self.task.asset.project.db, publish_type)
-        return db_publish_type
+        return self.db.publish_type_from_id(self._bc_entity.publish_type_id)
 
     @property
     def release(self) -> str:
@@ -66,16 +68,8 @@ class DbPublish(DbEntity):
     @property
     def is_active(self) -> bool:
         """Return if publish is active or not."""
-        with  self.task.asset.project.db.Session() as session:
-            publish = session.query(Publish).where(Publish.id == self.id).first()
-            active = publish.active
-
-        return active
+        return self._bc_entity.active
 
     def set_active(self, value):
         """Set publish active or not."""
-        session_obj = self.task.asset.project.db.Session
-        with session_obj() as session:
-            publish = session.query(Publish).where(Publish.id == self.id).first()
-            publish.active = value
-            session.commit()
+        self._update(active=value)
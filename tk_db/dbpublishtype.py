@@ -20,6 +20,10 @@ class DbPublishType(DbEntity):
         publish_type (PublishType): Publish type model object.
     """
 
+    __slots__ = ("db",)
+
+    model = PublishType
+
     def __init__(self, db: Db, publish_type: PublishType):
         super().__init__(publish_type)
         self.db = db
@@ -36,15 +40,9 @@ class DbPublishType(DbEntity):
 
     def is_active(self) -> bool:
         """Return if publish is active or not."""
-        with  self.db.Session() as session:
-            publish = session.query(PublishType).where(PublishType.id == self.id).first()
-            active = publish.active
-
-        return active
+        return self._bc_entity.active
 
     def set_active(self, value):
         """Set publish active or not."""
-        with self.db.Session() as session:
-            publish = session.query(PublishType).where(PublishType.id == self.id).first()
-            publish.active = value
-            session.commit()
+        self._update(active=value)
+        self.db.invalidate_type_cache()
@@ -2,34 +2,200 @@
 
 from __future__ import annotations
 
-import os
+import collections
 
 from typing import TYPE_CHECKING
+from typing import NamedTuple
+
+from sqlalchemy import func
+from sqlalchemy import insert
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 
 from tk_db.dbentity import DbEntity
 from tk_db.dbpublish import DbPublish
+from tk_db.errors import DbPublishVersionConflictError
 from tk_db.errors import MissingDbPublishError
 from tk_db.models import Publish
-from tk_db.models import PublishType
 from tk_db.models import Task
+from tk_db.snapshot import snapshot_select
+from tk_db.snapshot import snapshot_type
+from tk_db.versioning import allocate_versions
 
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
+    from collections.abc import Iterator
+
+    from sqlalchemy import Select
+    from sqlalchemy.orm import Session
 
+    from tk_db.db import Db
     from tk_db.dbasset import DbAsset
     from tk_db.dbpublishtype import DbPublishType
     from tk_db.dbtasktype import DbTaskType
+    from tk_db.pathresolver import PathResolver
+
+# Default number of rows fetched at once by publish streaming iterators.
+STREAM_BATCH_SIZE = 1000
+
+
+class PublishSpec(NamedTuple):
+    """Description of a publish to create with `DbTask.create_publishes_bulk`."""
+
+    code: str
+    publish_type: DbPublishType
+    release: str
+    size: int = 0
+    active: bool = False
+
+
+def select_publish(
+    task_id: int, code: str, publish_type_id: int, release: str, version: int
+) -> Select:
+    """Return query of a publish of a task, shared by sync and async tasks."""
+    return select(Publish).where(
+        Publish.task_id == task_id,
+        Publish.code == code,
+        Publish.publish_type_id == publish_type_id,
+        Publish.release == release,
+        Publish.version == version,
+    )
+
+
+def select_publishes(
+    task_id: int,
+    code: str | None = None,
+    publish_type_id: int | None = None,
+    release: str | None = None,
+) -> Select:
+    """Return snapshot query of publishes of a task, filtered by given values if any.
+
+    Rows hold publish column values, see `tk_db.snapshot`.
+    """
+    publish_query = snapshot_select(Publish).where(Publish.task_id == task_id)
+    if code:
+        publish_query = publish_query.where(Publish.code == code)
+    if publish_type_id:
+        publish_query = publish_query.where(Publish.publish_type_id == publish_type_id)
+    if release:
+        publish_query = publish_query.where(Publish.release == release)
+
+    return publish_query
+
+
+def select_last_active_publish(
+    task_id: int, code: str, publish_type_id: int, release: str
+) -> Select:
+    """Return query of the last active publish of a publish series."""
+    filters = (
+        Publish.task_id == task_id,
+        Publish.code == code,
+        Publish.publish_type_id == publish_type_id,
+        Publish.release == release,
+        Publish.active.is_(True),
+    )
+    last_version = select(func.max(Publish.version)).where(*filters)
+    return select(Publish).where(
+        *filters, Publish.version == last_version.scalar_subquery()
+    )
+
+
+def select_last_version(
+    task_id: int, code: str, publish_type_id: int, release: str
+) -> Select:
+    """Return query of the last version of a publish series, active or not."""
+    return select(func.max(Publish.version)).where(
+        Publish.task_id == task_id,
+        Publish.code == code,
+        Publish.publish_type_id == publish_type_id,
+        Publish.release == release,
+    )
+
+
+def insert_publishes(
+    session: Session,
+    task_id: int,
+    path_codes: tuple[str, str, str],
+    specs: list[PublishSpec],
+    path_resolver: PathResolver,
+) -> list[Publish]:
+    """Allocate versions of publishes of a task and insert them in session.
+
+    Shared by sync and async tasks, async ones run it with `AsyncSession.run_sync`.
+
+    Args:
+        session (Session): Session of the transaction inserting the publishes.
+        task_id (int): Publish task id.
+        path_codes (tuple[str, str, str]): Asset type and asset codes, task type
+            name.
+        specs (list[PublishSpec]): Publishes to create.
+        path_resolver (PathResolver): Path resolver of task project.
+
+    Returns:
+        list[Publish]: Inserted publishes, in specs order.
+
+    Raises:
+        IntegrityError: A publish conflicts with one registered concurrently.
+    """
+    series_counts = collections.Counter(
+        (spec.code, spec.publish_type.id, spec.release) for spec in specs
+    )
+    # Sorted so concurrent transactions lock counters in same order.
+    next_versions = {
+        series: allocate_versions(session, task_id, *series, count=count)
+        for series, count in sorted(series_counts.items())
+    }
+
+    rows = []
+    for spec in specs:
+        series = (spec.code, spec.publish_type.id, spec.release)
+        version = next_versions[series]
+        next_versions[series] += 1
+        rows.append(
+            {
+                "code": spec.code,
+                "path": path_resolver.publish_path(
+                    *path_codes,
+                    spec.code,
+                    spec.publish_type.file_type,
+                    spec.publish_type.extension,
+                    spec.release,
+                    version,
+                ),
+                "version": version,
+                "release": spec.release,
+                "size": spec.size,
+                "active": spec.active,
+                "publish_type_id": spec.publish_type.id,
+                "task_id": task_id,
+            }
+        )
+
+    insert_query = insert(Publish).returning(Publish)
+    publish_by_path = {
+        publish.path: publish for publish in session.scalars(insert_query, rows)
+    }
+    return [publish_by_path[row["path"]] for row in rows]
 
 
 class DbTask(DbEntity):
     """Database task object."""
 
+    __slots__ = ("asset", "task_type")
+
+    model = Task
+
     def __init__(self, task: Task, task_type: DbTaskType, asset: DbAsset):
         super().__init__(task)
         self.asset = asset
         self.task_type = task_type
 
+    @property
+    def db(self) -> Db:
+        """Return database object."""
+        return self.asset.db
+
     @property
     def id(self):
         """Return task id."""
@@ -48,18 +214,11 @@ class DbTask(DbEntity):
     @property
     def is_active(self) -> bool:
         """Return if publish is active or not."""
-        with self.asset.project.db.Session() as session:
-            publish = session.query(Task).where(Task.id == self.id).first()
-            active = publish.active
-
-        return active
+        return self._bc_entity.active
 
     def set_active(self, value):
         """Set publish active or not."""
-        with self.asset.project.db.Session as session:
-            publish = session.query(Task).where(Task.id == self.id).first()
-            publish.active = value
-            session.commit()
+        self._update(active=value)
 
     def publish(
         self,
@@ -82,28 +241,17 @@ class DbTask(DbEntity):
         Raises:
             MissingDbPublishError: Raised when publish is missing in database.
         """
-        with self.asset.project.db.Session() as session:
-            publish_query = (
-                session.query(Publish)
-                .join(Task)
-                .join(PublishType)
-                .filter(
-                    PublishType.id == publish_type.id,
-                    Task.id == self.id,
-                    Publish.code == code,
-                    Publish.release == release,
-                    Publish.version == version,
-                )
-                .first()
-            )
+        publish_query = select_publish(self.id, code, publish_type.id, release, version)
+        with self.db.session() as session:
+            publish = session.scalar(publish_query)
 
-        if not publish_query:
+        if publish is None:
             raise MissingDbPublishError(
                 f"Unable to found publish {release} {code!r} type "
                 f"{publish_type.code!r} version {version!r} in database."
             )
 
-        return DbPublish(self, publish_query)
+        return DbPublish(self, publish)
 
     def publishes(
         self,
@@ -111,97 +259,171 @@ class DbTask(DbEntity):
         publish_type: DbPublishType | None = None,
         release: str | None = None,
     ) -> Iterable[DbPublish]:
-        """Get list of publishes with given params."""
-        publishes = []
-        with self.asset.project.db.Session() as session:
-            publish_query = session.query(Publish).where(Publish.task_id == self.id)
-            if code:
-                publish_query = publish_query.filter(Publish.code == code)
-            if publish_type:
-                publish_query = publish_query.filter(
-                    Publish.publish_type_id == publish_type.id
-                )
-            if release:
-                publish_query = publish_query.filter(Publish.release == release)
-
-            publishes = [DbPublish(self, publish) for publish in publish_query]
-
-        return publishes
+        """Get list of publishes with given params, as read-only row snapshots."""
+        publish_type_id = publish_type.id if publish_type else None
+        publish_query = select_publishes(self.id, code, publish_type_id, release)
+        snapshot = snapshot_type(Publish)
+        with self.db.session() as session:
+            rows = session.execute(publish_query)
+            return [DbPublish(self, snapshot._make(row)) for row in rows]
+
+    def iter_publishes(
+        self,
+        code: str | None = None,
+        publish_type: DbPublishType | None = None,
+        release: str | None = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[DbPublish]:
+        """Stream publishes with given params, as read-only row snapshots.
 
-    def last_active_publish(self, code: str, publish_type: DbPublishType, release: str):
-        """Get the last active publish of given publish code/type."""
-        publishes = self.publishes(code, publish_type, release)
-        if not publishes:
-            raise MissingDbPublishError
+        Rows are fetched by batches from a server side cursor when database
+        supports it, memory stays flat whatever the number of publishes. The
+        session stays open until generator is exhausted or closed.
 
-        return max(publishes, key=lambda x: x.version)
+        Args:
+            code (str|None): Only yield publishes of given code if any.
+            publish_type (DbPublishType|None): Only yield publishes of given type.
+            release (str|None): Only yield publishes of given release if any.
+            batch_size (int): Number of rows fetched at once.
 
-    def create_next_publish(
+        Yields:
+            DbPublish
+        """
+        publish_type_id = publish_type.id if publish_type else None
+        publish_query = select_publishes(self.id, code, publish_type_id, release)
+        snapshot = snapshot_type(Publish)
+        with self.db.session() as session:
+            rows = session.execute(publish_query.execution_options(yield_per=batch_size))
+            for row in rows:
+                yield DbPublish(self, snapshot._make(row))
+
+    def last_active_publish(
         self, code: str, publish_type: DbPublishType, release: str
     ) -> DbPublish:
-        """Create publish at next versions."""
-        try:
-            last_publish = self.last_active_publish(code, publish_type, release)
-            version = last_publish.version + 1
-        except MissingDbPublishError:
-            version = 1
-        with self.asset.project.db.Session() as session:
-            publish = Publish(
-                code=code,
-                path=self._publish_path(code, publish_type, release, version),
-                version=version,
-                release=release,
-                size=0,
-                active=False,
-                publish_type_id=publish_type.id,
-                task_id=self.id,
+        """Get the last active publish of given publish code/type.
+
+        Args:
+            code (str): Publish code.
+            publish_type (DbPublishType): Type of publish.
+            release (str): Is release or work.
+
+        Returns:
+            DbPublish
+
+        Raises:
+            MissingDbPublishError: No active publish found.
+        """
+        publish_query = select_last_active_publish(
+            self.id, code, publish_type.id, release
+        )
+        with self.db.session() as session:
+            publish = session.scalar(publish_query)
+
+        if publish is None:
+            raise MissingDbPublishError(
+                f"No active {release} publish {code!r} type {publish_type.code!r}."
             )
 
-            session.add(publish)
-            session.commit()
+        return DbPublish(self, publish)
 
-        return self.publish(code, publish_type, release, version)
+    def last_version(self, code: str, publish_type: DbPublishType, release: str) -> int:
+        """Get the last version of given publish code/type, active or not.
 
-    def _publish_path(
+        Args:
+            code (str): Publish code.
+            publish_type (DbPublishType): Type of publish.
+            release (str): Is release or work.
+
+        Returns:
+            int: Last version, 0 if no publish.
+        """
+        version_query = select_last_version(self.id, code, publish_type.id, release)
+        with self.db.session() as session:
+            version = session.scalar(version_query)
+
+        return version or 0
+
+    def create_next_publish(
         self,
         code: str,
         publish_type: DbPublishType,
         release: str,
-        version: int,
-    ) -> str:
-        environ = self.asset.project.metadata.get("env")
-        root_path = environ["TK_PROJECT_PATH"]
+        retries: int = 3,
+    ) -> DbPublish:
+        """Create publish at next version.
 
-        if not root_path:
-            raise ValueError("Missing project root path")
+        Version is allocated atomically in the transaction inserting the
+        publish, see `create_publishes_bulk`.
 
-        publish_name = (
-            f"{self.asset.asset_type.code}_{self.asset.code}_{code}_"
-            f"{publish_type.file_type}_{release[0]}"
-            f"{version:03d}{publish_type.extension}"
-        )
-        if release == "release":
-            publish_path = os.path.join(
-                root_path,
-                "assets",
-                self.asset.asset_type.code,
-                self.asset.code,
-                self.name,
-                code,
-                release,
-                f"{release[0]}{version:03d}",
-                publish_name,
-            )
-            return str(publish_path)
-
-        publish_path = os.path.join(
-            root_path,
-            "assets",
-            self.asset.asset_type.code,
-            self.asset.code,
-            self.name,
-            code,
-            release,
-            publish_name,
+        Args:
+            code (str): Publish code.
+            publish_type (DbPublishType): Type of publish.
+            release (str): Is release or work.
+            retries (int): Number of retries when insert conflicts.
+
+        Returns:
+            DbPublish
+        """
+        spec = PublishSpec(code, publish_type, release)
+        return self.create_publishes_bulk([spec], retries)[0]
+
+    def create_publishes_bulk(
+        self,
+        specs: Iterable[PublishSpec],
+        retries: int = 3,
+    ) -> list[DbPublish]:
+        """Create many publishes at their next versions in a single transaction.
+
+        Versions are reserved from the publish series counters in the insert
+        transaction, so concurrent publishers never allocate the same version.
+        Specs sharing the same code, type and release get consecutive versions
+        in given order. Transaction is retried if insert still conflicts with a
+        publish registered concurrently without version allocation.
+
+        Args:
+            specs (Iterable[PublishSpec]): Publishes to create.
+            retries (int): Number of retries when insert conflicts.
+
+        Returns:
+            list[DbPublish]: Created publishes, in specs order.
+
+        Raises:
+            DbPublishVersionConflictError: Insert still conflicts after retries,
+                or conflicts inside a `Db.transaction` block.
+        """
+        specs = list(specs)
+        if not specs:
+            return []
+
+        path_resolver = self.asset.project.path_resolver()
+        for _ in range(retries + 1):
+            publishes = self._insert_publishes(specs, path_resolver)
+            if publishes is not None:
+                return publishes
+
+        raise DbPublishVersionConflictError(
+            f"Unable to allocate publish versions on {self!r} "
+            f"after {retries} retries."
         )
-        return str(publish_path)
+
+    def _insert_publishes(
+        self,
+        specs: list[PublishSpec],
+        path_resolver: PathResolver,
+    ) -> list[DbPublish] | None:
+        path_codes = (self.asset.asset_type.code, self.asset.code, self.name)
+        with self.db.session() as session:
+            try:
+                publishes = insert_publishes(
+                    session, self.id, path_codes, specs, path_resolver
+                )
+            except IntegrityError as error:
+                if self.db.in_transaction():
+                    # Outer transaction is aborted, it can not be retried here.
+                    raise DbPublishVersionConflictError(
+                        f"Publish versions of {self!r} conflict in transaction."
+                    ) from error
+                session.rollback()
+                return None
+
+        return [DbPublish(self, publish) for publish in publishes]
@@ -20,6 +20,10 @@ class DbTaskType(DbEntity):
         task (TaskType): Task type model object.
     """
 
+    __slots__ = ("db",)
+
+    model = TaskType
+
     def __init__(self, db: Db, task: TaskType):
         super().__init__(task)
         self.db = db
@@ -31,15 +35,9 @@ class DbTaskType(DbEntity):
 
     def is_active(self) -> bool:
         """Return if publish is active or not."""
-        with  self.db.Session() as session:
-            publish = session.query(TaskType).where(TaskType.id == self.id).first()
-            active = publish.active
-
-        return active
+        return self._bc_entity.active
 
     def set_active(self, value):
         """Set publish active or not."""
-        with self.db.Session() as session:
-            publish = session.query(TaskType).where(TaskType.id == self.id).first()
-            publish.active = value
-            session.commit()
+        self._update(active=value)
+        self.db.invalidate_type_cache()
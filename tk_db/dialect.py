@@ -0,0 +1,89 @@
+"""Database dialect specific statements module."""
+
+from __future__ import annotations
+
+import json
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+from sqlalchemy import JSON
+from sqlalchemy import String
+from sqlalchemy import cast
+from sqlalchemy import func
+from sqlalchemy import literal
+from sqlalchemy import type_coerce
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
+
+
+if TYPE_CHECKING:
+    from sqlalchemy import ColumnElement
+    from sqlalchemy.orm import Session
+
+    from tk_db.models import Base
+
+
+def upsert(session: Session, model: type[Base]) -> sqlite.Insert | postgresql.Insert:
+    """Return insert statement of model supporting `ON CONFLICT` clauses.
+
+    Args:
+        session (Session): Session the statement will be executed with.
+        model (type[Base]): Model to insert.
+
+    Returns:
+        sqlite.Insert|postgresql.Insert: Insert statement of session dialect.
+
+    Raises:
+        NotImplementedError: Session database dialect has no upsert support.
+    """
+    dialect_name = session.get_bind().dialect.name
+    if dialect_name == "sqlite":
+        return sqlite.insert(model)
+    if dialect_name == "postgresql":
+        return postgresql.insert(model)
+
+    raise NotImplementedError(f"No upsert support for {dialect_name!r} database.")
+
+
+def json_set_keys(
+    session: Session,
+    column: ColumnElement,
+    values: dict[str, Any],
+) -> ColumnElement:
+    """Return SQL expression of JSON column with given top level keys set.
+
+    A NULL or JSON `null` column is handled as an empty object.
+
+    Args:
+        session (Session): Session the expression will be executed with.
+        column (ColumnElement): JSON object column to update.
+        values (dict[str, Any]): Top level keys and their new values.
+
+    Returns:
+        ColumnElement
+
+    Raises:
+        ValueError: Key can not be expressed as SQLite JSON path.
+        NotImplementedError: Session database dialect has no JSON support.
+    """
+    dialect_name = session.get_bind().dialect.name
+    if dialect_name == "sqlite":
+        arguments = []
+        for key, value in values.items():
+            if '"' in key:
+                raise ValueError(f"Unsupported JSON key {key!r} in SQLite path.")
+            arguments += [f'$."{key}"', func.json(json.dumps(value))]
+        text_column = type_coerce(column, String)
+        document = func.coalesce(func.nullif(text_column, "null"), "{}")
+        return func.json_set(document, *arguments)
+    if dialect_name == "postgresql":
+        json_null = cast(literal("null"), postgresql.JSONB)
+        document = func.coalesce(
+            func.nullif(cast(column, postgresql.JSONB), json_null),
+            cast(literal("{}"), postgresql.JSONB),
+        )
+        merged = document.op("||")(cast(literal(json.dumps(values)), postgresql.JSONB))
+        return cast(merged, JSON)
+
+    raise NotImplementedError(f"No JSON support for {dialect_name!r} database.")
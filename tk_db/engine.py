@@ -0,0 +1,93 @@
+"""Database engine module."""
+
+from __future__ import annotations
+
+import threading
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+from sqlalchemy import create_engine
+from sqlalchemy import event
+
+from tk_db.migrations import ensure_schema
+
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+
+
+DEFAULT_SQLITE_PRAGMAS: dict[str, Any] = {
+    "journal_mode": "WAL",  # Readers do not block writer and conversely.
+    "synchronous": "NORMAL",  # Safe with WAL, no fsync on each commit.
+    "mmap_size": 256 * 1024 * 1024,
+    "busy_timeout": 5000,  # Milliseconds to wait for concurrent writers.
+}
+
+_engines: dict[str, Engine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_engine(
+    url: str,
+    pool_size: int | None = None,
+    sqlite_pragmas: dict[str, Any] | None = None,
+) -> Engine:
+    """Get pooled engine of given database url, shared by the whole process.
+
+    Engine is created, and database schema migrated if outdated, on first call
+    for an url. Options of later calls with the same url are ignored.
+
+    Args:
+        url (str): Database url.
+        pool_size (int|None): Number of pooled connections, SQLAlchemy default
+            if None.
+        sqlite_pragmas (dict[str, Any]|None): Pragmas set on every SQLite
+            connection, merged over `DEFAULT_SQLITE_PRAGMAS`.
+
+    Returns:
+        Engine
+    """
+    with _engines_lock:
+        engine = _engines.get(url)
+        if engine is None:
+            engine = _create_engine(url, pool_size, sqlite_pragmas)
+            ensure_schema(engine)
+            _engines[url] = engine
+
+    return engine
+
+
+def _create_engine(
+    url: str,
+    pool_size: int | None,
+    sqlite_pragmas: dict[str, Any] | None,
+) -> Engine:
+    kwargs = {}
+    if pool_size is not None:
+        kwargs["pool_size"] = pool_size
+    engine = create_engine(url, **kwargs)
+    set_sqlite_pragmas(engine, sqlite_pragmas)
+    return engine
+
+
+def set_sqlite_pragmas(engine: Engine, sqlite_pragmas: dict[str, Any] | None = None):
+    """Set pragmas on every new connection of engine, if it is a SQLite engine.
+
+    Args:
+        engine (Engine): Engine, sync engine of an async engine.
+        sqlite_pragmas (dict[str, Any]|None): Pragmas merged over
+            `DEFAULT_SQLITE_PRAGMAS`.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    pragmas = {**DEFAULT_SQLITE_PRAGMAS, **(sqlite_pragmas or {})}
+
+    def set_pragmas(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+    event.listen(engine, "connect", set_pragmas)
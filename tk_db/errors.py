@@ -42,3 +42,16 @@ class DbTaskAlreadyExistError(Exception):
 
 class DbPublishTypeAlreadyExistError(Exception):
     """Raised when trying to create publish type that already exist."""
+
+class DbPublishVersionConflictError(Exception):
+    """Raised when publish versions can not be allocated without conflict."""
+
+
+class DbQueryCountError(AssertionError):
+    """Raised when a block of code executes more queries than allowed."""
+
+class DbMigrationError(Exception):
+    """Raised when existing database can not be migrated to current schema."""
+
+class DbChangesPrunedError(Exception):
+    """Raised when changes since a revision were pruned from change log."""
@@ -0,0 +1,152 @@
+"""Database schema migration module.
+
+Bring databases created by older versions up to date with `tk_db.models`::
+
+    python -m tk_db.migrations sqlite:////path/to/test_alchemy.db
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import sys
+import warnings
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import create_engine
+from sqlalchemy import delete
+from sqlalchemy import insert
+from sqlalchemy import select
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.exc import SAWarning
+
+from tk_db.errors import DbMigrationError
+from tk_db.models import SCHEMA_VERSION
+from tk_db.models import Base
+from tk_db.models import Meta
+from tk_db.triggers import create_triggers
+
+
+if TYPE_CHECKING:
+    from sqlalchemy import Index
+    from sqlalchemy.engine import Connection
+    from sqlalchemy.engine import Engine
+
+
+# Indexes replaced by newer ones, dropped on migration.
+OBSOLETE_INDEXES = ("ix_publish_task_code_type_release_version",)
+
+SCHEMA_VERSION_KEY = "schema_version"
+
+
+def schema_version(engine: Engine) -> int:
+    """Return schema version stored in given database, 0 if none."""
+    try:
+        with engine.connect() as connection:
+            version = connection.scalar(
+                select(Meta.value).where(Meta.key == SCHEMA_VERSION_KEY)
+            )
+    except (OperationalError, ProgrammingError):  # No meta table yet.
+        return 0
+
+    return version or 0
+
+
+def ensure_schema(engine: Engine):
+    """Migrate given database only if its schema version is outdated.
+
+    Cost a single select on up to date databases instead of the schema
+    introspection of `migrate`.
+
+    Args:
+        engine (Engine): Engine of database to check.
+    """
+    if schema_version(engine) != SCHEMA_VERSION:
+        migrate(engine)
+
+
+def migrate(engine: Engine):
+    """Create missing tables, indexes and triggers of given database, convert old data.
+
+    Every step is idempotent, migrating an up to date database does nothing.
+    Current `SCHEMA_VERSION` is stored in database once migrated.
+
+    Args:
+        engine (Engine): Engine of database to migrate.
+
+    Raises:
+        DbMigrationError: Existing rows violate a unique index to create.
+    """
+    Base.metadata.create_all(bind=engine)
+
+    with engine.begin() as connection:
+        for index_name in OBSOLETE_INDEXES:
+            connection.exec_driver_sql(f"DROP INDEX IF EXISTS {index_name}")
+
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                _create_index(connection, index)
+
+        _migrate_project_metadata(connection)
+        create_triggers(connection)
+
+        connection.execute(delete(Meta).where(Meta.key == SCHEMA_VERSION_KEY))
+        connection.execute(
+            insert(Meta).values(key=SCHEMA_VERSION_KEY, value=SCHEMA_VERSION)
+        )
+
+
+def _create_index(connection: Connection, index: Index):
+    try:
+        with warnings.catch_warnings():
+            # Code search expression indexes are created by `tk_db.triggers`.
+            warnings.filterwarnings(
+                "ignore", "Skipped unsupported reflection of expression", SAWarning
+            )
+            index.create(connection, checkfirst=True)
+    except IntegrityError as error:
+        columns = ", ".join(column.name for column in index.columns)
+        raise DbMigrationError(
+            f"Unable to create unique index {index.name!r}, table "
+            f"{index.table.name!r} has duplicated ({columns}) rows."
+        ) from error
+
+
+def _migrate_project_metadata(connection: Connection):
+    """Convert project metadata stored as python dict repr to JSON."""
+    rows = connection.exec_driver_sql(
+        "SELECT id, CAST(metadata_ AS TEXT) FROM project"
+    ).all()
+    for project_id, metadata in rows:
+        if metadata is None:
+            continue
+        try:
+            json.loads(metadata)
+        except ValueError:
+            connection.execute(
+                text("UPDATE project SET metadata_ = :metadata WHERE id = :id"),
+                {"metadata": json.dumps(ast.literal_eval(metadata)), "id": project_id},
+            )
+
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql(
+            "ALTER TABLE project ALTER COLUMN metadata_ TYPE JSON "
+            "USING metadata_::json"
+        )
+
+
+def main(argv: list[str] | None = None):
+    """Migrate database of given url."""
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        sys.exit("Usage: python -m tk_db.migrations <database url>")
+
+    migrate(create_engine(argv[0]))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,18 +2,33 @@
 
 from __future__ import annotations
 
+from sqlalchemy import JSON
+from sqlalchemy import BigInteger
 from sqlalchemy import Boolean
 from sqlalchemy import Column
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
 from sqlalchemy import Integer
 from sqlalchemy import String
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import relationship
 
 
+# Bump on any model change so existing databases get migrated on connection.
+SCHEMA_VERSION = 5
+
 Base = declarative_base()
 
 
+class Meta(Base):
+    """Database metadata table, key/value counters shared between processes."""
+
+    __tablename__ = "meta"
+
+    key = Column(String, primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
+
+
 class Project(Base):
     """Project table."""
 
@@ -22,7 +37,7 @@ class Project(Base):
     id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     code = Column(String, unique=True, nullable=False)
     name = Column(String, unique=False, nullable=False)
-    metadata_ = Column(String)
+    metadata_ = Column(JSON)
     active = Column(Boolean, default=True)
 
     asset = relationship("Asset", back_populates="project")
@@ -57,6 +72,17 @@ class Asset(Base):
     asset_type = relationship("AssetType", back_populates="asset")
     task = relationship("Task", back_populates="asset")
 
+    __table_args__ = (
+        # Asset lookup in project, an asset code is unique per asset type.
+        Index(
+            "ux_asset_project_type_code",
+            "project_id",
+            "asset_type_id",
+            "code",
+            unique=True,
+        ),
+    )
+
 
 class TaskType(Base):
     """Task type table."""
@@ -85,6 +111,11 @@ class Task(Base):
     task_type = relationship("TaskType", back_populates="task")
     publish = relationship("Publish", back_populates="task")
 
+    __table_args__ = (
+        # Task lookup in asset, an asset has one task of each type.
+        Index("ux_task_asset_type", "asset_id", "task_type_id", unique=True),
+    )
+
 
 class PublishType(Base):
     """Publish type table."""
@@ -118,3 +149,61 @@ class Publish(Base):
 
     publish_type = relationship("PublishType", back_populates="publish")
     task = relationship("Task", back_populates="publish")
+
+    __table_args__ = (
+        # Publish lookup and latest version resolution of a publish
+        # code/type/release in a task, a version exists once per series.
+        Index(
+            "ux_publish_task_code_type_release_version",
+            "task_id",
+            "code",
+            "publish_type_id",
+            "release",
+            "version",
+            unique=True,
+        ),
+    )
+
+
+class PublishVersion(Base):
+    """Publish version counter table, last allocated version of a publish series."""
+
+    __tablename__ = "publish_version"
+
+    task_id = Column(Integer, ForeignKey("task.id"), primary_key=True)
+    code = Column(String, primary_key=True)
+    publish_type_id = Column(Integer, ForeignKey("publish_type.id"), primary_key=True)
+    release = Column(String, primary_key=True)
+    last_version = Column(Integer, nullable=False, default=0)
+
+
+class PublishUsage(Base):
+    """Publish usage summary table, size and count of active publishes by task.
+
+    Maintained by database triggers on publish writes, see `tk_db.triggers`.
+    """
+
+    __tablename__ = "publish_usage"
+
+    task_id = Column(Integer, ForeignKey("task.id"), primary_key=True)
+    size = Column(Integer, nullable=False, default=0)
+    publish_count = Column(Integer, nullable=False, default=0)
+
+
+class ChangeLog(Base):
+    """Entity change log table, one row by written entity row.
+
+    Written by database triggers in the transaction of the entity write, see
+    `tk_db.triggers`, read with `Db.changes_since`.
+    """
+
+    __tablename__ = "change_log"
+    # Revisions are never reused, even once pruned.
+    __table_args__ = ({"sqlite_autoincrement": True},)
+
+    revision = Column(Integer, primary_key=True, autoincrement=True)
+    table_name = Column(String, nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    op = Column(String, nullable=False)  # `insert`, `update` or `delete`.
+    # PostgreSQL id of writing transaction, see `tk_db.changes.changes_since`.
+    xact_id = Column(BigInteger)
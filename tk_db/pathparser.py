@@ -0,0 +1,80 @@
+"""Publish path parser module, resolve filesystem paths back to publishes."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+
+from tk_const import c_db
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+class PublishPathInfo(NamedTuple):
+    """Entity codes of a publish path, see `parse_publish_path`."""
+
+    project: str
+    asset_type: str
+    asset: str
+    task: str  # Task directory, task type name or code.
+    code: str
+    release: str
+    version: int
+    file_type: str
+    extension: str
+
+
+def parse_publish_path(path: str) -> PublishPathInfo | None:
+    """Return entity codes of a publish path.
+
+    Path is matched against `c_db.publish_path_grp_re` in a single pass.
+
+    Args:
+        path (str): Publish file path.
+
+    Returns:
+        PublishPathInfo|None: None if path is not a publish path.
+    """
+    match = c_db.publish_path_grp_re.match(path)
+    if match is None:
+        return None
+
+    release = match["release"]
+    version_name = match["release_letter"] + match["version"]
+    if match["release_letter"] != release[0]:
+        return None
+    # Only release publishes are stored in a version directory.
+    if match["version_dir"] != (version_name if release == "release" else None):
+        return None
+
+    return PublishPathInfo(
+        match["project_code"],
+        match["asset_type_code"],
+        match["asset_code"],
+        match["task_dir"],
+        match["publish_code"],
+        release,
+        int(match["version"]),
+        match["file_desc"],
+        match["extension"],
+    )
+
+
+def parse_publish_paths(paths: Iterable[str]) -> dict[str, PublishPathInfo]:
+    """Return entity codes of many publish paths.
+
+    Args:
+        paths (Iterable[str]): File paths, paths not matching a publish are skipped.
+
+    Returns:
+        dict[str, PublishPathInfo]: Entity codes by publish path.
+    """
+    infos = {}
+    for path in paths:
+        info = parse_publish_path(path)
+        if info is not None:
+            infos[path] = info
+
+    return infos
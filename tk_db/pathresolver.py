@@ -0,0 +1,171 @@
+"""Publish path resolver module."""
+
+from __future__ import annotations
+
+import os
+import re
+
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+
+from tk_const import c_db
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+
+
+class PublishPathFields(NamedTuple):
+    """Fields of a publish path, see `PathResolver.publish_paths`."""
+
+    asset_type: str
+    asset: str
+    task: str
+    code: str
+    file_type: str
+    extension: str
+    release: str
+    version: int
+
+
+# Positional field order of compiled path templates.
+_FIELDS = (*PublishPathFields._fields, "release_letter")
+_FIELD_RE = re.compile(r"{(\w+)([^{}]*)}")
+
+
+class PathResolver:
+    """Build publish paths of a project from `c_db` templates.
+
+    Templates are compiled once with project root path into a single positional
+    format string per release kind, building a path is one string format call.
+
+    Args:
+        root_path (str): Project root path.
+    """
+
+    def __init__(self, root_path: str):
+        if not root_path:
+            raise ValueError("Missing project root path")
+
+        self.root_path = root_path
+        root = root_path.replace("{", "{{").replace("}", "}}")
+        self._format_release_path = self._compile(c_db.publish_release_path_parts, root)
+        self._format_work_path = self._compile(c_db.publish_work_path_parts, root)
+
+    def __repr__(self):
+        return f"PathResolver({self.root_path!r})"
+
+    @classmethod
+    def from_metadata(cls, metadata: dict) -> PathResolver:
+        """Create resolver from project metadata.
+
+        Args:
+            metadata (dict): Project metadata with `env`/`TK_PROJECT_PATH` key.
+
+        Returns:
+            PathResolver
+
+        Raises:
+            ValueError: Metadata has no project root path.
+        """
+        root_path = metadata.get("env", {}).get("TK_PROJECT_PATH")
+        return cls(root_path)
+
+    def publish_path(
+        self,
+        asset_type: str,
+        asset: str,
+        task: str,
+        code: str,
+        file_type: str,
+        extension: str,
+        release: str,
+        version: int,
+    ) -> str:
+        """Return path of a publish.
+
+        Args:
+            asset_type (str): Asset type code.
+            asset (str): Asset code.
+            task (str): Task type name.
+            code (str): Publish code.
+            file_type (str): Publish type file type.
+            extension (str): Publish type extension.
+            release (str): Is release or work.
+            version (int): Publish version.
+
+        Returns:
+            str
+        """
+        format_path = (
+            self._format_release_path if release == "release" else self._format_work_path
+        )
+        return format_path(
+            asset_type,
+            asset,
+            task,
+            code,
+            file_type,
+            extension,
+            release,
+            version,
+            release[0],
+        )
+
+    def publish_paths(self, fields: Iterable[PublishPathFields]) -> list[str]:
+        """Return paths of many publishes.
+
+        Args:
+            fields (Iterable[PublishPathFields]): Fields of each publish path.
+
+        Returns:
+            list[str]: Publish paths, in given order.
+        """
+        format_release_path = self._format_release_path
+        format_work_path = self._format_work_path
+        paths = []
+        append = paths.append
+        for asset_type, asset, task, code, file_type, ext, release, version in fields:
+            format_path = (
+                format_release_path if release == "release" else format_work_path
+            )
+            append(
+                format_path(
+                    asset_type,
+                    asset,
+                    task,
+                    code,
+                    file_type,
+                    ext,
+                    release,
+                    version,
+                    release[0],
+                )
+            )
+
+        return paths
+
+    @staticmethod
+    def _compile(parts: tuple[str, ...], root: str) -> Callable[..., str]:
+        """Return positional format function of a path template.
+
+        File and version names are inlined, named fields are replaced by their
+        `_FIELDS` index and root path is embedded as a literal. Parts are joined
+        with `os.path.join`, like paths built before templates.
+        """
+
+        def replace_field(match: re.Match) -> str:
+            name, spec = match.groups()
+            return f"{{{_FIELDS.index(name)}{spec}}}"
+
+        compiled_parts = []
+        for part in parts:
+            if part == "{root}":
+                compiled_parts.append(root)
+                continue
+            part = part.replace("{file_name}", c_db.publish_file_name_tpl)
+            part = part.replace("{version_name}", c_db.publish_version_name_tpl)
+            compiled_parts.append(_FIELD_RE.sub(replace_field, part))
+
+        return os.path.join(*compiled_parts).format
@@ -0,0 +1,211 @@
+"""Publish query builder module.
+
+Compose publish filters across the whole entity hierarchy, then run them as a
+single joined SQL statement::
+
+    query = (
+        PublishQuery(db)
+        .project("PRJ")
+        .asset_type("chr")
+        .publish_type("abc")
+        .release("release")
+        .active()
+    )
+    for publish in query:
+        ...
+
+Each filter returns a new query, queries can be shared and extended freely.
+Filters of different kinds are combined with AND, values given to a same
+filter with OR.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import func
+from sqlalchemy import or_
+from sqlalchemy import select
+
+from tk_db.dbproject import iter_db_publishes
+from tk_db.dbtask import STREAM_BATCH_SIZE
+from tk_db.models import Asset
+from tk_db.models import AssetType
+from tk_db.models import Project
+from tk_db.models import Publish
+from tk_db.models import PublishType
+from tk_db.models import Task
+from tk_db.models import TaskType
+from tk_db.snapshot import snapshot_select
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+    from sqlalchemy import ColumnElement
+    from sqlalchemy import Select
+
+    from tk_db.db import Db
+    from tk_db.dbpublish import DbPublish
+
+
+def escape_like(text: str) -> str:
+    """Escape SQL `LIKE` wildcards of text with backslash."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def like_pattern(pattern: str) -> str:
+    """Convert glob pattern to SQL `LIKE` pattern escaped with backslash.
+
+    `*` matches any characters and `?` a single one, `%` and `_` are literal.
+
+    Args:
+        pattern (str): Glob pattern like `hero_*`.
+
+    Returns:
+        str
+    """
+    return escape_like(pattern).replace("*", "%").replace("?", "_")
+
+
+def _match_any(column: ColumnElement, patterns: Iterable[str]) -> ColumnElement:
+    """Return clause matching column against any of given glob patterns.
+
+    Matching ignores case for exact values and globs alike, whatever the case
+    rule of database `LIKE`.
+    """
+    column = func.lower(column)
+    clauses = [
+        column.like(like_pattern(pattern.lower()), escape="\\")
+        if "*" in pattern or "?" in pattern
+        else column == pattern.lower()
+        for pattern in patterns
+    ]
+    return or_(*clauses)
+
+
+class PublishQuery:
+    """Composable publish query across projects, assets and tasks.
+
+    Results are read-only publish snapshots, see `tk_db.snapshot`, streamed by
+    batches in no particular order. Projects, assets and tasks of results are
+    shared by publishes.
+
+    Args:
+        db (Db): Database object to query.
+        filters (Iterable[ColumnElement]): SQL clauses publishes must match.
+    """
+
+    def __init__(self, db: Db, filters: Iterable[ColumnElement] = ()):
+        self.db = db
+        self._filters = tuple(filters)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.statement})"
+
+    def __iter__(self) -> Iterator[DbPublish]:
+        return self.iter_publishes()
+
+    @property
+    def statement(self) -> Select:
+        """Return select statement of query, rows are publish, task, asset, project."""
+        return (
+            snapshot_select(Publish, Task, Asset, Project)
+            .join(Task, Publish.task_id == Task.id)
+            .join(Asset, Task.asset_id == Asset.id)
+            .join(Project, Asset.project_id == Project.id)
+            .where(*self._filters)
+        )
+
+    def where(self, *clauses: ColumnElement) -> PublishQuery:
+        """Return query with given SQL clauses added to its filters.
+
+        Clauses can use columns of `Publish`, `Task`, `Asset` and `Project`.
+        """
+        return self.__class__(self.db, (*self._filters, *clauses))
+
+    def project(self, *codes: str) -> PublishQuery:
+        """Filter publishes of projects of given codes or glob patterns."""
+        return self.where(_match_any(Project.code, codes))
+
+    def asset_type(self, *codes: str) -> PublishQuery:
+        """Filter publishes of assets of asset types of given codes."""
+        return self.where(
+            Asset.asset_type_id.in_(select(AssetType.id).where(AssetType.code.in_(codes)))
+        )
+
+    def asset(self, *codes: str) -> PublishQuery:
+        """Filter publishes of assets of given codes or glob patterns."""
+        return self.where(_match_any(Asset.code, codes))
+
+    def task_type(self, *codes: str) -> PublishQuery:
+        """Filter publishes of tasks of task types of given codes."""
+        return self.where(
+            Task.task_type_id.in_(select(TaskType.id).where(TaskType.code.in_(codes)))
+        )
+
+    def publish_type(self, *codes: str) -> PublishQuery:
+        """Filter publishes of publish types of given codes."""
+        return self.where(
+            Publish.publish_type_id.in_(
+                select(PublishType.id).where(PublishType.code.in_(codes))
+            )
+        )
+
+    def code(self, *codes: str) -> PublishQuery:
+        """Filter publishes of given codes or glob patterns."""
+        return self.where(_match_any(Publish.code, codes))
+
+    def release(self, *releases: str) -> PublishQuery:
+        """Filter publishes of given releases, like `release` or `work`."""
+        return self.where(Publish.release.in_(releases))
+
+    def version(
+        self, minimum: int | None = None, maximum: int | None = None
+    ) -> PublishQuery:
+        """Filter publishes of versions in given inclusive range.
+
+        Args:
+            minimum (int|None): Lowest version, no lower bound if None.
+            maximum (int|None): Highest version, no upper bound if None.
+        """
+        clauses = []
+        if minimum is not None:
+            clauses.append(Publish.version >= minimum)
+        if maximum is not None:
+            clauses.append(Publish.version <= maximum)
+        return self.where(*clauses)
+
+    def active(self, value: bool = True) -> PublishQuery:
+        """Filter active publishes, or inactive ones if value is False."""
+        return self.where(Publish.active.is_(value))
+
+    def iter_publishes(self, batch_size: int = STREAM_BATCH_SIZE) -> Iterator[DbPublish]:
+        """Stream query publishes, see `DbProject.iter_publishes`.
+
+        Args:
+            batch_size (int): Number of rows fetched at once.
+
+        Yields:
+            DbPublish
+        """
+        statement = self.statement.execution_options(yield_per=batch_size)
+        with self.db.session() as session:
+            yield from iter_db_publishes(self.db, session.execute(statement))
+
+    def all(self) -> list[DbPublish]:
+        """Return all query publishes."""
+        return list(self.iter_publishes())
+
+    def first(self) -> DbPublish | None:
+        """Return query publish of lowest id, None if no publish matches."""
+        with self.db.session() as session:
+            rows = session.execute(self.statement.order_by(Publish.id).limit(1))
+            return next(iter_db_publishes(self.db, rows), None)
+
+    def count(self) -> int:
+        """Return number of query publishes, counted in database."""
+        count_query = self.statement.with_only_columns(func.count())
+        with self.db.session() as session:
+            return session.scalar(count_query)
@@ -0,0 +1,75 @@
+"""Database query count module.
+
+Used to catch N+1 query regressions::
+
+    with assert_max_queries(db, 3):
+        project.tree()
+"""
+
+from __future__ import annotations
+
+import contextlib
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import event
+
+from tk_db.errors import DbQueryCountError
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from typing_extensions import Self
+
+    from tk_db.aio.db import AsyncDb
+    from tk_db.db import Db
+
+
+class QueryCounter:
+    """Record every SQL statement executed on database engine while active.
+
+    Args:
+        db (Db|AsyncDb): Database object to watch.
+    """
+
+    def __init__(self, db: Db | AsyncDb):
+        # Async engine events are listened on its sync engine.
+        self._engine = getattr(db.engine, "sync_engine", db.engine)
+        self.statements: list[str] = []
+
+    def __enter__(self) -> Self:
+        event.listen(self._engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *args):
+        event.remove(self._engine, "before_cursor_execute", self._on_execute)
+
+    @property
+    def count(self) -> int:
+        """Return number of executed statements."""
+        return len(self.statements)
+
+    def _on_execute(self, _conn, _cursor, statement, *_args):
+        self.statements.append(statement)
+
+
+@contextlib.contextmanager
+def assert_max_queries(db: Db | AsyncDb, max_count: int) -> Iterator[QueryCounter]:
+    """Raise if wrapped block executes more than given number of queries.
+
+    Args:
+        db (Db|AsyncDb): Database object to watch.
+        max_count (int): Maximum number of allowed statements.
+
+    Raises:
+        DbQueryCountError: Wrapped block executed too many statements.
+    """
+    with QueryCounter(db) as counter:
+        yield counter
+
+    if counter.count > max_count:
+        statements = "\n".join(counter.statements)
+        raise DbQueryCountError(
+            f"{counter.count} queries executed, {max_count} allowed:\n{statements}"
+        )
@@ -0,0 +1,186 @@
+"""Publish reconciliation module.
+
+Update publish sizes and active states from files on disk::
+
+    python -m tk_db.reconcile PRJ --url sqlite:////path/to/test_alchemy.db
+
+Publishes are read in batches by id, their files are stat in a thread pool and
+changed rows are updated with one bulk `UPDATE` by primary key per batch.
+"""
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import logging
+import os
+import time
+
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+
+from sqlalchemy import select
+from sqlalchemy import update
+
+from tk_db.db import Db
+from tk_db.models import Asset
+from tk_db.models import Publish
+from tk_db.models import Task
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from sqlalchemy.engine import Row
+
+    from tk_db.dbproject import DbProject
+
+
+logger = logging.getLogger(__name__)
+
+
+class ReconcileReport(NamedTuple):
+    """Counts of a reconciliation, see `PublishReconciler.run`."""
+
+    checked: int
+    updated: int
+    missing: int
+
+
+def file_size(path: str) -> int | None:
+    """Return size of file, None if missing."""
+    try:
+        return os.stat(path).st_size
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+class PublishReconciler:
+    """Update publish sizes and active states from their files.
+
+    Publishes whose file exists are activated with its size, others are
+    deactivated with their size left untouched.
+
+    Args:
+        db (Db): Database to reconcile.
+        project (DbProject|None): Only reconcile publishes of project if any.
+        workers (int): Number of stat threads.
+        batch_size (int): Number of publishes checked and updated per transaction.
+    """
+
+    def __init__(
+        self,
+        db: Db,
+        project: DbProject | None = None,
+        workers: int = 16,
+        batch_size: int = 2000,
+    ):
+        self.db = db
+        self.project = project
+        self.workers = workers
+        self.batch_size = batch_size
+
+    def run(self) -> ReconcileReport:
+        """Check every publish file and update changed publishes.
+
+        Returns:
+            ReconcileReport
+        """
+        started = time.perf_counter()
+        report = ReconcileReport(0, 0, 0)
+        with concurrent.futures.ThreadPoolExecutor(self.workers) as executor:
+            for publishes in self._publish_batches():
+                sizes = executor.map(file_size, [publish.path for publish in publishes])
+                rows = []
+                missing = 0
+                for publish, size in zip(publishes, sizes):
+                    if size is None:
+                        missing += 1
+                        if publish.active:
+                            rows.append({"id": publish.id, "active": False})
+                    elif size != publish.size or not publish.active:
+                        rows.append({"id": publish.id, "size": size, "active": True})
+
+                self._update(rows)
+                report = ReconcileReport(
+                    report.checked + len(publishes),
+                    report.updated + len(rows),
+                    report.missing + missing,
+                )
+                logger.info(
+                    "%d publishes checked, %d updated, %d missing, %.0f publishes/s",
+                    report.checked,
+                    report.updated,
+                    report.missing,
+                    report.checked / (time.perf_counter() - started),
+                )
+
+        return report
+
+    def _publish_batches(self) -> Iterator[list[Row]]:
+        """Yield publishes to check by id order, one query per batch."""
+        last_id = 0
+        while True:
+            publish_query = (
+                select(Publish.id, Publish.path, Publish.size, Publish.active)
+                .where(Publish.id > last_id)
+                .order_by(Publish.id)
+                .limit(self.batch_size)
+            )
+            if self.project is not None:
+                publish_query = (
+                    publish_query.join(Task)
+                    .join(Asset)
+                    .where(Asset.project_id == self.project.id)
+                )
+
+            with self.db.session() as session:
+                publishes = session.execute(publish_query).all()
+            if not publishes:
+                return
+
+            yield publishes
+            last_id = publishes[-1].id
+
+    def _update(self, rows: list[dict]):
+        """Update publishes by primary key in one executemany statement."""
+        if not rows:
+            return
+
+        # Deactivated rows have no size, both row shapes are updated separately.
+        with self.db.transaction() as session:
+            for keys in ({"id", "active"}, {"id", "size", "active"}):
+                key_rows = [row for row in rows if row.keys() == keys]
+                if key_rows:
+                    session.execute(update(Publish), key_rows)
+
+
+def main(argv: list[str] | None = None):
+    """Reconcile publishes of database and print disk usage by task."""
+    parser = argparse.ArgumentParser(
+        prog="python -m tk_db.reconcile",
+        description="Update publish sizes and active states from files on disk.",
+    )
+    parser.add_argument("project", nargs="?", help="Project code, all if not set.")
+    parser.add_argument("--url", help="Database url, TK_DB_URL if not set.")
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--batch-size", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    db = Db(args.url)
+    project = db.project(args.project) if args.project else None
+    reconciler = PublishReconciler(db, project, args.workers, args.batch_size)
+    reconciler.run()
+
+    projects = [project] if project else db.projects()
+    rows = [row for db_project in projects for row in db_project.usage("task", True)]
+    for row in rows:
+        print(
+            f"{row.project:<12} {row.asset_type}_{row.asset:<30} {row.task:<16} "
+            f"{row.count:>8} {row.size:>16,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,418 @@
+"""Publish filesystem scanner module.
+
+Register publishes found on disk under a project root but missing in database::
+
+    python -m tk_db.scanner PRJ --url sqlite:////path/to/test_alchemy.db
+
+Asset directories are listed in a thread pool, publishes are inserted in
+batched transactions. Asset directories already ingested are recorded in a
+state file, so an interrupted scan resumes where it stopped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import itertools
+import logging
+import os
+import time
+
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+
+from sqlalchemy import select
+
+from tk_db.db import Db
+from tk_db.dialect import upsert
+from tk_db.models import Asset
+from tk_db.models import Publish
+from tk_db.models import Task
+from tk_db.pathparser import parse_publish_path
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from sqlalchemy.orm import Session
+
+    from tk_db.dbproject import DbProject
+    from tk_db.pathparser import PublishPathInfo
+
+
+logger = logging.getLogger(__name__)
+
+
+class ScannedFile(NamedTuple):
+    """Publish file found on disk."""
+
+    path: str
+    info: PublishPathInfo
+    size: int
+
+
+class ScanReport(NamedTuple):
+    """Counts of a scan, see `PublishScanner.run`."""
+
+    directories: int
+    files: int
+    inserted: int
+    skipped: int
+
+
+def scan_directory(path: str) -> tuple[list[ScannedFile], int]:
+    """Return publish files found recursively in directory.
+
+    File size comes from the `os.scandir` entry stat, files are not stat twice.
+
+    Args:
+        path (str): Directory to scan.
+
+    Returns:
+        tuple[list[ScannedFile], int]: Publish files and number of other files.
+    """
+    files = []
+    ignored = 0
+    directories = [path]
+    while directories:
+        with os.scandir(directories.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append(entry.path)
+                    continue
+
+                info = parse_publish_path(entry.path)
+                if info is None:
+                    ignored += 1
+                    continue
+
+                size = entry.stat(follow_symlinks=False).st_size
+                files.append(ScannedFile(entry.path, info, size))
+
+    return files, ignored
+
+
+def asset_directories(root_path: str) -> list[str]:
+    """Return asset directories of a project root, `<root>/assets/<type>/<asset>`.
+
+    Args:
+        root_path (str): Project root path.
+
+    Returns:
+        list[str]: Sorted asset directories.
+    """
+    assets_path = os.path.join(root_path, "assets")
+    if not os.path.isdir(assets_path):
+        return []
+
+    directories = []
+    with os.scandir(assets_path) as type_entries:
+        for type_entry in type_entries:
+            if not type_entry.is_dir(follow_symlinks=False):
+                continue
+            with os.scandir(type_entry.path) as asset_entries:
+                directories.extend(
+                    entry.path
+                    for entry in asset_entries
+                    if entry.is_dir(follow_symlinks=False)
+                )
+
+    return sorted(directories)
+
+
+class PublishScanner:
+    """Ingest publishes found on disk under a project root in database.
+
+    Asset types, task types and publish types must exist in database, files of
+    unknown types are skipped. Missing assets and tasks are created. Publish
+    version counters need no update, they never go below registered versions.
+
+    Args:
+        project (DbProject): Project to scan, root path is read from its metadata.
+        workers (int): Number of directory scanning threads.
+        batch_size (int): Number of files inserted per transaction.
+        state_path (str|None): File recording ingested asset directories, to
+            resume an interrupted scan. No resume if None.
+    """
+
+    def __init__(
+        self,
+        project: DbProject,
+        workers: int = 8,
+        batch_size: int = 5000,
+        state_path: str | None = None,
+    ):
+        self.project = project
+        self.db = project.db
+        self.root_path = project.path_resolver().root_path
+        self.workers = workers
+        self.batch_size = batch_size
+        self.state_path = state_path
+
+        self._asset_type_ids: dict[str, int] = {}
+        self._task_type_ids: dict[str, int] = {}
+        self._publish_type_ids: dict[tuple[str, str], int | None] = {}
+        self._asset_ids: dict[tuple[int, str], int] = {}
+        self._task_ids: dict[tuple[int, int], int] = {}
+
+    def run(self) -> ScanReport:
+        """Scan project root and insert missing publishes.
+
+        Returns:
+            ScanReport
+        """
+        self._load_ids()
+        done = self._done_directories()
+        directories = [
+            path for path in asset_directories(self.root_path) if path not in done
+        ]
+        logger.info(
+            "Scanning %d asset directories of %s (%d already done).",
+            len(directories),
+            self.root_path,
+            len(done),
+        )
+
+        started = time.perf_counter()
+        report = ScanReport(0, 0, 0, 0)
+        pending_files: list[ScannedFile] = []
+        pending_directories: list[str] = []
+        for directory, files, ignored in self._scan(directories):
+            pending_files.extend(files)
+            pending_directories.append(directory)
+            report = report._replace(skipped=report.skipped + ignored)
+            if len(pending_files) >= self.batch_size:
+                report = self._flush(report, pending_files, pending_directories)
+                self._log_progress(report, len(directories), started)
+
+        report = self._flush(report, pending_files, pending_directories)
+        self._log_progress(report, len(directories), started)
+        return report
+
+    def _scan(self, directories: list[str]) -> Iterator[tuple[str, list, int]]:
+        """Yield scanned directories as their thread completes.
+
+        Two directories per worker are scanned ahead at most, so scanned files
+        waiting for their insert stay bounded on large projects.
+        """
+        pending = iter(directories)
+        with concurrent.futures.ThreadPoolExecutor(self.workers) as executor:
+            futures = {
+                executor.submit(scan_directory, directory): directory
+                for directory in itertools.islice(pending, self.workers * 2)
+            }
+            while futures:
+                done, _ = concurrent.futures.wait(
+                    futures, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    directory = futures.pop(future)
+                    next_directory = next(pending, None)
+                    if next_directory is not None:
+                        future_directory = executor.submit(scan_directory, next_directory)
+                        futures[future_directory] = next_directory
+                    files, ignored = future.result()
+                    yield directory, files, ignored
+
+    def _flush(
+        self,
+        report: ScanReport,
+        files: list[ScannedFile],
+        directories: list[str],
+    ) -> ScanReport:
+        """Insert pending files in one transaction and record their directories."""
+        if not directories:
+            return report
+
+        with self.db.transaction() as session:
+            rows = self._publish_rows(session, files)
+            inserted = 0
+            if rows:
+                # Any unique conflict, path or publish identity, skips the file.
+                insert_query = (
+                    upsert(session, Publish)
+                    .on_conflict_do_nothing()
+                    .returning(Publish.id)
+                )
+                inserted = len(session.scalars(insert_query, rows).all())
+
+        self._record_done_directories(directories)
+        report = ScanReport(
+            report.directories + len(directories),
+            report.files + len(files),
+            report.inserted + inserted,
+            report.skipped + len(files) - len(rows),
+        )
+        files.clear()
+        directories.clear()
+        return report
+
+    def _publish_rows(self, session: Session, files: list[ScannedFile]) -> list[dict]:
+        """Return publish rows of files, creating their missing assets and tasks."""
+        files = [file for file in files if self._is_known(file)]
+        self._create_assets(session, files)
+        self._create_tasks(session, files)
+
+        rows = []
+        for file in files:
+            info = file.info
+            asset_id = self._asset_ids[self._asset_type_ids[info.asset_type], info.asset]
+            rows.append(
+                {
+                    "code": info.code,
+                    "path": file.path,
+                    "version": info.version,
+                    "release": info.release,
+                    "size": file.size,
+                    "active": True,
+                    "publish_type_id": self._publish_type_ids[
+                        info.file_type, info.extension
+                    ],
+                    "task_id": self._task_ids[asset_id, self._task_type_ids[info.task]],
+                }
+            )
+
+        return rows
+
+    def _is_known(self, file: ScannedFile) -> bool:
+        """Return if file project and types exist in database."""
+        info = file.info
+        return (
+            info.project == self.project.code
+            and info.asset_type in self._asset_type_ids
+            and info.task in self._task_type_ids
+            and self._publish_type_ids.get((info.file_type, info.extension)) is not None
+        )
+
+    def _create_assets(self, session: Session, files: list[ScannedFile]):
+        """Insert missing assets of files."""
+        missing = {
+            (self._asset_type_ids[file.info.asset_type], file.info.asset)
+            for file in files
+        }
+        missing.difference_update(self._asset_ids)
+        if not missing:
+            return
+
+        insert_query = upsert(session, Asset)
+        # No-op update so conflicting existing rows are returned.
+        insert_query = insert_query.on_conflict_do_update(
+            index_elements=["project_id", "asset_type_id", "code"],
+            set_={"code": insert_query.excluded.code},
+        ).returning(Asset.id, Asset.asset_type_id, Asset.code)
+        rows = [
+            {"project_id": self.project.id, "asset_type_id": type_id, "code": code}
+            for type_id, code in sorted(missing)
+        ]
+        for asset_id, type_id, code in session.execute(insert_query, rows):
+            self._asset_ids[type_id, code] = asset_id
+
+    def _create_tasks(self, session: Session, files: list[ScannedFile]):
+        """Insert missing tasks of files, their assets must exist."""
+        missing = set()
+        for file in files:
+            info = file.info
+            asset_id = self._asset_ids[self._asset_type_ids[info.asset_type], info.asset]
+            missing.add((asset_id, self._task_type_ids[info.task]))
+        missing.difference_update(self._task_ids)
+        if not missing:
+            return
+
+        insert_query = upsert(session, Task)
+        insert_query = insert_query.on_conflict_do_update(
+            index_elements=["asset_id", "task_type_id"],
+            set_={"task_type_id": insert_query.excluded.task_type_id},
+        ).returning(Task.id, Task.asset_id, Task.task_type_id)
+        rows = [
+            {"asset_id": asset_id, "task_type_id": type_id}
+            for asset_id, type_id in sorted(missing)
+        ]
+        for task_id, asset_id, type_id in session.execute(insert_query, rows):
+            self._task_ids[asset_id, type_id] = task_id
+
+    def _load_ids(self):
+        """Load ids of types, project assets and tasks."""
+        self._asset_type_ids = {
+            asset_type.code: asset_type.id for asset_type in self.db.asset_types()
+        }
+        # Publish directories are named after task type names, codes are accepted.
+        task_types = self.db.task_types()
+        self._task_type_ids = {task_type.code: task_type.id for task_type in task_types}
+        self._task_type_ids.update(
+            (task_type.name, task_type.id) for task_type in task_types
+        )
+        # Publish type from file name, None when ambiguous.
+        self._publish_type_ids = {}
+        for publish_type in self.db.publish_types():
+            key = (publish_type.file_type, publish_type.extension)
+            self._publish_type_ids[key] = (
+                None if key in self._publish_type_ids else publish_type.id
+            )
+
+        with self.db.session() as session:
+            asset_query = select(Asset.id, Asset.asset_type_id, Asset.code).where(
+                Asset.project_id == self.project.id
+            )
+            self._asset_ids = {
+                (type_id, code): asset_id
+                for asset_id, type_id, code in session.execute(asset_query)
+            }
+            task_query = (
+                select(Task.id, Task.asset_id, Task.task_type_id)
+                .join(Asset)
+                .where(Asset.project_id == self.project.id)
+            )
+            self._task_ids = {
+                (asset_id, type_id): task_id
+                for task_id, asset_id, type_id in session.execute(task_query)
+            }
+
+    def _done_directories(self) -> set[str]:
+        """Return asset directories ingested by a previous scan."""
+        if not self.state_path or not os.path.exists(self.state_path):
+            return set()
+        with open(self.state_path, encoding="utf-8") as state_file:
+            return {line.rstrip("\n") for line in state_file if line.strip()}
+
+    def _record_done_directories(self, directories: list[str]):
+        """Append ingested asset directories to state file."""
+        if not self.state_path:
+            return
+        with open(self.state_path, "a", encoding="utf-8") as state_file:
+            state_file.writelines(f"{directory}\n" for directory in directories)
+
+    @staticmethod
+    def _log_progress(report: ScanReport, total: int, started: float):
+        elapsed = time.perf_counter() - started
+        logger.info(
+            "%d/%d directories, %d files, %d inserted, %d skipped, %.0f files/s",
+            report.directories,
+            total,
+            report.files,
+            report.inserted,
+            report.skipped,
+            report.files / elapsed if elapsed else 0.0,
+        )
+
+
+def main(argv: list[str] | None = None):
+    """Scan project root of given project code."""
+    parser = argparse.ArgumentParser(
+        prog="python -m tk_db.scanner",
+        description="Register publishes found on disk in database.",
+    )
+    parser.add_argument("project", help="Project code.")
+    parser.add_argument("--url", help="Database url, TK_DB_URL if not set.")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--state-file", help="Resume file of ingested directories.")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    project = Db(args.url).project(args.project)
+    scanner = PublishScanner(project, args.workers, args.batch_size, args.state_file)
+    scanner.run()
+
+
+if __name__ == "__main__":
+    main()
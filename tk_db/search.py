@@ -0,0 +1,175 @@
+"""Asset and publish code search module.
+
+Codes are matched anywhere by trigram indexes, created with triggers, see
+`tk_db.triggers`: FTS5 `<table>_search` tables on SQLite, `pg_trgm` indexes on
+PostgreSQL.
+
+Codes starting with text are read first from `lower(code)` indexes, they
+outrank any other match: trigram indexes are only queried for remaining
+results when there are less of them than requested. Only first
+`SEARCH_CANDIDATES` matches of each kind are ranked, ranking all matches of a
+short text would read most of the table: exact codes first, then codes
+starting with text, then shortest codes.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+
+from sqlalchemy import case
+from sqlalchemy import func
+from sqlalchemy import literal
+from sqlalchemy import literal_column
+from sqlalchemy import null
+from sqlalchemy import select
+from sqlalchemy import table
+
+from tk_db.models import Asset
+from tk_db.models import Publish
+from tk_db.query import escape_like
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlalchemy import Select
+    from sqlalchemy.orm import Session
+
+    from tk_db.models import Base
+
+
+# Searchable entity models by kind, kinds are table names of `SEARCH_TABLES`.
+SEARCH_KINDS: dict[str, type[Base]] = {"asset": Asset, "publish": Publish}
+
+# Max matches of each kind read and ranked by search.
+SEARCH_CANDIDATES = 1000
+
+# Trigram indexes only match text of at least three characters.
+MIN_TRIGRAM_LENGTH = 3
+
+# Greater than any character, upper bound of prefix ranges.
+_MAX_CHARACTER = "\U0010ffff"
+
+
+class SearchResult(NamedTuple):
+    """Entity matching a search text."""
+
+    kind: str
+    id: int
+    code: str
+    path: str | None  # Publish file path, None for assets.
+    score: int  # 0 for exact code, 1 for code starting with text, 2 otherwise.
+
+
+def search(
+    session: Session,
+    text: str,
+    kinds: Iterable[str] = tuple(SEARCH_KINDS),
+    limit: int = 50,
+) -> list[SearchResult]:
+    """Return entities of given kinds which code contains given text, ranked.
+
+    Matching is case insensitive.
+
+    Args:
+        session (Session): Session to run search queries in.
+        text (str): Text to look for in codes.
+        kinds (Iterable[str]): Kinds of entities to search, see `SEARCH_KINDS`.
+        limit (int): Maximum number of results.
+
+    Returns:
+        list[SearchResult]: Best results first.
+
+    Raises:
+        ValueError: Unknown search kind.
+    """
+    text = text.strip()
+    if not text:
+        return []
+
+    results = []
+    for kind in kinds:
+        model = SEARCH_KINDS.get(kind)
+        if model is None:
+            raise ValueError(
+                f"Unknown search kind {kind!r}, expected {tuple(SEARCH_KINDS)}."
+            )
+
+        lowered = text.lower()
+        # Read in code order from index, exact code is read before longer ones.
+        prefix_candidates = (
+            select(model.id)
+            .where(
+                func.lower(model.code) >= lowered,
+                func.lower(model.code) < lowered + _MAX_CHARACTER,
+            )
+            .order_by(func.lower(model.code))
+        )
+        rows = session.execute(
+            _ranked_select(model, text, prefix_candidates, limit)
+        ).all()
+        if len(rows) < limit:
+            # Every code starting with text was read, fill with other matches.
+            candidates = _candidates_select(
+                session.bind.dialect.name,
+                kind,
+                model,
+                text,
+                [row.id for row in rows],
+            )
+            rows += session.execute(
+                _ranked_select(model, text, candidates, limit - len(rows))
+            ).all()
+        results.extend(SearchResult(kind, *row) for row in rows)
+
+    results.sort(key=lambda result: (result.score, len(result.code), result.id))
+    return results[:limit]
+
+
+def _ranked_select(
+    model: type[Base], text: str, candidates: Select, limit: int
+) -> Select:
+    """Return select of best candidates, rows are id, code, path, score."""
+    candidates = candidates.limit(SEARCH_CANDIDATES).subquery()
+    code = func.lower(model.code)
+    score = case(
+        (code == text.lower(), literal(0)),
+        (code.like(f"{escape_like(text.lower())}%", escape="\\"), literal(1)),
+        else_=literal(2),
+    ).label("score")
+    path = model.path if model is Publish else null()
+    return (
+        select(model.id, model.code, path, score)
+        .join(candidates, model.id == candidates.c.id)
+        .order_by(score, func.length(model.code), model.id)
+        .limit(limit)
+    )
+
+
+def _candidates_select(
+    dialect: str,
+    kind: str,
+    model: type[Base],
+    text: str,
+    exclude_ids: list[int],
+) -> Select:
+    """Return select of ids of entities which code contains text, but excluded ids."""
+    if dialect == "sqlite" and len(text) >= MIN_TRIGRAM_LENGTH:
+        index = table(f"{kind}_search")
+        phrase = '"{}"'.format(text.replace('"', '""'))
+        rowid = literal_column("rowid")
+        return (
+            select(rowid.label("id"))
+            .select_from(index)
+            .where(
+                literal_column(index.name).op("MATCH")(phrase),
+                rowid.not_in(exclude_ids),
+            )
+        )
+
+    # Served by pg_trgm indexes, short text is scanned on SQLite.
+    return select(model.id).where(
+        model.code.ilike(f"%{escape_like(text)}%", escape="\\"),
+        model.id.not_in(exclude_ids),
+    )
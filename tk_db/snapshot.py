@@ -0,0 +1,61 @@
+"""Read-only entity row snapshots module.
+
+Snapshots are named tuples of model column values, built from Core row tuples.
+Entities of list results wrap them instead of ORM instances: no instance state
+nor identity map entry is kept per row. Writes through entity still go through
+the ORM, see `DbEntity._update`.
+"""
+
+from __future__ import annotations
+
+import functools
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import NamedTuple
+
+from sqlalchemy import inspect
+from sqlalchemy import select
+
+
+if TYPE_CHECKING:
+    from sqlalchemy import Select
+    from sqlalchemy.orm import InstrumentedAttribute
+
+    from tk_db.models import Base
+
+
+@functools.cache
+def snapshot_type(model: type[Base]) -> type[tuple]:
+    """Return snapshot named tuple type of model, fields are column attribute names."""
+    fields = [(column.key, Any) for column in inspect(model).column_attrs]
+    return NamedTuple(f"{model.__name__}Snapshot", fields)
+
+
+def snapshot_columns(model: type[Base]) -> list[InstrumentedAttribute]:
+    """Return model column attributes, in snapshot field order."""
+    return [getattr(model, key) for key in snapshot_type(model)._fields]
+
+
+def snapshot_select(model: type[Base], *entities: Any) -> Select:
+    """Return select of model snapshot columns, followed by given entities.
+
+    Args:
+        model (type[Base]): Model of snapshots.
+        entities (Any): Extra columns or models selected after snapshot columns.
+
+    Returns:
+        Select: Rows start with snapshot fields, see `split_snapshot`.
+    """
+    return select(*snapshot_columns(model), *entities)
+
+
+def split_snapshot(model: type[Base], row: tuple) -> tuple[tuple, ...]:
+    """Split row of `snapshot_select` in model snapshot and extra entities.
+
+    Returns:
+        tuple[tuple, ...]: Snapshot then extra entities of row.
+    """
+    snapshot = snapshot_type(model)
+    size = len(snapshot._fields)
+    return (snapshot._make(row[:size]), *row[size:])
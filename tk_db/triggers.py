@@ -0,0 +1,276 @@
+"""Database triggers module, summary tables maintained by the database itself.
+
+Triggers are written for each supported dialect and (re)created on migration,
+their summary tables are rebuilt from source tables at the same time. Code
+search indexes, see `tk_db.search`, and the entity change log, see
+`tk_db.changes`, are created here too.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from tk_db.models import Base
+
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection
+
+
+# Tables of code search indexes.
+SEARCH_TABLES = ("asset", "publish")
+
+# Entity tables which writes are recorded in `change_log`.
+CHANGE_LOG_TABLES = (
+    "project",
+    "asset_type",
+    "task_type",
+    "publish_type",
+    "asset",
+    "task",
+    "publish",
+)
+
+# Size and count of active publishes by task, table `publish_usage`.
+_SQLITE_PUBLISH_USAGE = (
+    """
+    CREATE TRIGGER IF NOT EXISTS publish_usage_insert AFTER INSERT ON publish
+    BEGIN
+        INSERT INTO publish_usage (task_id, size, publish_count)
+        SELECT NEW.task_id, COALESCE(NEW.size, 0), 1 WHERE NEW.active
+        ON CONFLICT (task_id) DO UPDATE SET
+            size = size + excluded.size,
+            publish_count = publish_count + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS publish_usage_update
+    AFTER UPDATE OF size, active, task_id ON publish
+    BEGIN
+        UPDATE publish_usage SET
+            size = size - COALESCE(OLD.size, 0),
+            publish_count = publish_count - 1
+        WHERE task_id = OLD.task_id AND OLD.active;
+        INSERT INTO publish_usage (task_id, size, publish_count)
+        SELECT NEW.task_id, COALESCE(NEW.size, 0), 1 WHERE NEW.active
+        ON CONFLICT (task_id) DO UPDATE SET
+            size = size + excluded.size,
+            publish_count = publish_count + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS publish_usage_delete AFTER DELETE ON publish
+    BEGIN
+        UPDATE publish_usage SET
+            size = size - COALESCE(OLD.size, 0),
+            publish_count = publish_count - 1
+        WHERE task_id = OLD.task_id AND OLD.active;
+    END
+    """,
+)
+
+_POSTGRESQL_PUBLISH_USAGE = (
+    """
+    CREATE OR REPLACE FUNCTION publish_usage_refresh() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.active THEN
+            UPDATE publish_usage SET
+                size = size - COALESCE(OLD.size, 0),
+                publish_count = publish_count - 1
+            WHERE task_id = OLD.task_id;
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.active THEN
+            INSERT INTO publish_usage (task_id, size, publish_count)
+            VALUES (NEW.task_id, COALESCE(NEW.size, 0), 1)
+            ON CONFLICT (task_id) DO UPDATE SET
+                size = publish_usage.size + excluded.size,
+                publish_count = publish_usage.publish_count + 1;
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS publish_usage_refresh ON publish",
+    """
+    CREATE TRIGGER publish_usage_refresh
+    AFTER INSERT OR DELETE OR UPDATE OF size, active, task_id ON publish
+    FOR EACH ROW EXECUTE FUNCTION publish_usage_refresh()
+    """,
+)
+
+# Trigram full-text indexes of asset and publish codes, tables `<table>_search`.
+# External content tables: codes are read from source tables, not duplicated.
+_SQLITE_SEARCH_INDEX = tuple(
+    statement.format(table=table)
+    for table in SEARCH_TABLES
+    for statement in (
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS {table}_search USING fts5(
+            code, content='{table}', content_rowid='id', tokenize='trigram'
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS {table}_search_insert AFTER INSERT ON {table}
+        BEGIN
+            INSERT INTO {table}_search (rowid, code) VALUES (NEW.id, NEW.code);
+        END
+        """,
+        # Upserts set code to its own value, index is only written on change.
+        "DROP TRIGGER IF EXISTS {table}_search_update",
+        """
+        CREATE TRIGGER {table}_search_update
+        AFTER UPDATE OF code ON {table} WHEN OLD.code IS NOT NEW.code
+        BEGIN
+            INSERT INTO {table}_search ({table}_search, rowid, code)
+            VALUES ('delete', OLD.id, OLD.code);
+            INSERT INTO {table}_search (rowid, code) VALUES (NEW.id, NEW.code);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS {table}_search_delete AFTER DELETE ON {table}
+        BEGIN
+            INSERT INTO {table}_search ({table}_search, rowid, code)
+            VALUES ('delete', OLD.id, OLD.code);
+        END
+        """,
+        "INSERT INTO {table}_search ({table}_search) VALUES ('rebuild')",
+    )
+)
+
+# Lowercase code indexes serve prefix searches, on all dialects. Created here as
+# expression indexes can not be reflected by `Index.create(checkfirst=True)`.
+_CODE_PREFIX_INDEX = tuple(
+    f"CREATE INDEX IF NOT EXISTS ix_{table}_code_lower ON {table} (lower(code))"
+    for table in SEARCH_TABLES
+)
+
+# Trigram indexes serve `ILIKE '%text%'` on codes, maintained by PostgreSQL.
+_POSTGRESQL_SEARCH_INDEX = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    *(
+        f"CREATE INDEX IF NOT EXISTS ix_{table}_code_trigram "
+        f"ON {table} USING gin (code gin_trgm_ops)"
+        for table in SEARCH_TABLES
+    ),
+)
+
+
+def _row_changed(table: str) -> str:
+    """Return SQLite trigger condition of an update changing a column of table."""
+    columns = Base.metadata.tables[table].columns.keys()
+    return " OR ".join(f'OLD."{column}" IS NOT NEW."{column}"' for column in columns)
+
+
+# Entity writes, table `change_log`. Updates leaving the row as it was, like
+# upserts of existing rows, are not recorded. Update triggers are recreated as
+# their condition follows table columns.
+_SQLITE_CHANGE_LOG = (
+    *(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {table}_change_{op} AFTER {op.upper()} ON {table}
+        BEGIN
+            INSERT INTO change_log (table_name, entity_id, op)
+            VALUES ('{table}', {row}.id, '{op}');
+        END
+        """
+        for table in CHANGE_LOG_TABLES
+        for op, row in (("insert", "NEW"), ("delete", "OLD"))
+    ),
+    *(
+        statement
+        for table in CHANGE_LOG_TABLES
+        for statement in (
+            f"DROP TRIGGER IF EXISTS {table}_change_update",
+            f"""
+            CREATE TRIGGER {table}_change_update AFTER UPDATE ON {table}
+            WHEN {_row_changed(table)}
+            BEGIN
+                INSERT INTO change_log (table_name, entity_id, op)
+                VALUES ('{table}', NEW.id, 'update');
+            END
+            """,
+        )
+    ),
+)
+
+# Writes record their transaction id, `tk_db.changes` only serves changes of
+# transactions older than every running one, see `changes_since`.
+_POSTGRESQL_CHANGE_LOG = (
+    """
+    CREATE OR REPLACE FUNCTION change_log_write() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'UPDATE' AND OLD IS NOT DISTINCT FROM NEW THEN
+            RETURN NULL;
+        END IF;
+        IF TG_OP = 'DELETE' THEN
+            INSERT INTO change_log (table_name, entity_id, op, xact_id)
+            VALUES (
+                TG_TABLE_NAME, OLD.id, 'delete', pg_current_xact_id()::text::bigint
+            );
+        ELSE
+            INSERT INTO change_log (table_name, entity_id, op, xact_id)
+            VALUES (
+                TG_TABLE_NAME, NEW.id, lower(TG_OP), pg_current_xact_id()::text::bigint
+            );
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    *(
+        statement
+        for table in CHANGE_LOG_TABLES
+        for statement in (
+            f"DROP TRIGGER IF EXISTS {table}_change ON {table}",
+            f"""
+            CREATE TRIGGER {table}_change
+            AFTER INSERT OR UPDATE OR DELETE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION change_log_write()
+            """,
+        )
+    ),
+)
+
+_PUBLISH_USAGE_REBUILD = (
+    "DELETE FROM publish_usage",
+    """
+    INSERT INTO publish_usage (task_id, size, publish_count)
+    SELECT task_id, COALESCE(SUM(size), 0), COUNT(*) FROM publish
+    WHERE active AND task_id IS NOT NULL
+    GROUP BY task_id
+    """,
+)
+
+TRIGGERS: dict[str, tuple[str, ...]] = {
+    "sqlite": (
+        *_SQLITE_PUBLISH_USAGE,
+        *_CODE_PREFIX_INDEX,
+        *_SQLITE_SEARCH_INDEX,
+        *_SQLITE_CHANGE_LOG,
+    ),
+    "postgresql": (
+        *_POSTGRESQL_PUBLISH_USAGE,
+        *_CODE_PREFIX_INDEX,
+        *_POSTGRESQL_SEARCH_INDEX,
+        *_POSTGRESQL_CHANGE_LOG,
+    ),
+}
+
+
+def create_triggers(connection: Connection):
+    """Create triggers of connection dialect and rebuild their summary tables.
+
+    Args:
+        connection (Connection): Connection of migration transaction.
+
+    Raises:
+        NotImplementedError: Database dialect is not supported.
+    """
+    statements = TRIGGERS.get(connection.dialect.name)
+    if statements is None:
+        raise NotImplementedError(
+            f"No triggers for database dialect {connection.dialect.name!r}."
+        )
+
+    for statement in (*statements, *_PUBLISH_USAGE_REBUILD):
+        connection.exec_driver_sql(statement)
@@ -0,0 +1,69 @@
+"""Database type entities cache module."""
+
+from __future__ import annotations
+
+import time
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+
+if TYPE_CHECKING:
+    from tk_db.dbentity import BaseDbEntity
+    from tk_db.models import Base
+
+
+class TypeCache:
+    """Code and id keyed cache of asset, task and publish type entities.
+
+    Type tables almost never change, so lookups are served from memory once
+    loaded. Cache is shared by every `Db` of the process using the same database.
+    """
+
+    def __init__(self):
+        self._entities: dict[tuple[type[Base], str, Any], BaseDbEntity] = {}
+        self.loaded_at = time.monotonic()
+        self.version: int | None = None
+
+    def __len__(self):
+        return len(self._entities)
+
+    def get(self, model: type[Base], key: str, value: Any) -> BaseDbEntity | None:
+        """Get cached entity of given model from his code or id.
+
+        Args:
+            model (type[Base]): Model class of type entity.
+            key (str): Column used to look for entity, "code" or "id".
+            value (Any): Value of the column.
+
+        Returns:
+            BaseDbEntity|None: Cached entity, None if not cached.
+        """
+        return self._entities.get((model, key, value))
+
+    def add(self, model: type[Base], entity: BaseDbEntity):
+        """Store entity of given model in cache.
+
+        Args:
+            model (type[Base]): Model class of type entity.
+            entity (BaseDbEntity): Entity to cache by his code and id.
+        """
+        self._entities[(model, "code", entity.code)] = entity
+        self._entities[(model, "id", entity.id)] = entity
+
+    def clear(self, version: int | None = None):
+        """Remove all cached entities.
+
+        Args:
+            version (int|None): Database type version the cache is now matching.
+        """
+        self._entities.clear()
+        self.loaded_at = time.monotonic()
+        self.version = version
+
+    def is_expired(self, ttl: float | None) -> bool:
+        """Return if cache is older than given time to live in seconds."""
+        if ttl is None:
+            return False
+
+        return time.monotonic() - self.loaded_at > ttl
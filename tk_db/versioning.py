@@ -0,0 +1,81 @@
+"""Publish version allocation module."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import case
+from sqlalchemy import func
+from sqlalchemy import select
+
+from tk_db.dialect import upsert
+from tk_db.models import Publish
+from tk_db.models import PublishVersion
+
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+
+def allocate_versions(
+    session: Session,
+    task_id: int,
+    code: str,
+    publish_type_id: int,
+    release: str,
+    count: int = 1,
+) -> int:
+    """Reserve consecutive versions of a publish series.
+
+    Versions are allocated by a single upsert of the series counter row, which
+    locks it until session transaction ends, so concurrent publishers never get
+    the same version. Counter never goes below the series published versions,
+    so publishes inserted without allocation are taken into account.
+
+    Args:
+        session (Session): Session of the transaction inserting the publishes.
+        task_id (int): Publish task id.
+        code (str): Publish code.
+        publish_type_id (int): Publish type id.
+        release (str): Is release or work.
+        count (int): Number of versions to reserve.
+
+    Returns:
+        int: First reserved version.
+    """
+    published_version = (
+        select(func.coalesce(func.max(Publish.version), 0))
+        .where(
+            Publish.task_id == task_id,
+            Publish.code == code,
+            Publish.publish_type_id == publish_type_id,
+            Publish.release == release,
+        )
+        .scalar_subquery()
+    )
+    insert_query = (
+        upsert(session, PublishVersion)
+        .values(
+            task_id=task_id,
+            code=code,
+            publish_type_id=publish_type_id,
+            release=release,
+            last_version=published_version + count,
+        )
+        .on_conflict_do_update(
+            index_elements=["task_id", "code", "publish_type_id", "release"],
+            set_={
+                "last_version": case(
+                    (
+                        PublishVersion.last_version > published_version,
+                        PublishVersion.last_version,
+                    ),
+                    else_=published_version,
+                ) + count,
+            },
+        )
+        .returning(PublishVersion.last_version)
+    )
+    last_version = session.scalar(insert_query)
+
+    return last_version - count + 1
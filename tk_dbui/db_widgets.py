@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 
+from functools import partial
 from typing import TYPE_CHECKING
 
 from Qt import QtCore as qtc
@@ -17,6 +18,7 @@ from tk_db.models import PublishType
 from tk_dbui.models import EntityListModel
 from tk_dbui.models import EntityRole
 from tk_dbui.models import EntityTableModel
+from tk_dbui.models import SearchResultModel
 
 
 if TYPE_CHECKING:
@@ -111,6 +113,10 @@ class ProjectEditableWidget(qtw.QWidget):
         if current_index.isValid():
             self._lst_projects.setCurrentIndex(current_index)
 
+    def apply_changes(self, projects: list[DbProject], removed_ids: list[int]):
+        """Apply project changes polled from database."""
+        self._project_model.apply_changes(projects, removed_ids)
+
     def _on_btn_locked_clicked(self):
         current_index = self._lst_projects.currentIndex()
         if not current_index.isValid():
@@ -159,14 +165,15 @@ class ProjectEditableWidget(qtw.QWidget):
         if not metadata_text:
             return
 
-        metadata = eval(metadata_text)
+        metadata = json.loads(metadata_text)
 
         project = self._lst_projects.model().data(
             self._lst_projects.currentIndex(), role=EntityRole
         )
-        project.metadata = metadata
-        project.code = code
-        project.name = name
+        with self._app.db.transaction():
+            project.metadata = metadata
+            project.code = code
+            project.name = name
         self.ProjectEdited.emit()
         self._btn_locked.setChecked(True)
         self._on_btn_locked_clicked()
@@ -223,6 +230,10 @@ class AssetTypeTable(qtw.QWidget):
         """Set asset types in model."""
         self._asset_type_model.set_entities(asset_types)
 
+    def apply_changes(self, asset_types: list[DbAssetType], removed_ids: list[int]):
+        """Apply type changes polled from database."""
+        self._asset_type_model.apply_changes(asset_types, removed_ids)
+
     def _on_btn_add_clicked(self):
         dlg = AddAssetTaskTypeDialog(self)
         dlg.setWindowTitle("Add asset type")
@@ -308,6 +319,10 @@ class PublishTypeTable(qtw.QWidget):
         """Set publish types in model."""
         self._publish_type_model.set_entities(publish_types)
 
+    def apply_changes(self, publish_types: list[DbPublishType], removed_ids: list[int]):
+        """Apply publish type changes polled from database."""
+        self._publish_type_model.apply_changes(publish_types, removed_ids)
+
     def _on_add_button_clicked(self):
         dlg = AddPublishTypeDialog(self)
         dlg.setWindowTitle("Add publish type")
@@ -338,6 +353,51 @@ class PublishTypeTable(qtw.QWidget):
         self._publish_type_model.add_entity(entity)
 
 
+class SearchWidget(qtw.QWidget):
+    """Asset and publish code search widget.
+
+    Search runs in a loader thread once typing paused for `DEBOUNCE_MSEC`, a new
+    search supersedes the pending one.
+    """
+
+    DEBOUNCE_MSEC = 200
+
+    def __init__(self, app: App, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._app = app
+
+        self._led_search = qtw.QLineEdit(self)
+        self._led_search.setPlaceholderText("Search assets and publishes")
+        self._led_search.setClearButtonEnabled(True)
+
+        self._lsv_result = qtw.QListView(self)
+        self._result_model = SearchResultModel()
+        self._lsv_result.setModel(self._result_model)
+
+        self._search_timer = qtc.QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.DEBOUNCE_MSEC)
+
+        lay_main = qtw.QVBoxLayout(self)
+        lay_main.setContentsMargins(0, 0, 0, 0)
+        lay_main.addWidget(self._led_search)
+        lay_main.addWidget(self._lsv_result)
+
+        self._led_search.textChanged.connect(self._search_timer.start)
+        self._search_timer.timeout.connect(self._on_search_timeout)
+
+    def _on_search_timeout(self):
+        text = self._led_search.text().strip()
+        if not text:
+            self._app.loader.cancel("search")
+            self._result_model.set_results([])
+            return
+
+        self._app.loader.load(
+            "search", partial(self._app.db.search, text), self._result_model.set_results
+        )
+
+
 class AddProjectDialog(qtw.QDialog):
     """Dialog to add project."""
 
@@ -0,0 +1,146 @@
+"""Background database loading module."""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import traceback
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+from Qt import QtCore as qtc
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+logger = logging.getLogger(__name__)
+
+
+class _LoadSignals(qtc.QObject):
+    """Signals of load runnables, emitted from worker threads."""
+
+    Loaded = qtc.Signal(int, object)
+    Failed = qtc.Signal(int, str)
+    Finished = qtc.Signal(int)
+
+
+class _LoadRunnable(qtc.QRunnable):
+    """Call fetch function in a worker thread and emit its result."""
+
+    def __init__(
+        self,
+        request_id: int,
+        fetch: Callable[[], Any],
+        signals: _LoadSignals,
+        is_current: Callable[[int], bool],
+    ):
+        super().__init__()
+        self._request_id = request_id
+        self._fetch = fetch
+        self._signals = signals
+        self._is_current = is_current
+
+    def run(self):
+        """Fetch result, unless request was superseded while queued."""
+        try:
+            if self._is_current(self._request_id):
+                self._signals.Loaded.emit(self._request_id, self._fetch())
+        except Exception:
+            logger.exception("Database loading failed.")
+            self._signals.Failed.emit(self._request_id, traceback.format_exc())
+        finally:
+            self._signals.Finished.emit(self._request_id)
+
+
+class EntityLoader(qtc.QObject):
+    """Load database entities in worker threads, deliver them in GUI thread.
+
+    Requests are identified by a key, a new request of a key supersedes the
+    pending one: it is removed from the pool queue if not started yet, and
+    its result is dropped otherwise.
+
+    Args:
+        max_threads (int): Maximum number of loading threads.
+    """
+
+    LoadFailed = qtc.Signal(str, str)
+
+    def __init__(self, max_threads: int = 4, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pool = qtc.QThreadPool(self)
+        self._pool.setMaxThreadCount(max_threads)
+
+        self._signals = _LoadSignals(self)
+        self._signals.Loaded.connect(self._on_loaded)
+        self._signals.Failed.connect(self._on_failed)
+        self._signals.Finished.connect(self._on_finished)
+
+        self._request_ids = itertools.count(1)
+        self._current_ids: dict[str, int] = {}  # Current request id by key.
+        self._requests: dict[int, tuple[str, Callable]] = {}
+        # Runnables are referenced until finished, Qt does not own them.
+        self._runnables: dict[int, _LoadRunnable] = {}
+
+    def load(self, key: str, fetch: Callable[[], Any], callback: Callable[[Any], None]):
+        """Call fetch in a worker thread then callback with its result in GUI thread.
+
+        Args:
+            key (str): Request key, pending request of same key is cancelled.
+            fetch (Callable[[], Any]): Database read, must not touch widgets.
+            callback (Callable[[Any], None]): Called in GUI thread with result.
+        """
+        self.cancel(key)
+
+        request_id = next(self._request_ids)
+        runnable = _LoadRunnable(request_id, fetch, self._signals, self._is_current)
+        runnable.setAutoDelete(False)
+        self._current_ids[key] = request_id
+        self._requests[request_id] = (key, callback)
+        self._runnables[request_id] = runnable
+        self._pool.start(runnable)
+
+    def cancel(self, key: str):
+        """Cancel pending request of given key, if any."""
+        request_id = self._current_ids.pop(key, None)
+        if request_id is None:
+            return
+
+        del self._requests[request_id]
+        if self._pool.tryTake(self._runnables[request_id]):
+            del self._runnables[request_id]
+
+    def is_loading(self, key: str) -> bool:
+        """Return if a request of given key is pending."""
+        return key in self._current_ids
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Wait for worker threads to finish, return False on timeout."""
+        return self._pool.waitForDone(msecs)
+
+    def _is_current(self, request_id: int) -> bool:
+        # Read from worker threads, dict lookups are atomic.
+        return request_id in self._requests
+
+    def _pop_request(self, request_id: int) -> tuple[str, Callable] | None:
+        request = self._requests.pop(request_id, None)
+        if request is None:  # Superseded or cancelled.
+            return None
+
+        del self._current_ids[request[0]]
+        return request
+
+    def _on_loaded(self, request_id: int, result: Any):
+        request = self._pop_request(request_id)
+        if request is not None:
+            request[1](result)
+
+    def _on_failed(self, request_id: int, error: str):
+        request = self._pop_request(request_id)
+        if request is not None:
+            self.LoadFailed.emit(request[0], error)
+
+    def _on_finished(self, request_id: int):
+        self._runnables.pop(request_id, None)
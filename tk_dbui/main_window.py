@@ -9,19 +9,32 @@ from Qt import QtWidgets as qtw
 from tk_db.db import Db
 from tk_db.models import AssetType
 from tk_db.models import Project
+from tk_db.models import Publish
 from tk_dbui.db_widgets import AssetTypeTable
 from tk_dbui.db_widgets import ProjectEditableWidget
 from tk_dbui.db_widgets import PublishTypeTable
+from tk_dbui.db_widgets import SearchWidget
 from tk_dbui.db_widgets import TaskTypeTable
+from tk_dbui.loader import EntityLoader
 from tk_dbui.models import EntityListModel
+from tk_dbui.models import EntityRole
+from tk_dbui.models import PagedEntityTableModel
+from tk_dbui.watcher import ChangeWatcher
 from tk_ui.widgets import RadioButtonsWidget
 
 
+PUBLISH_COLUMN_NAMES = ["id", "code", "version", "release", "size", "path", "active"]
+
+
 class App:
     """Application object."""
 
     def __init__(self):
         self.db = Db()
+        self.loader = EntityLoader()
+        # Started first, so changes made while initial loads run are polled.
+        self.watcher = ChangeWatcher(self.db, self.loader)
+        self.watcher.start()
 
 
 class DbTableWidget(qtw.QWidget):
@@ -38,19 +51,15 @@ class DbTableWidget(qtw.QWidget):
         self._btn_widget.add_buttons("publish_types", 3, "Publish Types")
 
         self._project_widget = ProjectEditableWidget(self.app, self)
-        self._project_widget.set_projects(self.app.db.projects())
         self._project_widget.hide()
 
         self._tbl_asset_type = AssetTypeTable(self.app, self)
-        self._tbl_asset_type.set_asset_types(self.app.db.asset_types())
         self._tbl_asset_type.hide()
 
         self._tbl_task_type = TaskTypeTable(self.app, self)
-        self._tbl_task_type.set_task_type(self.app.db.task_types())
         self._tbl_task_type.hide()
 
         self._tbl_publish_type = PublishTypeTable(self.app, self)
-        self._tbl_publish_type.set_publish_types(self.app.db.publish_types())
         self._tbl_publish_type.hide()
 
         self._central_widget_by_name: dict[str, qtw.QWidget] = {
@@ -71,9 +80,41 @@ class DbTableWidget(qtw.QWidget):
         lay_main.addWidget(self._tbl_publish_type)
         lay_main.addItem(self._stretch)
 
+        # Widgets applying polled changes of a table.
+        self._widget_by_table = {
+            "project": self._project_widget,
+            "asset_type": self._tbl_asset_type,
+            "task_type": self._tbl_task_type,
+            "publish_type": self._tbl_publish_type,
+        }
+
         # Connections
         self._btn_widget.ButtonPressed.connect(self._on_db_button_clicked)
-        self._project_widget.ProjectEdited.connect(self._on_project_edited)
+        self._project_widget.ProjectEdited.connect(self.app.watcher.poll)
+        self.app.watcher.EntitiesChanged.connect(self._on_entities_changed)
+        self.app.watcher.ChangesLost.connect(self._load_entities)
+
+        # Initialisation
+        self._load_entities()
+
+    def _load_entities(self):
+        loader = self.app.loader
+        loader.load(
+            "db_projects", self.app.db.projects, self._project_widget.set_projects
+        )
+        loader.load(
+            "db_asset_types",
+            self.app.db.asset_types,
+            self._tbl_asset_type.set_asset_types,
+        )
+        loader.load(
+            "db_task_types", self.app.db.task_types, self._tbl_task_type.set_task_type
+        )
+        loader.load(
+            "db_publish_types",
+            self.app.db.publish_types,
+            self._tbl_publish_type.set_publish_types,
+        )
 
     def _on_db_button_clicked(self, widget_name):
         self._stretch.changeSize(0, 0, qtw.QSizePolicy.Minimum, qtw.QSizePolicy.Minimum)
@@ -83,8 +124,10 @@ class DbTableWidget(qtw.QWidget):
                 continue
             db_widget.hide()
 
-    def _on_project_edited(self):
-        self._project_widget.set_projects(self.app.db.projects())
+    def _on_entities_changed(self, table: str, entities: list, removed_ids: list):
+        widget = self._widget_by_table.get(table)
+        if widget is not None:
+            widget.apply_changes(entities, removed_ids)
 
 
 class DbEntityTabWidget(qtw.QWidget):
@@ -96,15 +139,32 @@ class DbEntityTabWidget(qtw.QWidget):
 
         self._cbx_project = qtw.QComboBox(self)
         self._project_model = EntityListModel(Project)
-        self._project_model.set_entities(list(self.app.db.projects()))
         self._cbx_project.setModel(self._project_model)
 
         self._btn_asset = qtw.QPushButton("Asset")
 
+        self._search_widget = SearchWidget(self.app, self)
+
         self._lsv_asset_type = qtw.QListView(self)
         self._asset_type_model = EntityListModel(AssetType)
         self._lsv_asset_type.setModel(self._asset_type_model)
 
+        self._tbl_publish = qtw.QTableView(self)
+        self._publish_model = PagedEntityTableModel(
+            Publish,
+            loader=self.app.loader,
+            key="entity_publishes",
+            column_names=PUBLISH_COLUMN_NAMES,
+        )
+        self._tbl_publish.setModel(self._publish_model)
+
+        # Models applying polled changes of a table.
+        self._model_by_table = {
+            "project": self._project_model,
+            "asset_type": self._asset_type_model,
+            "publish": self._publish_model,
+        }
+
         # Layouts
         lay_master = qtw.QHBoxLayout(self)
         lay_base_content = qtw.QVBoxLayout()
@@ -115,17 +175,43 @@ class DbEntityTabWidget(qtw.QWidget):
         lay_base_content.addWidget(self._cbx_project)
         lay_base_content.addLayout(lay_btn)
         lay_base_content.addWidget(self._lsv_asset_type)
+        lay_base_content.addWidget(self._search_widget)
 
         lay_master.addLayout(lay_base_content)
+        lay_master.addWidget(self._tbl_publish)
 
         # Connections
         self._btn_asset.clicked.connect(self._on_btn_asset_clicked)
+        self._cbx_project.currentIndexChanged.connect(self._on_project_changed)
+        self.app.watcher.EntitiesChanged.connect(self._on_entities_changed)
+        self.app.watcher.ChangesLost.connect(self._load_entities)
 
         # Initialisation
-        self._asset_type_model.set_entities(list(self.app.db.asset_types()))
+        self._load_entities()
 
     def _on_btn_asset_clicked(self):
-        self._asset_type_model.set_entities(list(self.app.db.asset_types()))
+        self.app.watcher.poll()
+
+    def _on_entities_changed(self, table: str, entities: list, removed_ids: list):
+        model = self._model_by_table.get(table)
+        if model is not None:
+            model.apply_changes(entities, removed_ids)
+
+    def _on_project_changed(self, index: int):
+        project = self._cbx_project.itemData(index, EntityRole)
+        self._publish_model.set_fetch_page(
+            project.publishes_page if project is not None else None
+        )
+
+    def _load_entities(self):
+        self.app.loader.load(
+            "entity_projects", self.app.db.projects, self._project_model.set_entities
+        )
+        self.app.loader.load(
+            "entity_asset_types",
+            self.app.db.asset_types,
+            self._asset_type_model.set_entities,
+        )
 
 
 class MainWindow(qtw.QMainWindow):
@@ -152,6 +238,12 @@ class MainWindow(qtw.QMainWindow):
         self.setCentralWidget(wgt_main)
         wgt_main.setLayout(lay_main)
 
+        # Connections
+        self.app.loader.LoadFailed.connect(self._on_load_failed)
+
+    def _on_load_failed(self, key: str, error: str):
+        self.statusBar().showMessage(f"Unable to load {key}: {error.splitlines()[-1]}")
+
 
 if __name__ == "__main__":
     qt_app = qtw.QApplication(sys.argv)
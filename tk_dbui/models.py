@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING
 from typing import Any
 
@@ -10,9 +11,13 @@ from typing_extensions import override
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from tk_db.dbentity import DbEntity
     from tk_db.dbproject import DbProject
     from tk_db.models import Base
+    from tk_db.search import SearchResult
+    from tk_dbui.loader import EntityLoader
 
 
 PROJECT_HEADER_TITLES = ["Id", "Code", "Name", "Active"]
@@ -25,14 +30,136 @@ NameRole = qtc.Qt.UserRole + 3
 ActiveRole = qtc.Qt.UserRole + 4
 
 
-class EntityTableModel(qtc.QAbstractTableModel):
+def _is_active(entity: DbEntity) -> bool:
+    # Types and projects expose `is_active()`, assets, tasks and publishes a property.
+    is_active = entity.is_active
+    return is_active() if callable(is_active) else is_active
+
+
+class EntityIndexMixin:
+    """Keep model entities indexed by code and id as rows change.
+
+    Models using it store entities in `_entities` and create empty
+    `_row_by_code` and `_row_by_id` dicts.
+    """
+
+    _entities: list[DbEntity]
+    _row_by_code: dict[str, int]  # Row of first entity of code.
+    _row_by_id: dict[int, int]
+
+    def set_entities(self, entities: list[DbEntity]):
+        """Set entities to model."""
+        self.beginResetModel()
+        self._unindex_rows(0)
+        self._entities = entities
+        self._index_rows(0)
+        self.endResetModel()
+
+    def add_entity(self, entity: DbEntity):
+        """Add entity in model."""
+        row = len(self._entities)
+        self.beginInsertRows(qtc.QModelIndex(), row, row)
+
+        self._entities.append(entity)
+        self._index_rows(row)
+
+        self.endInsertRows()
+
+    def remove_entity(self, entity_id: int) -> bool:
+        """Remove entity of given id from model, return if it was found."""
+        row = self._row_by_id.get(entity_id)
+        if row is None:
+            return False
+
+        self.beginRemoveRows(qtc.QModelIndex(), row, row)
+
+        self._unindex_rows(row)
+        self._entities.pop(row)
+        self._index_rows(row)
+
+        self.endRemoveRows()
+        return True
+
+    def update_entity(self, entity: DbEntity) -> bool:
+        """Replace entity of same id, only its row is refreshed in views.
+
+        Returns:
+            bool: If entity was found in model.
+        """
+        row = self._row_by_id.get(entity.id)
+        if row is None:
+            return False
+
+        if self._entities[row].code == entity.code:
+            self._entities[row] = entity
+        else:
+            self._unindex_rows(row)
+            self._entities[row] = entity
+            self._index_rows(row)
+
+        self._emit_row_changed(row)
+        return True
+
+    def apply_changes(self, entities: list[DbEntity], removed_ids: list[int]):
+        """Apply entity changes polled from database, see `ChangeWatcher`.
+
+        Args:
+            entities (list[DbEntity]): Inserted or updated entities, replaced
+                in place when in model, added otherwise.
+            removed_ids (list[int]): Ids of deleted entities.
+        """
+        for entity in entities:
+            if not self.update_entity(entity):
+                self.add_entity(entity)
+        for entity_id in removed_ids:
+            self.remove_entity(entity_id)
+
+    def get_entity(self, code: str) -> DbEntity | None:
+        """Get entity by code."""
+        row = self._row_by_code.get(code)
+        return None if row is None else self._entities[row]
+
+    def entity_row(self, entity_id: int) -> int | None:
+        """Return row of entity of given id, None if not in model."""
+        return self._row_by_id.get(entity_id)
+
+    def _emit_row_changed(self, row: int):
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index)
+
+    def _index_rows(self, start: int):
+        for row in range(start, len(self._entities)):
+            entity = self._entities[row]
+            self._row_by_id[entity.id] = row
+            self._row_by_code.setdefault(entity.code, row)
+
+    def _unindex_rows(self, start: int):
+        # Drop index entries of rows from start only, `_index_rows(start)`
+        # adds them back once rows changed. Codes first seen before start
+        # keep their row.
+        for row in range(start, len(self._entities)):
+            entity = self._entities[row]
+            self._row_by_id.pop(entity.id, None)
+            if self._row_by_code.get(entity.code, -1) >= start:
+                del self._row_by_code[entity.code]
+
+
+class EntityTableModel(EntityIndexMixin, qtc.QAbstractTableModel):
     """Asset type and task type table model."""
 
-    def __init__(self, entity_type: type[Base], *args, **kwargs):
+    def __init__(
+        self,
+        entity_type: type[Base],
+        *args,
+        column_names: list[str] | None = None,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
         self._entity_type = entity_type
         self._entities = []
-        self._column_names = self._entity_type.__table__.columns.keys()
+        self._column_names = column_names or self._entity_type.__table__.columns.keys()
+        self._row_by_code: dict[str, int] = {}  # Row of first entity of code.
+        self._row_by_id: dict[int, int] = {}
 
     @override
     def rowCount(self, parent=...):
@@ -53,7 +180,7 @@ class EntityTableModel(qtc.QAbstractTableModel):
         elif role == EntityRole:
             return entity
         elif role == qtc.Qt.CheckStateRole and column_name == "active":
-            return qtc.Qt.Checked if entity.is_active() else qtc.Qt.Unchecked
+            return qtc.Qt.Checked if _is_active(entity) else qtc.Qt.Unchecked
         elif role == CodeRole:
             return entity.code
         elif role == NameRole:
@@ -84,40 +211,116 @@ class EntityTableModel(qtc.QAbstractTableModel):
 
     @override
     def headerData(self, section, orientation, role=...):
-        if role == qtc.Qt.DisplayRole:
+        if role == qtc.Qt.DisplayRole and orientation == qtc.Qt.Horizontal:
             return self._column_names[section].capitalize()
 
-        return None
+        return super().headerData(section, orientation, role)
+
+    @override
+    def _emit_row_changed(self, row: int):
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+
+class PagedEntityTableModel(EntityTableModel):
+    """Entity table model fetching entities page by page as view scrolls.
+
+    Pages come from a keyset paginated fetch function, like
+    `DbProject.publishes_page`, so opening a view only loads first page and
+    memory grows with what user actually scrolled through.
+
+    Args:
+        entity_type (type[Base]): Database model of entities.
+        page_size (int): Number of entities fetched per page.
+        loader (EntityLoader|None): Fetch pages in worker threads if given,
+            in GUI thread otherwise.
+        key (str): Loader request key of model pages.
+    """
+
+    def __init__(
+        self,
+        entity_type: type[Base],
+        *args,
+        page_size: int = 500,
+        loader: EntityLoader | None = None,
+        key: str = "",
+        **kwargs,
+    ):
+        super().__init__(entity_type, *args, **kwargs)
+        self._page_size = page_size
+        self._loader = loader
+        self._key = key or f"page_{entity_type.__tablename__}_{id(self)}"
+        self._fetch_page: Callable[[int, int], list[DbEntity]] | None = None
+        self._last_id = 0
+        self._exhausted = True
+
+    def set_fetch_page(self, fetch_page: Callable[[int, int], list[DbEntity]] | None):
+        """Reset model on given page fetch function.
+
+        Args:
+            fetch_page (Callable[[int, int], list[DbEntity]]|None): Called with
+                last fetched entity id, 0 for first page, and page size. Must
+                return entities ordered by id. Empty model if None.
+        """
+        if self._loader is not None:
+            self._loader.cancel(self._key)
 
-    def set_entities(self, entities: list[DbEntity]):
-        """Set asset type to model."""
         self.beginResetModel()
-        self._entities = entities
+        self._unindex_rows(0)
+        self._entities = []
+        self._fetch_page = fetch_page
+        self._last_id = 0
+        self._exhausted = fetch_page is None
         self.endResetModel()
 
-    def add_entity(self, entity: DbEntity):
-        """Add asset type in model."""
-        self.beginInsertRows(
-            qtc.QModelIndex(),
-            len(self._entities),
-            len(self._entities) + 1,
-        )
+    @override
+    def set_entities(self, entities: list[DbEntity]):
+        self.set_fetch_page(None)
+        super().set_entities(entities)
 
-        self._entities.append(entity)
+    @override
+    def canFetchMore(self, parent):
+        return not parent.isValid() and not self._exhausted
 
-        self.endInsertRows()
+    @override
+    def fetchMore(self, parent):
+        if parent.isValid() or self._exhausted:
+            return
 
-    def get_entity(self, code: str) -> DbEntity | None:
-        """Get entity by code."""
-        try:
-            entity = next(entity for entity in self._entities if entity.code == code)
-        except StopIteration:
-            return None
+        fetch = partial(self._fetch_page, self._last_id, self._page_size)
+        if self._loader is None:
+            self._add_page(fetch())
+        elif not self._loader.is_loading(self._key):
+            self._loader.load(self._key, fetch, self._add_page)
 
-        return entity
+    @override
+    def apply_changes(self, entities: list[DbEntity], removed_ids: list[int]):
+        # Entities beyond fetched pages, or of another fetch scope, are left to
+        # pages: fetch again when inserts may extend the last fetched page.
+        fetch_more = False
+        for entity in entities:
+            if not self.update_entity(entity) and entity.id > self._last_id:
+                fetch_more = True
+        for entity_id in removed_ids:
+            self.remove_entity(entity_id)
+
+        if fetch_more and self._exhausted and self._fetch_page is not None:
+            self._exhausted = False
+            self.fetchMore(qtc.QModelIndex())
+
+    def _add_page(self, entities: list[DbEntity]):
+        self._exhausted = len(entities) < self._page_size
+        if not entities:
+            return
+
+        start = len(self._entities)
+        self.beginInsertRows(qtc.QModelIndex(), start, start + len(entities) - 1)
+        self._entities.extend(entities)
+        self._index_rows(start)
+        self._last_id = entities[-1].id
+        self.endInsertRows()
 
 
-class EntityListModel(qtc.QAbstractListModel):
+class EntityListModel(EntityIndexMixin, qtc.QAbstractListModel):
     """Asset type and task type list model."""
 
     def __init__(self, entity_type: type[Base], *args, **kwargs):
@@ -125,6 +328,8 @@ class EntityListModel(qtc.QAbstractListModel):
         self._entities: list[DbEntity] = []
         self._entity_type = entity_type
         self._column_names = self._entity_type.__table__.columns.keys()
+        self._row_by_code: dict[str, int] = {}  # Row of first entity of code.
+        self._row_by_id: dict[int, int] = {}
 
     @override
     def rowCount(self, parent=...):
@@ -145,29 +350,35 @@ class EntityListModel(qtc.QAbstractListModel):
 
         return None
 
-    def set_entities(self, entities: list[DbEntity]):
-        """Set asset type to model."""
-        self.beginResetModel()
-        self._entities = entities
-        self.endResetModel()
 
-    def add_entity(self, entity: DbEntity):
-        """Add asset type in model."""
-        self.beginInsertRows(
-            qtc.QModelIndex(),
-            len(self._entities),
-            len(self._entities) + 1,
-        )
+class SearchResultModel(qtc.QAbstractListModel):
+    """Code search result list model, see `Db.search`."""
 
-        self._entities.append(entity)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._results: list[SearchResult] = []
 
-        self.endInsertRows()
+    @override
+    def rowCount(self, parent=...):
+        return len(self._results)
 
-    def get_entity(self, code: str):
-        """Get entity by code."""
-        try:
-            entity = next(entity for entity in self._entities if entity.code == code)
-        except StopIteration:
-            return None
+    @override
+    def data(self, index, role=...):
+        result = self._results[index.row()]
 
-        return entity
+        if role == qtc.Qt.DisplayRole:
+            return f"{result.code} ({result.kind})"
+        elif role == qtc.Qt.ToolTipRole:
+            return result.path
+        elif role == EntityRole:
+            return result
+        elif role == CodeRole:
+            return result.code
+
+        return None
+
+    def set_results(self, results: list[SearchResult]):
+        """Set search results to model."""
+        self.beginResetModel()
+        self._results = results
+        self.endResetModel()
@@ -0,0 +1,187 @@
+"""Database change polling module."""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+
+from Qt import QtCore as qtc
+from sqlalchemy import select
+
+from tk_db.dbassettype import DbAssetType
+from tk_db.dbproject import DbProject
+from tk_db.dbpublishtype import DbPublishType
+from tk_db.dbtasktype import DbTaskType
+from tk_db.errors import DbChangesPrunedError
+from tk_db.models import AssetType
+from tk_db.models import Project
+from tk_db.models import Publish
+from tk_db.models import PublishType
+from tk_db.models import TaskType
+
+
+if TYPE_CHECKING:
+    from tk_db.db import Db
+    from tk_db.dbentity import DbEntity
+    from tk_dbui.loader import EntityLoader
+
+
+# Entities of tables shown in UI, read again by id when changed.
+_ENTITY_TYPES = {
+    "project": (Project, DbProject),
+    "asset_type": (AssetType, DbAssetType),
+    "task_type": (TaskType, DbTaskType),
+    "publish_type": (PublishType, DbPublishType),
+}
+WATCHED_TABLES = (*_ENTITY_TYPES, "publish")
+
+
+class ChangeBatch(NamedTuple):
+    """Entity changes read since a revision, by table."""
+
+    revision: int  # Revision of last change read.
+    entities: dict[str, list[DbEntity]]  # Inserted or updated entities.
+    removed_ids: dict[str, list[int]]  # Ids of deleted entities.
+    complete: bool  # If every change recorded so far was read.
+
+
+def load_changes(db: Db, revision: int, limit: int) -> ChangeBatch:
+    """Read changes of watched tables since revision and their current entities.
+
+    Several changes of an entity are merged, entity is read once.
+
+    Args:
+        db (Db): Database to read.
+        revision (int): Last revision already read.
+        limit (int): Maximum number of changes read.
+
+    Returns:
+        ChangeBatch
+
+    Raises:
+        DbChangesPrunedError: Changes after revision were pruned.
+    """
+    changes = db.changes_since(revision, limit)
+
+    ops_by_table: dict[str, dict[int, str]] = {}
+    for change in changes:
+        if change.table in WATCHED_TABLES:
+            # Last change of entity wins, dict keeps first change order.
+            ops_by_table.setdefault(change.table, {})[change.id] = change.op
+
+    entities = {}
+    removed_ids = {}
+    for table, ops in ops_by_table.items():
+        ids = [entity_id for entity_id, op in ops.items() if op != "delete"]
+        found = _load_entities(db, table, ids) if ids else []
+        found_ids = {entity.id for entity in found}
+        entities[table] = found
+        # Entities deleted after their last change was read are removed too.
+        removed_ids[table] = [
+            entity_id for entity_id in ops if entity_id not in found_ids
+        ]
+
+    return ChangeBatch(
+        changes[-1].revision if changes else revision,
+        entities,
+        removed_ids,
+        len(changes) < limit,
+    )
+
+
+def _load_entities(db: Db, table: str, ids: list[int]) -> list[DbEntity]:
+    if table == "publish":
+        return db.publish_query().where(Publish.id.in_(ids)).all()
+
+    model, db_type = _ENTITY_TYPES[table]
+    with db.session() as session:
+        return [
+            db_type(db, entity)
+            for entity in session.scalars(select(model).where(model.id.in_(ids)))
+        ]
+
+
+class ChangeWatcher(qtc.QObject):
+    """Poll database change log, emit changed entities of watched tables.
+
+    Polls run in loader threads and only read changes since last poll, see
+    `Db.changes_since`, models apply them with `apply_changes`.
+
+    Args:
+        db (Db): Database to watch.
+        loader (EntityLoader): Loader running polls.
+        interval (int): Milliseconds between polls.
+        batch_size (int): Maximum number of changes read by poll.
+    """
+
+    # Table, inserted or updated entities, ids of deleted entities.
+    EntitiesChanged = qtc.Signal(str, list, list)
+    # Changes were pruned before being read, entities must be reloaded.
+    ChangesLost = qtc.Signal()
+
+    def __init__(
+        self,
+        db: Db,
+        loader: EntityLoader,
+        interval: int = 2000,
+        batch_size: int = 1000,
+        *args,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self._db = db
+        self._loader = loader
+        self._key = f"changes_{id(self)}"
+        self._batch_size = batch_size
+        self._revision: int | None = None
+
+        self._timer = qtc.QTimer(self)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self.poll)
+
+    def start(self):
+        """Start polling changes made from now on."""
+        self._loader.load(self._key, self._db.revision, self._on_revision)
+        self._timer.start()
+
+    def stop(self):
+        """Stop polling, pending poll is cancelled."""
+        self._timer.stop()
+        self._loader.cancel(self._key)
+
+    def poll(self):
+        """Read changes since last poll now, unless a poll is pending."""
+        if self._revision is None or self._loader.is_loading(self._key):
+            return
+
+        fetch = partial(self._load_changes, self._revision)
+        self._loader.load(self._key, fetch, self._on_changes)
+
+    def _load_changes(self, revision: int) -> ChangeBatch | None:
+        # Runs in a loader thread, None when changes were pruned.
+        try:
+            return load_changes(self._db, revision, self._batch_size)
+        except DbChangesPrunedError:
+            return None
+
+    def _on_revision(self, revision: int):
+        self._revision = revision
+
+    def _on_changes_lost(self, revision: int):
+        # Entities are reloaded once revision is known, no change can be missed.
+        self._revision = revision
+        self.ChangesLost.emit()
+
+    def _on_changes(self, batch: ChangeBatch | None):
+        if batch is None:
+            self._revision = None
+            self._loader.load(self._key, self._db.revision, self._on_changes_lost)
+            return
+
+        self._revision = batch.revision
+        for table, entities in batch.entities.items():
+            self.EntitiesChanged.emit(table, entities, batch.removed_ids[table])
+
+        if not batch.complete:
+            self.poll()